@@ -0,0 +1,457 @@
+"""In-process fake People Control api server for offline benchmarks and tests.
+
+It emulates the paginated list endpoints (page/page_size, ordering=id, id__gt,
+id__lt, modified__gt and exact field filters), retrieve, create, update, delete
+and the employee movement endpoints, with configurable latency, page size limit
+and error injection.
+"""
+
+import gzip
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+API_VERSION = "v1"
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+LIST_CONTROL_PARAMETERS = ("page", "page_size", "ordering", "expand", "search")
+
+
+class FakeServerState:
+    """Data and behaviour configuration of the fake server
+
+    Args:
+        latency (float, Optional): Seconds added to every response
+        latency_per_record (float, Optional): Seconds added per returned record
+        max_page_size (int, Optional): Maximum page size accepted
+        error_rate (float, Optional): Probability of answering 503
+        seed (int, Optional): Random seed of generated data and errors
+        compression (bool, Optional): Compress responses with gzip or deflate,
+            the first one in the Accept-Encoding of the client
+        bandwidth (float, Optional): Bytes per second sent, None for unlimited
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_per_record: float = 0.0,
+        max_page_size: int = 5000,
+        error_rate: float = 0.0,
+        seed: int = 42,
+        compression: bool = False,
+        bandwidth: float = None,
+    ) -> None:
+        self.latency = latency
+        self.latency_per_record = latency_per_record
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.compression = compression
+        self.bandwidth = bandwidth
+        self.random = random.Random(seed)
+        self.tables: dict = {}
+        self.sequences: dict = {}
+        self.requests: list = []
+        self.headers: list = []  # Headers of requests, in the order of requests
+        self.base_url = ""
+        self.lock = threading.RLock()
+        self.clock = datetime(2024, 1, 1)
+
+    def now(self) -> str:
+        """Get a strictly increasing modification datetime"""
+        self.clock += timedelta(seconds=1)
+        return self.clock.strftime(DATETIME_FORMAT)
+
+    def url(self, table: str, _id: int) -> str:
+        return f"{self.base_url}/{API_VERSION}/{table}/{_id}/"
+
+    def insert(self, table: str, record: dict) -> dict:
+        with self.lock:
+            rows = self.tables.setdefault(table, {})
+            self.sequences[table] = self.sequences.get(table, 0) + 1
+            record = {
+                "id": self.sequences[table],
+                "created": self.clock.strftime(DATETIME_FORMAT),
+                **record,
+            }
+            record["modified"] = self.now()
+            rows[record["id"]] = record
+            return record
+
+    def update(self, table: str, _id: int, fields: dict) -> dict:
+        with self.lock:
+            record = self.tables[table][_id]
+            record.update(fields)
+            record["modified"] = self.now()
+            return record
+
+    def populate(
+        self,
+        employees: int = 1000,
+        areas: int = 100,
+        positions: int = 50,
+        corporations: int = 5,
+    ):
+        """Generate an organization with areas tree, positions, corporations,
+        employees and their current area, manager and position records.
+        """
+        for index in range(1, corporations + 1):
+            corporation = self.insert(
+                "corporations", {"code": f"CORP{index}", "name": f"Corporation {index}"}
+            )
+            self.insert(
+                "branch_corporations",
+                {
+                    "code": f"BRANCH{index}",
+                    "name": f"Branch {index}",
+                    "corporation": self.url("corporations", corporation["id"]),
+                },
+            )
+
+        for index in range(1, areas + 1):
+            parent = self.random.randint(1, index - 1) if index > 1 else None
+            self.insert(
+                "areas",
+                {
+                    "code": f"AREA{index}",
+                    "name": f"Área {index}",
+                    "active": True,
+                    "parent_area": self.url("areas", parent) if parent else None,
+                },
+            )
+            if parent:
+                self.insert(
+                    "parent_areas",
+                    {
+                        "area": self.url("areas", index),
+                        "parent_area": self.url("areas", parent),
+                        "start_date": "2020-01-01",
+                        "end_date": None,
+                    },
+                )
+
+        for index in range(1, positions + 1):
+            self.insert(
+                "positions",
+                {"code": f"POS{index}", "name": f"Position {index}", "active": True},
+            )
+
+        for index in range(1, employees + 1):
+            self.insert(
+                "users",
+                {
+                    "username": f"user{index}",
+                    "email": f"user{index}@example.com",
+                    "first_name": f"Name{index}",
+                    "last_name": f"Surname{index}",
+                },
+            )
+            self.insert(
+                "employees",
+                {
+                    "first_name": f"Name{index}",
+                    "last_name": f"Surname{index}",
+                    "email": f"user{index}@example.com",
+                    "username": f"user{index}",
+                    "employee_code": f"EMP{index:06d}",
+                    "active": True,
+                },
+            )
+            employee_url = self.url("employees", index)
+            self.insert(
+                "employee_areas",
+                {
+                    "employee": employee_url,
+                    "area": self.url("areas", self.random.randint(1, areas)),
+                    "start_date": "2020-01-01",
+                    "end_date": None,
+                },
+            )
+            self.insert(
+                "employee_positions",
+                {
+                    "employee": employee_url,
+                    "position": self.url(
+                        "positions", self.random.randint(1, positions)
+                    ),
+                    "start_date": "2020-01-01",
+                    "end_date": None,
+                },
+            )
+            if index > 1:
+                self.insert(
+                    "employee_managers",
+                    {
+                        "employee": employee_url,
+                        "manager": self.url(
+                            "employees", self.random.randint(1, index - 1)
+                        ),
+                        "start_date": "2020-01-01",
+                        "end_date": None,
+                    },
+                )
+
+
+class FakeRequestHandler(BaseHTTPRequestHandler):
+    """Handler answering requests with the server state"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakePeopleControlServer"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def state(self) -> FakeServerState:
+        return self.server.state
+
+    def _route(self):
+        parsed = urlparse(self.path)
+        parts = [part for part in parsed.path.split("/") if part]
+        parts = parts[parts.index(API_VERSION) + 1 :]
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        return parts, query, parsed.path
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw)
+
+        except ValueError:  # Form data, sent by requests data argument
+            return {key: values[-1] for key, values in parse_qs(raw.decode()).items()}
+
+    def _encoding(self) -> str:
+        """Get first encoding of the client Accept-Encoding the server supports"""
+        if not self.state.compression:
+            return None
+
+        for value in (self.headers.get("Accept-Encoding") or "").split(","):
+            encoding = value.split(";")[0].strip()
+            if encoding in ("gzip", "deflate"):
+                return encoding
+        return None
+
+    def _send(self, status: int, body=None):
+        raw = json.dumps(body).encode() if body is not None else b""
+        encoding = self._encoding() if len(raw) > 512 else None
+        if encoding == "gzip":
+            raw = gzip.compress(raw, compresslevel=6)
+        elif encoding == "deflate":
+            raw = zlib.compress(raw, 6)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        if self.state.bandwidth:
+            time.sleep(len(raw) / self.state.bandwidth)
+        self.wfile.write(raw)
+
+    def _handle(self, method: str):
+        parts, query, path = self._route()
+        body = self._body() if method != "GET" else {}
+        with self.state.lock:
+            self.state.requests.append((method, self.path))
+            self.state.headers.append(dict(self.headers))
+
+        if self.state.error_rate and self.state.random.random() < self.state.error_rate:
+            self._send(503, {"detail": "Injected error"})
+            return
+
+        table = parts[0] if parts else None
+        if table is None:
+            self._send(404, {"detail": "Not found."})
+            return
+
+        try:
+            status, response = self._dispatch(
+                method, table, parts[1:], query, path, body
+            )
+
+        except KeyError:
+            status, response = 404, {"detail": "Not found."}
+
+        records = len(response.get("results", [])) if isinstance(response, dict) else 0
+        delay = self.state.latency + self.state.latency_per_record * max(records, 1)
+        if delay:
+            time.sleep(delay)
+        self._send(status, response)
+
+    def _dispatch(self, method, table, rest, query, path, body):
+        rows = self.state.tables.setdefault(table, {})
+
+        if not rest:
+            if method == "GET":
+                return 200, self._list(rows, query, path)
+            if method == "POST":
+                return 201, self.state.insert(table, body)
+
+        _id = int(rest[0]) if rest[0].isdigit() else None
+        action = rest[1] if len(rest) > 1 else None
+
+        if rest[0] == "create_complete" and method == "POST":
+            return 201, self.state.insert(table, body)
+
+        if _id is None:
+            raise KeyError(rest[0])
+
+        if action is None:
+            if method == "GET":
+                return 200, rows[_id]
+            if method in ("PATCH", "PUT"):
+                return 200, self.state.update(table, _id, body)
+            if method == "DELETE":
+                del rows[_id]
+                return 204, None
+
+        if action.startswith("current_") and table == "employees":
+            return self._current(_id, action[len("current_") :], method, body)
+
+        if action in ("edit_area_and_record", "edit_parent", "activate", "deactivate"):
+            fields = dict(body)
+            if action == "edit_parent":
+                fields = {
+                    "parent_area": self.state.url("areas", fields.get("parent_id"))
+                }
+            if action in ("activate", "deactivate"):
+                fields = {"active": action == "activate"}
+            return 200, self.state.update(table, _id, fields)
+
+        raise KeyError(action)
+
+    def _current(self, employee_id: int, kind: str, method: str, body: dict):
+        table = {"area": "employee_areas", "manager": "employee_managers"}.get(
+            kind, "employee_positions"
+        )
+        employee_url = self.state.url("employees", employee_id)
+        with self.state.lock:
+            current = [
+                record
+                for record in self.state.tables.get(table, {}).values()
+                if record["employee"] == employee_url and record.get("end_date") is None
+            ]
+            if method == "GET":
+                return 200, current[-1] if current else {}
+
+            for record in current:
+                self.state.update(table, record["id"], {"end_date": body["start_date"]})
+            record = self.state.insert(
+                table,
+                {
+                    "employee": employee_url,
+                    kind: body[kind],
+                    "start_date": body["start_date"],
+                    "end_date": None,
+                },
+            )
+        return 201, record
+
+    def _list(self, rows: dict, query: dict, path: str) -> dict:
+        with self.state.lock:
+            records = [rows[key] for key in sorted(rows)]
+
+        for key, value in query.items():
+            if key in LIST_CONTROL_PARAMETERS:
+                continue
+            if key == "id__gt":
+                records = [record for record in records if record["id"] > int(value)]
+            elif key == "id__lt":
+                records = [record for record in records if record["id"] < int(value)]
+            elif key.endswith("__gt") or key.endswith("__lt"):
+                field, operator = key.rsplit("__", 1)
+                if operator == "gt":
+                    records = [r for r in records if (r.get(field) or "") > value]
+                else:
+                    records = [r for r in records if (r.get(field) or "") < value]
+            else:
+                field = "active" if key == "active" else key
+                records = [
+                    record
+                    for record in records
+                    if str(record.get(field)).lower() == str(value).lower()
+                ]
+
+        if query.get("search"):
+            term = query["search"].lower()
+            records = [
+                record
+                for record in records
+                if any(term in str(value).lower() for value in record.values())
+            ]
+
+        page_size = min(int(query.get("page_size", 100)), self.state.max_page_size)
+        page = int(query.get("page", 1))
+        start = (page - 1) * page_size
+        base = f"http://{self.headers['Host']}{path}"
+
+        def link(number: int) -> str:
+            return f"{base}?{urlencode({**query, 'page': number})}"
+
+        return {
+            "count": len(records),
+            "next": link(page + 1) if start + page_size < len(records) else None,
+            "previous": link(page - 1) if page > 1 else None,
+            "results": records[start : start + page_size],
+        }
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class FakePeopleControlServer(ThreadingHTTPServer):
+    """Fake api served from a background thread
+
+    Example:
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=5000)
+            client = Client(token="fake", base_url=server.base_url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, state: FakeServerState = None, port: int = 0) -> None:
+        super().__init__(("127.0.0.1", port), FakeRequestHandler)
+        self.state = state if state else FakeServerState()
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}/api"
+        self.state.base_url = self.base_url
+        self._thread = None
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):  # Client gave up
+            super().handle_error(request, client_address)
+
+    def start(self) -> "FakePeopleControlServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakePeopleControlServer":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
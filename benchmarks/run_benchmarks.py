@@ -0,0 +1,252 @@
+"""Offline benchmarks of the client against the fake People Control server.
+
+Reports throughput, request latency percentiles and peak traced memory of full
+exports, bulk writes and roster builds, so changes can be compared without
+credentials or network.
+
+Usage:
+    python -m benchmarks.run_benchmarks --employees 20000 --latency 0.01
+    python -m benchmarks.run_benchmarks --scenario export_keyset --json
+"""
+
+import argparse
+import json
+import threading
+import tracemalloc
+from datetime import date
+from time import perf_counter
+from typing import Callable
+
+import requests
+
+from benchmarks.fake_server import FakePeopleControlServer, FakeServerState
+from mindsight_people_control_api import Client, ClientConfig
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.utils.aux_functions import related_id
+
+
+def percentile(values: list, rank: float) -> float:
+    """Get nearest rank percentile of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(rank / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyRecorder:
+    """after_response hook keeping the elapsed time of every request and the
+    bytes received
+    """
+
+    def __init__(self) -> None:
+        self.values: list = []
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_in_compressed = 0
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        elapsed: float,
+        status_code: int = None,
+        bytes_in: int = None,
+        bytes_in_compressed: int = None,
+        **kwargs,
+    ):
+        with self._lock:
+            self.values.append(elapsed)
+            if status_code is None or status_code >= 400:
+                self.errors += 1
+            self.bytes_in += bytes_in or 0
+            self.bytes_in_compressed += bytes_in_compressed or 0
+
+
+def export_offset(client: Client, options) -> int:
+    """Full export of employees with offset pagination"""
+    return len(client.employees.get_list_employees().get_all(retries=3).results)
+
+
+def export_keyset(client: Client, options) -> int:
+    """Full export of employees with keyset pagination"""
+    client.employees.pagination = "keyset"
+    try:
+        return len(client.employees.get_list_employees().get_all(retries=3).results)
+    finally:
+        client.employees.pagination = client.config.pagination
+
+
+def export_streaming(client: Client, options) -> int:
+    """Streaming export of employees with pages pre-fetched in background"""
+    records = 0
+    pagination = client.employees.get_list_employees()
+    for _ in pagination.iter_results(retries=3, prefetch=options.prefetch):
+        records += 1
+    return records
+
+
+def bulk_writes(client: Client, options) -> int:
+    """Create areas one by one, failed writes aren't counted as records"""
+    created = 0
+    for index in range(options.writes):
+        try:
+            client.areas.post_create_area(
+                code=f"BENCH{index}", name=f"Benchmark {index}", start_date=date.today()
+            )
+            created += 1
+
+        except (PeopleControlExceptions, requests.RequestException):
+            pass
+    return created
+
+
+def roster(client: Client, options) -> int:
+    """Join employees with current area, manager and position"""
+    employees = client.employees.get_list_employees().get_all(retries=3).results
+    current = {}  # employee id -> current related records
+    for name, endpoint, field in (
+        ("area", client.employee_areas.get_list_employee_areas, "area"),
+        ("manager", client.employee_managers.get_list_employee_managers, "manager"),
+        ("position", client.employee_positions.get_list_employee_positions, "position"),
+    ):
+        for record in endpoint().iter_results(retries=3):
+            if record.get("end_date") is None:
+                employee_id = related_id(record["employee"])
+                current.setdefault(employee_id, {})[name] = record[field]
+
+    rows = [{**employee, **current.get(employee["id"], {})} for employee in employees]
+    return len(rows)
+
+
+SCENARIOS: dict = {
+    "export_offset": export_offset,
+    "export_keyset": export_keyset,
+    "export_streaming": export_streaming,
+    "bulk_writes": bulk_writes,
+    "roster": roster,
+}
+
+
+def run_scenario(name: str, function: Callable, options) -> dict:
+    """Run scenario on a fresh server and client, returns its measures"""
+    state = FakeServerState(
+        latency=options.latency,
+        latency_per_record=options.latency_per_record,
+        max_page_size=options.max_page_size,
+        error_rate=options.error_rate,
+        seed=options.seed,
+        compression=options.server_compression,
+        bandwidth=options.bandwidth,
+    )
+    with FakePeopleControlServer(state) as server:
+        state.populate(employees=options.employees, areas=options.areas)
+        config = ClientConfig(
+            token="benchmark",
+            base_url=server.base_url,
+            page_size=options.page_size,
+            compression=not options.no_compression,
+        )
+        with Client(config) as client:
+            recorder = client.hooks.register("after_response", LatencyRecorder())
+            tracemalloc.start()
+            try:
+                start, error = perf_counter(), None
+                try:
+                    records = function(client, options)
+
+                except (PeopleControlExceptions, requests.RequestException) as exc:
+                    records, error = 0, exc  # First pages aren't retried
+                elapsed = perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+
+            finally:
+                tracemalloc.stop()
+
+    return {
+        "scenario": name,
+        "records": records,
+        "requests": len(recorder.values),
+        "errors": recorder.errors,
+        "seconds": elapsed,
+        "records_per_second": records / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(recorder.values, 50) * 1000,
+        "p95_ms": percentile(recorder.values, 95) * 1000,
+        "p99_ms": percentile(recorder.values, 99) * 1000,
+        "peak_memory_mb": peak / 1024 / 1024,
+        "received_mb": recorder.bytes_in / 1024 / 1024,
+        "transferred_mb": recorder.bytes_in_compressed / 1024 / 1024,
+        "failure": repr(error) if error else None,
+    }
+
+
+def format_table(results: list) -> str:
+    columns = (
+        ("scenario", "{:<17}"),
+        ("records", "{:>8}"),
+        ("requests", "{:>8}"),
+        ("errors", "{:>6}"),
+        ("seconds", "{:>8.2f}"),
+        ("records_per_second", "{:>10.0f}"),
+        ("p50_ms", "{:>8.1f}"),
+        ("p95_ms", "{:>8.1f}"),
+        ("p99_ms", "{:>8.1f}"),
+        ("peak_memory_mb", "{:>8.1f}"),
+        ("received_mb", "{:>8.1f}"),
+        ("transferred_mb", "{:>8.1f}"),
+    )
+    headers = ("scenario", "records", "requests", "errors", "seconds")
+    headers += ("rec/s", "p50 ms", "p95 ms", "p99 ms", "peak MB", "in MB", "wire MB")
+    widths = [len(fmt.format(row[key])) for row in results[:1] for key, fmt in columns]
+    lines = [
+        " ".join(
+            header.ljust(width) if index == 0 else header.rjust(width)
+            for index, (header, width) in enumerate(zip(headers, widths))
+        )
+    ]
+    for row in results:
+        lines.append(" ".join(fmt.format(row[key]) for key, fmt in columns))
+        if row["failure"]:
+            lines.append(f"  failed: {row['failure']}")
+    return "\n".join(lines)
+
+
+def parse_arguments(arguments: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), default=None
+    )
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--areas", type=int, default=200)
+    parser.add_argument("--writes", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--max-page-size", type=int, default=5000)
+    parser.add_argument("--prefetch", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-per-record", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--server-compression", action="store_true", help="Gzip server responses"
+    )
+    parser.add_argument(
+        "--no-compression", action="store_true", help="Client accepts identity only"
+    )
+    parser.add_argument(
+        "--bandwidth", type=float, default=None, help="Server bytes per second"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as json")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: list = None) -> list:
+    options = parse_arguments(arguments)
+    results = [
+        run_scenario(name, SCENARIOS[name], options)
+        for name in options.scenario or SCENARIOS
+    ]
+    print(json.dumps(results, indent=2) if options.json else format_table(results))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,43 @@
 """This module take all methods of scripts.__init__.py"""
 
-from mindsight_people_control_api.scripts import (
-    AreaRecords,
-    Areas,
-    EmployeeAreas,
-    EmployeeManagers,
-    EmployeePositions,
-    EmployeeRecord,
-    Employees,
-    ParentAreas,
-    PositionRecords,
-    Positions,
-    Users,
-    Corporations,
-    BranchCorporations,
-)
+import importlib
+
+# Classes are imported on first access (module __getattr__), so importing the
+# package is cheap and doesn't require the environment variables.
+_LAZY_ATTRIBUTES = {
+    "AreaRecords": "mindsight_people_control_api.scripts",
+    "Areas": "mindsight_people_control_api.scripts",
+    "EmployeeAreas": "mindsight_people_control_api.scripts",
+    "EmployeeManagers": "mindsight_people_control_api.scripts",
+    "EmployeePositions": "mindsight_people_control_api.scripts",
+    "EmployeeRecord": "mindsight_people_control_api.scripts",
+    "Employees": "mindsight_people_control_api.scripts",
+    "ParentAreas": "mindsight_people_control_api.scripts",
+    "PositionRecords": "mindsight_people_control_api.scripts",
+    "Positions": "mindsight_people_control_api.scripts",
+    "Users": "mindsight_people_control_api.scripts",
+    "Corporations": "mindsight_people_control_api.scripts",
+    "BranchCorporations": "mindsight_people_control_api.scripts",
+    "Client": "mindsight_people_control_api.client",
+    "ClientConfig": "mindsight_people_control_api.helpers.config",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
 __doc__ = """
 **mindsight_people_control_api** is a python package to providing
 methods to use People Control rest api.
 """
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,171 @@
+"""This module provide the api client, owner of configuration and connections"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mindsight_people_control_api import scripts
+from mindsight_people_control_api.helpers.config import ClientConfig
+from mindsight_people_control_api.helpers.instrumentation import (
+    Hooks,
+    MetricsCollector,
+)
+from mindsight_people_control_api.helpers.references import ReferenceCache
+from mindsight_people_control_api.helpers.tracing import (
+    NoopTracer,
+    OpenTelemetryTracer,
+    noop_tracer,
+)
+from mindsight_people_control_api.helpers.transport import Transport, http_transport
+
+
+class Client:
+    """People Control api client. Each client owns its credentials, base url,
+    timeouts, connection pool and caches, so clients of different tenants can
+    run side by side in the same process.
+
+    Args:
+        config (ClientConfig, Optional): Client configuration, default from settings
+        tracer (NoopTracer, Optional): Tracer of api operations, default is an
+            OpenTelemetryTracer when config.tracing is enabled
+        transport (Transport, Optional): Transport sending the requests, like
+            RecordingTransport or ReplayTransport, default http
+        kwargs: ClientConfig arguments, used when config is not informed
+
+    Example:
+        client = Client(ClientConfig(token="...", base_url="https://.../api"))
+        employees = client.employees.get_list_employees().get_all().results
+    """
+
+    def __init__(
+        self,
+        config: ClientConfig = None,
+        tracer: NoopTracer = None,
+        transport: Transport = None,
+        **kwargs,
+    ) -> None:
+        self.config = config if config else ClientConfig(**kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.caches: dict = {}
+        self.hooks = Hooks()
+        self.metrics: MetricsCollector = None
+        if tracer is None:
+            tracer = OpenTelemetryTracer() if self.config.tracing else noop_tracer
+        self.tracer = tracer
+        self.transport = transport if transport else http_transport
+        self._endpoints: dict = {}
+        self._references: ReferenceCache = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.config!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close pooled connections of client."""
+        self.session.close()
+
+    def enable_metrics(self) -> MetricsCollector:
+        """Collect metrics of all requests made by this client."""
+        if self.metrics is None:
+            self.metrics = MetricsCollector(hooks=self.hooks)
+        return self.metrics
+
+    def clear_caches(self):
+        """Clear cached data of all endpoints."""
+        for cache in self.caches.values():
+            cache.clear()
+        if self._references is not None:
+            self._references.clear()
+
+    @property
+    def references(self) -> ReferenceCache:
+        """Code -> id cache used by write methods receiving codes"""
+        with self._lock:
+            if self._references is None:
+                self._references = ReferenceCache(client=self)
+            return self._references
+
+    def endpoint(self, endpoint_class: type):
+        """Get endpoint instance bound to this client, created once per class."""
+        with self._lock:
+            if endpoint_class not in self._endpoints:
+                self._endpoints[endpoint_class] = endpoint_class(client=self)
+            return self._endpoints[endpoint_class]
+
+    @property
+    def area_records(self) -> "scripts.AreaRecords":
+        """Area records endpoint"""
+        return self.endpoint(scripts.AreaRecords)
+
+    @property
+    def areas(self) -> "scripts.Areas":
+        """Areas endpoint"""
+        return self.endpoint(scripts.Areas)
+
+    @property
+    def branch_corporations(self) -> "scripts.BranchCorporations":
+        """Branch corporations endpoint"""
+        return self.endpoint(scripts.BranchCorporations)
+
+    @property
+    def corporations(self) -> "scripts.Corporations":
+        """Corporations endpoint"""
+        return self.endpoint(scripts.Corporations)
+
+    @property
+    def employee_areas(self) -> "scripts.EmployeeAreas":
+        """Employee areas endpoint"""
+        return self.endpoint(scripts.EmployeeAreas)
+
+    @property
+    def employee_managers(self) -> "scripts.EmployeeManagers":
+        """Employee managers endpoint"""
+        return self.endpoint(scripts.EmployeeManagers)
+
+    @property
+    def employee_positions(self) -> "scripts.EmployeePositions":
+        """Employee positions endpoint"""
+        return self.endpoint(scripts.EmployeePositions)
+
+    @property
+    def employee_records(self) -> "scripts.EmployeeRecord":
+        """Employee records endpoint"""
+        return self.endpoint(scripts.EmployeeRecord)
+
+    @property
+    def employees(self) -> "scripts.Employees":
+        """Employees endpoint"""
+        return self.endpoint(scripts.Employees)
+
+    @property
+    def parent_areas(self) -> "scripts.ParentAreas":
+        """Parent areas endpoint"""
+        return self.endpoint(scripts.ParentAreas)
+
+    @property
+    def position_records(self) -> "scripts.PositionRecords":
+        """Position records endpoint"""
+        return self.endpoint(scripts.PositionRecords)
+
+    @property
+    def positions(self) -> "scripts.Positions":
+        """Positions endpoint"""
+        return self.endpoint(scripts.Positions)
+
+    @property
+    def users(self) -> "scripts.Users":
+        """Users endpoint"""
+        return self.endpoint(scripts.Users)
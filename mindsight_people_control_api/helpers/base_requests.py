@@ -1,29 +1,108 @@
 """This module provide a base to use requests for api"""
 
-from typing import Any, Literal
+from time import monotonic, perf_counter
+from typing import Any, Callable, Literal
 
 import requests
 
-from mindsight_people_control_api.helpers.exceptions import BadRequestException, ServerErrorException
-from mindsight_people_control_api.settings import API_TOKEN, TIMEOUT
+from mindsight_people_control_api.helpers.circuit_breaker import (
+    CircuitBreaker,
+    circuit_breakers,
+)
+from mindsight_people_control_api.helpers.compression import (
+    accept_encoding,
+    wire_bytes,
+)
+from mindsight_people_control_api.helpers.config import ClientConfig
+from mindsight_people_control_api.helpers.exceptions import BadRequestException, DeadlineExceededException, ServerErrorException
+from mindsight_people_control_api.helpers.instrumentation import Hooks, default_hooks
+from mindsight_people_control_api.helpers.tracing import NoopTracer, Span, current_span, noop_tracer
+from mindsight_people_control_api.helpers.transport import Transport, http_transport
 from mindsight_people_control_api.utils.aux_functions import generate_url, remove_none_fields
 
 
 class BaseRequests:
-    """Aux class to communicate with mindsight api"""
+    """Aux class to communicate with mindsight api
 
-    def __init__(self):
-        self.__token = API_TOKEN
+    Args:
+        config (ClientConfig, Optional): Client configuration, default from settings
+        session (requests.Session, Optional): Session to reuse connections,
+            default is a new session
+        hooks (Hooks, Optional): Hooks called on request events, default is
+            instrumentation.default_hooks
+        tracer (NoopTracer, Optional): Tracer of request spans, default disabled
+        transport (Transport, Optional): Transport sending the requests, default
+            http
+    """
+
+    def __init__(
+        self,
+        config: ClientConfig = None,
+        session: requests.Session = None,
+        hooks: Hooks = None,
+        tracer: NoopTracer = None,
+        transport: Transport = None,
+    ):
+        self.config = config if config else ClientConfig()
+        self.session = session if session else requests.Session()
+        self.hooks = hooks if hooks is not None else default_hooks
+        self.tracer = tracer if tracer is not None else noop_tracer
+        self.transport = transport if transport is not None else http_transport
+        self.__token = self.config.token
         self.headers = None
         self.base_path = "/"
-        self.timeout: int = TIMEOUT
+        self.timeout: int = self.config.timeout
+        self.connect_timeout: float = self.config.connect_timeout
+        self.deadline: float = self.config.deadline
+        self.accept_encoding: str = accept_encoding(self.config.compression)
+        self.on_write: Callable = None  # Called with path of each write request
 
     def __authorization_header(self) -> dict:
         return {
             "Authorization": f"Token {self.__token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": self.accept_encoding,
         }
 
+    def generate_url(self, path: str, base_path: str = None) -> str:
+        """Generate a URL of client api instance, default on request base path"""
+        return generate_url(
+            base_path=self.base_path if base_path is None else base_path,
+            path=path,
+            base_url=self.config.base_url,
+            api_version=self.config.api_version,
+        )
+
+    def deadline_at(self) -> float:
+        """Get monotonic time limit of an operation starting now, or None"""
+        return monotonic() + self.deadline if self.deadline else None
+
+    def _timeouts(self, deadline: float = None) -> tuple:
+        """Get (connect, read) timeouts, limited to the time left to deadline"""
+        connect, read = self.connect_timeout, self.timeout
+        if deadline is not None:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededException(
+                    f"Deadline of {self.base_path} operation exceeded"
+                )
+            connect = min(connect, remaining) if connect else remaining
+            read = min(read, remaining) if read else remaining
+        return connect, read
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Get circuit breaker of requests, None when disabled"""
+        settings = self.config.circuit_breaker
+        if not settings:
+            return None
+
+        return circuit_breakers.get(
+            self.config.base_url,
+            self.base_path if self.config.circuit_breaker_per_endpoint else None,
+            **(settings if isinstance(settings, dict) else {}),
+        )
+
     def __check_response(self, response: requests.Response):
         content_text = response.text
         try:
@@ -42,6 +121,117 @@ class BaseRequests:
         except Exception as exc:
             raise exc
 
+    def _send(
+        self,
+        method: Literal["get", "post", "put", "patch", "delete"],
+        url: str,
+        headers: dict = None,
+        parameters: dict = None,
+        data: Any = None,
+        json: Any = None,
+        trace_parent: Span = None,
+        trace_attributes: dict = None,
+        deadline: float = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send request to url with client session, credentials and timeout
+
+        Args:
+            trace_parent (Span, Optional): Parent span of the request span
+            trace_attributes (dict, Optional): Extra attributes of request span
+            deadline (float, Optional): Monotonic time limit of the operation
+            stream (bool, Optional): Return before the body is downloaded, to read
+                it with response.iter_content
+        """
+        timeout = self._timeouts(deadline)
+        breaker = self.circuit_breaker
+        probe = breaker.before_call() if breaker else False
+        recorded = False
+        try:
+            self.headers = {**self.__authorization_header(), **(headers or {})}
+            event = {"method": method, "url": url, "endpoint": self.base_path}
+            self.hooks.emit("before_request", **event)
+
+            span = self.tracer.start_span(
+                f"{method.upper()} {self.base_path}",
+                attributes={
+                    "http.method": method.upper(),
+                    "http.url": url,
+                    "mindsight.endpoint": self.base_path,
+                    **(trace_attributes or {}),
+                },
+                parent=trace_parent if trace_parent is not None else current_span(),
+            )
+            request_headers = dict(self.headers)
+            span.inject_headers(request_headers)
+
+            start = perf_counter()
+            try:
+                response = self.transport.send(
+                    self.session,
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    params=parameters,
+                    data=data,
+                    json=json,
+                    timeout=timeout,
+                    stream=stream,
+                )
+
+            except Exception as error:
+                if breaker:
+                    breaker.record(
+                        elapsed=perf_counter() - start, failed=True, probe=probe
+                    )
+                    recorded = True
+                span.record_exception(error)
+                span.end()
+                self.hooks.emit(
+                    "after_response",
+                    **event,
+                    elapsed=perf_counter() - start,
+                    error=error,
+                )
+                if deadline is not None and monotonic() >= deadline:
+                    raise DeadlineExceededException(
+                        f"Deadline of {self.base_path} operation exceeded: {error}"
+                    ) from error
+                raise error
+
+            span.set_attribute("http.status_code", response.status_code)
+            span.end()
+            if breaker:
+                breaker.record(
+                    elapsed=perf_counter() - start,
+                    failed=response.status_code >= 500 or response.status_code == 429,
+                    probe=probe,
+                )
+                recorded = True
+
+        finally:
+            # Interrupted requests must not keep the half-open trial slot
+            if probe and not recorded:
+                breaker.release(probe)
+
+        if self.hooks.has("after_response"):
+            # Body of streamed responses isn't downloaded yet, see on_page hook
+            bytes_in = None if stream else len(response.content)
+            bytes_in_compressed = None if stream else wire_bytes(response)
+            self.hooks.emit(
+                "after_response",
+                **event,
+                status_code=response.status_code,
+                elapsed=perf_counter() - start,
+                bytes_in=bytes_in,
+                bytes_in_compressed=(
+                    bytes_in if bytes_in_compressed is None else bytes_in_compressed
+                ),
+                content_encoding=response.headers.get("Content-Encoding"),
+                bytes_out=len(response.request.body or b""),
+            )
+        return response
+
     def __request_helper(
         self,
         path: str,
@@ -50,83 +240,79 @@ class BaseRequests:
         parameters: dict = None,
         data: Any = None,
         json: Any = None,
+        deadline: float = None,
+        trace_parent: Span = None,
     ):
-        if not headers:
-            headers = {}
-
-        request_url = generate_url(base_path=self.base_path, path=path)
-        self.headers = {**self.__authorization_header(), **headers}
-
-        response = None
+        request_url = self.generate_url(path=path)
         method = method.lower()
 
         if method == "get":
+            if parameters is None:
+                parameters = {}
             parameters["ordering"] = "id"
-            response = requests.get(
-                url=request_url,
-                headers=self.headers,
-                params=parameters,
-                data=data,
-                timeout=self.timeout,
-            )
-
-        elif method == "post":
-            response = requests.post(
-                url=request_url,
-                headers=self.headers,
-                params=parameters,
-                data=data,
-                json=json,
-                timeout=self.timeout,
-            )
-
-        elif method == "put":
-            response = requests.put(
-                url=request_url,
-                headers=self.headers,
-                params=parameters,
-                data=data,
-                json=json,
-                timeout=self.timeout,
-            )
+            json = None
 
-        elif method == "patch":
-            response = requests.patch(
+        try:
+            response = self._send(
+                method=method,
                 url=request_url,
-                headers=self.headers,
-                params=parameters,
+                headers=headers,
+                parameters=parameters,
                 data=data,
                 json=json,
-                timeout=self.timeout,
+                deadline=deadline if deadline is not None else self.deadline_at(),
+                trace_parent=trace_parent,
             )
 
-        elif method == "delete":
-            response = requests.delete(
-                url=request_url,
-                headers=self.headers,
-                params=parameters,
-                data=data,
-                json=json,
-                timeout=self.timeout,
-            )
+            # Check response
+            self.__check_response(response)
 
-        # Check response
-        self.__check_response(response)
+        finally:
+            # Failed writes may have been applied too
+            if method != "get" and self.on_write:
+                self.on_write(path)
         if response.status_code == 204:
             return response
         response_json = response.json()
 
         return response_json
 
+    def get_url(
+        self,
+        url: str,
+        headers: dict = None,
+        trace_parent: Span = None,
+        trace_attributes: dict = None,
+        deadline: float = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Use GET method on an absolute url, like pagination next links"""
+        return self._send(
+            method="get",
+            url=url,
+            headers=headers,
+            trace_parent=trace_parent,
+            trace_attributes=trace_attributes,
+            deadline=deadline,
+            stream=stream,
+        )
+
     def get(
         self,
         path: str,
         headers: dict = None,
         parameters: dict = None,
+        deadline: float = None,
+        trace_parent: Span = None,
     ) -> Any:
         """Use GET method on Rest API"""
         return self.__request_helper(
-            path=path, method="get", headers=headers, parameters=parameters
+            path=path,
+            method="get",
+            headers=headers,
+            parameters=parameters,
+            deadline=deadline,
+            trace_parent=trace_parent,
         )
 
     def post(
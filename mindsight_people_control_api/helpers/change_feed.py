@@ -0,0 +1,223 @@
+"""This module provide a poller of record changes, shared by many consumers.
+
+Each poll lists the records of an entity modified since the second of its
+watermark (the latest modified datetime delivered), with the modified__gt filter
+on the previous second. These boundary rows are requested again by the next
+poll, so the (id, modified) pairs already delivered since that second are kept
+and skipped.
+"""
+
+import logging
+import queue
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple
+
+from mindsight_people_control_api.helpers.checkpoints import (
+    CheckpointStore,
+    MemoryCheckpointStore,
+)
+from mindsight_people_control_api.utils.aux_functions import (
+    parse_datetime,
+    utc_datetime,
+)
+
+logger = logging.getLogger(__name__)
+
+# entity -> (client endpoint property, list method)
+FEED_SOURCES = {
+    "employees": ("employees", "get_list_employees"),
+    "areas": ("areas", "get_list_areas"),
+    "employee_areas": ("employee_areas", "get_list_employee_areas"),
+    "employee_managers": ("employee_managers", "get_list_employee_managers"),
+    "employee_positions": ("employee_positions", "get_list_employee_positions"),
+}
+
+
+class Change(NamedTuple):
+    """Record created or modified in entity"""
+
+    entity: str
+    record: dict
+
+
+class ChangeFeedPoller:
+    """Poll entities for changed records and deliver them to subscribed
+    callbacks and, optionally, to a queue. Watermarks are saved in a checkpoint
+    store after each entity is delivered, so a restarted poller resumes from
+    them (delivery is at least once).
+
+    Args:
+        client (Client, Optional): Client used to poll, default is a client
+            configured by the module settings
+        entities (tuple, Optional): Entities to poll, keys of FEED_SOURCES
+        interval (float, Optional): Seconds between polls of the background thread
+        checkpoint_store (CheckpointStore, Optional): Store of watermarks, default
+            in memory
+        checkpoint_prefix (str, Optional): Prefix of watermark checkpoint keys
+        start_from (datetime, Optional): Watermark of entities without checkpoint,
+            default is to deliver all records on the first poll
+        changes_queue (queue.Queue, Optional): Queue to put each Change on
+
+    Example:
+        poller = ChangeFeedPoller(client, entities=("employee_managers",))
+        poller.subscribe(lambda change: print(change.record))
+        poller.start()
+    """
+
+    def __init__(
+        self,
+        client=None,
+        entities: tuple = tuple(FEED_SOURCES),
+        interval: float = 60.0,
+        checkpoint_store: CheckpointStore = None,
+        checkpoint_prefix: str = "change_feed",
+        start_from: datetime = None,
+        changes_queue: queue.Queue = None,
+    ) -> None:
+        for entity in entities:
+            if entity not in FEED_SOURCES:
+                raise ValueError(f"Entity must be one of {tuple(FEED_SOURCES)}.")
+
+        if client is None:
+            from mindsight_people_control_api.client import Client
+
+            client = Client()
+        self.client = client
+        self.entities = tuple(entities)
+        self.interval = interval
+        self.checkpoint_store = (
+            checkpoint_store
+            if checkpoint_store is not None
+            else MemoryCheckpointStore()
+        )
+        self.checkpoint_prefix = checkpoint_prefix
+        self.start_from = start_from
+        self.queue = changes_queue
+        self._subscribers: list = []  # (callback, entities)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+
+    def subscribe(self, callback: Callable, entities: tuple = None) -> Callable:
+        """Call callback with each Change of entities, default all polled ones.
+        Callback errors are logged without stopping the delivery.
+        """
+        with self._lock:
+            self._subscribers = [*self._subscribers, (callback, entities)]
+        return callback
+
+    def unsubscribe(self, callback: Callable):
+        """Stop calling callback."""
+        with self._lock:
+            self._subscribers = [
+                subscriber
+                for subscriber in self._subscribers
+                if subscriber[0] != callback
+            ]
+
+    def _checkpoint_key(self, entity: str) -> str:
+        return f"{self.checkpoint_prefix}:{entity}"
+
+    def watermark(self, entity: str) -> datetime:
+        """Get modified datetime of the latest change delivered of entity."""
+        checkpoint = self.checkpoint_store.load(self._checkpoint_key(entity))
+        if checkpoint and checkpoint.get("watermark"):
+            return parse_datetime(checkpoint["watermark"])
+        return self.start_from
+
+    def _deliver(self, change: Change):
+        for callback, entities in self._subscribers:
+            if entities is not None and change.entity not in entities:
+                continue
+            try:
+                callback(change)
+
+            except Exception:
+                logger.exception("Error on change feed subscriber %r", callback)
+
+        if self.queue is not None:
+            self.queue.put(change)
+
+    def poll_entity(self, entity: str) -> int:
+        """Deliver changes of entity since its watermark, returns their number."""
+        key = self._checkpoint_key(entity)
+        checkpoint = self.checkpoint_store.load(key) or {}
+        watermark = self.watermark(entity)
+        boundary = {tuple(item) for item in checkpoint.get("boundary", [])}
+
+        endpoint_name, list_method = FEED_SOURCES[entity]
+        endpoint = getattr(self.client, endpoint_name)
+        filters = {}
+        if watermark:  # Rows of the watermark second too, like modified >=
+            since = utc_datetime(watermark).replace(microsecond=0)
+            since -= timedelta(seconds=1)
+            filters = {"modified__gt": since}
+
+        latest, latest_modified = None, None
+        delivered = []
+        for record in getattr(endpoint, list_method)(**filters).iter_results():
+            if (record["id"], record.get("modified")) in boundary:
+                continue
+
+            self._deliver(Change(entity, record))
+            delivered.append((record["id"], record.get("modified")))
+            if record.get("modified"):
+                modified = parse_datetime(record["modified"])
+                if latest is None or modified > latest:
+                    latest, latest_modified = modified, record["modified"]
+
+        if latest is None:  # Nothing delivered, or records without modified
+            return len(delivered)
+
+        previous = checkpoint.get("watermark")
+        if previous and parse_datetime(previous) > latest:  # Late rows only
+            latest, latest_modified = parse_datetime(previous), previous
+
+        # Rows since the second before the watermark come again on the next poll
+        since = latest.replace(microsecond=0) - timedelta(seconds=1)
+        boundary = {
+            (_id, modified)
+            for _id, modified in boundary | set(delivered)
+            if modified and parse_datetime(modified) >= since
+        }
+        self.checkpoint_store.save(
+            key,
+            {"watermark": latest_modified, "boundary": sorted(boundary)},
+        )
+        return len(delivered)
+
+    def poll_once(self) -> int:
+        """Poll all entities once, returns the number of changes delivered."""
+        return sum(self.poll_entity(entity) for entity in self.entities)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+
+            except Exception:
+                logger.exception("Error polling change feed, retrying next interval")
+            self._stop.wait(self.interval)
+
+    def start(self) -> "ChangeFeedPoller":
+        """Poll in a background daemon thread every interval seconds."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="change-feed-poller", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = None):
+        """Stop background polling, waiting the current poll to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,89 @@
+"""This module provide stores to save pagination checkpoints"""
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CheckpointStore(ABC):
+    """Base class of pagination checkpoint stores.
+
+    A checkpoint is a dict with the position of a pagination: next page url,
+    keyset cursor, count, pages and records already processed.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[dict]:
+        """Get checkpoint saved with key, None if it doesn't exist."""
+
+    @abstractmethod
+    def save(self, key: str, checkpoint: dict):
+        """Save checkpoint with key, replacing the previous one."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Delete checkpoint saved with key."""
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Keep checkpoints in process memory"""
+
+    def __init__(self) -> None:
+        self._checkpoints: dict = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            checkpoint = self._checkpoints.get(key)
+            return dict(checkpoint) if checkpoint else None
+
+    def save(self, key: str, checkpoint: dict):
+        with self._lock:
+            self._checkpoints[key] = dict(checkpoint)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keep checkpoints as json files in a directory, one file per key.
+    Files are replaced atomically so a crash never leaves a broken checkpoint.
+
+    Args:
+        directory (str, Mandatory): Directory to save checkpoint files
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        file_name = "".join(char if char.isalnum() else "_" for char in key)[-80:]
+        key_hash = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.directory, f"{file_name}_{key_hash}.json")
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), encoding="utf-8") as checkpoint_file:
+                return json.load(checkpoint_file)
+
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, checkpoint: dict):
+        path = self._path(key)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(temporary_path, path)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,201 @@
+"""This module provide circuit breakers to fail fast when the api is degraded.
+
+A breaker is closed while the rate of failed (errors, 5xx and 429 responses)
+or slow requests of a recent window is under its thresholds. Once over them it
+opens, rejecting requests without calling the api, and after open_seconds it
+becomes half-open, letting only a few trial requests through: their success
+closes the breaker and a failure opens it again.
+"""
+
+import logging
+import threading
+from collections import deque
+from time import monotonic
+from typing import Callable
+
+from mindsight_people_control_api.helpers.exceptions import CircuitOpenException
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker driven by error and latency rates of recent requests
+
+    Args:
+        name (str, Optional): Name of breaker on errors and logs
+        failure_rate (float, Optional): Rate of failed requests that opens it
+        slow_call_seconds (float, Optional): Requests slower than it are slow,
+            None to ignore latency
+        slow_call_rate (float, Optional): Rate of slow requests that opens it
+        minimum_requests (int, Optional): Requests in window needed to open it
+        window (float, Optional): Seconds of requests used to compute rates
+        open_seconds (float, Optional): Seconds open before trial requests
+        half_open_probes (int, Optional): Successful trial requests needed to close
+        clock (Callable, Optional): Monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = None,
+        slow_call_rate: float = 0.8,
+        minimum_requests: int = 10,
+        window: float = 60.0,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable = monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._calls: deque = deque()  # (time, failed, slow)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0  # Trial requests in flight
+        self._successes = 0  # Successful trial requests
+
+    @property
+    def state(self) -> str:
+        """Get breaker state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if (
+                self._state == OPEN
+                and self.clock() - self._opened_at >= self.open_seconds
+            ):
+                return HALF_OPEN
+            return self._state
+
+    def _transition(self, state: str):
+        if state != self._state:
+            logger.warning("Circuit breaker %s %s", self.name, state.replace("_", "-"))
+        self._state = state
+        self._probes = 0
+        self._successes = 0
+        if state == OPEN:
+            self._opened_at = self.clock()
+        if state == CLOSED:
+            self._calls.clear()
+
+    def before_call(self) -> bool:
+        """Check if a request may be sent, raises CircuitOpenException if not.
+        Returns True when the request is a half-open trial, to pass to record.
+        """
+        with self._lock:
+            if self._state == OPEN:
+                if self.clock() - self._opened_at < self.open_seconds:
+                    raise CircuitOpenException(
+                        f"Circuit breaker {self.name} is open, api calls are halted"
+                    )
+                self._transition(HALF_OPEN)
+
+            if self._state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    raise CircuitOpenException(
+                        f"Circuit breaker {self.name} is half-open, waiting trials"
+                    )
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, elapsed: float, failed: bool, probe: bool = False):
+        """Record outcome of a request allowed by before_call.
+
+        Args:
+            elapsed (float, Mandatory): Seconds of request
+            failed (bool, Mandatory): Request failed
+            probe (bool, Optional): Value returned by before_call. Only trial
+                requests close or reopen a half-open breaker; requests allowed
+                before it opened are just recorded.
+        """
+        slow = self.slow_call_seconds is not None and elapsed >= self.slow_call_seconds
+        with self._lock:
+            if probe:
+                if self._state != HALF_OPEN:
+                    return  # Breaker reset or decided by other trials
+
+                self._probes -= 1
+                if failed or slow:
+                    self._transition(OPEN)
+                else:
+                    self._successes += 1
+                    if self._successes >= self.half_open_probes:
+                        self._transition(CLOSED)
+                return
+
+            now = self.clock()
+            self._calls.append((now, failed, slow))
+            while self._calls and self._calls[0][0] < now - self.window:
+                self._calls.popleft()
+
+            total = len(self._calls)
+            if self._state != CLOSED or total < self.minimum_requests:
+                return
+
+            failures = sum(1 for _, failed, _ in self._calls if failed)
+            slows = sum(1 for _, _, slow in self._calls if slow)
+            if (
+                failures / total >= self.failure_rate
+                or self.slow_call_seconds is not None
+                and slows / total >= self.slow_call_rate
+            ):
+                self._transition(OPEN)
+
+    def release(self, probe: bool):
+        """Give back the trial slot of a request allowed by before_call that
+        ended without an outcome to record, like an interrupted one.
+
+        Args:
+            probe (bool, Mandatory): Value returned by before_call
+        """
+        with self._lock:
+            if probe and self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def reset(self):
+        """Close breaker forgetting recorded requests."""
+        with self._lock:
+            self._transition(CLOSED)
+
+
+class CircuitBreakers:
+    """Registry of breakers by base url, optionally endpoint path, and
+    settings. Clients of the same api instance with the same breaker settings
+    share its breakers.
+    """
+
+    def __init__(self) -> None:
+        self._breakers: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, endpoint: str = None, **kwargs) -> CircuitBreaker:
+        """Get breaker of base url, endpoint and settings, creating it with
+        kwargs
+        """
+        key = (base_url, endpoint, tuple(sorted(kwargs.items())))
+        with self._lock:
+            if key not in self._breakers:
+                name = f"{base_url}{endpoint or ''}"
+                self._breakers[key] = CircuitBreaker(name=name, **kwargs)
+            return self._breakers[key]
+
+    def reset(self):
+        """Close all breakers."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
+
+
+circuit_breakers = CircuitBreakers()
@@ -0,0 +1,56 @@
+"""This module provide content encoding negotiation of api responses.
+
+Responses are decoded by urllib3 while they are read (also for streamed pages),
+so any encoding it supports can be accepted: gzip and deflate always, br with
+the brotli (or brotlicffi) package and zstd with the zstandard package.
+"""
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+ENCODINGS_PREFERENCE = ("zstd", "br", "gzip", "deflate")  # Best ratio first
+
+SUPPORTED_ENCODINGS = tuple(
+    encoding
+    for encoding in ENCODINGS_PREFERENCE
+    if encoding in ACCEPT_ENCODING.split(",")
+)
+
+
+def accept_encoding(encodings=True) -> str:
+    """Get Accept-Encoding header value preferring encodings in order
+
+    Args:
+        encodings (bool | tuple, Optional): True for all supported encodings,
+            False for uncompressed responses, or encodings in preference order
+    """
+    if encodings is True:
+        encodings = SUPPORTED_ENCODINGS
+    elif not encodings:
+        return "identity"
+
+    unsupported = set(encodings) - set(SUPPORTED_ENCODINGS)
+    if unsupported:
+        raise ValueError(
+            f"Encodings {sorted(unsupported)} aren't supported, "
+            f"available ones are {SUPPORTED_ENCODINGS}."
+        )
+
+    return ", ".join(
+        encoding if index == 0 else f"{encoding};q={1 - index / 10:.1f}"
+        for index, encoding in enumerate(encodings)
+    )
+
+
+def wire_bytes(response: requests.Response) -> int:
+    """Get number of body bytes received before decoding, once it was read"""
+    raw = getattr(response, "raw", None)
+    if raw is not None and hasattr(raw, "tell"):
+        try:
+            return raw.tell()
+
+        except (OSError, ValueError):
+            pass
+
+    length = response.headers.get("Content-Length")
+    return int(length) if length else None
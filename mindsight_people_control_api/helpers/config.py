@@ -0,0 +1,103 @@
+"""This module provide the configuration object of api clients"""
+
+from typing import Union
+
+from mindsight_people_control_api import settings
+from mindsight_people_control_api.settings import (
+    API_VERSION,
+    CONNECT_TIMEOUT,
+    DEADLINE,
+    PAGE_SIZE,
+    PAGINATION_MODE,
+    RECORD_CACHE_SIZE,
+    RECORD_CACHE_TTL,
+    TIMEOUT,
+)
+
+ENDPOINT_TIMEOUT_FIELDS = ("timeout", "connect_timeout", "deadline")
+
+
+class ClientConfig:
+    """Configuration of a People Control api client. Arguments not informed
+    use the module settings (environment variables).
+
+    Args:
+        token (str, Optional): Token to authenticate
+        base_url (str, Optional): Base path of api instance
+        api_version (str, Optional): Api version
+        timeout (int, Optional): Requests read timeout seconds
+        connect_timeout (float, Optional): Requests connect timeout seconds
+        deadline (float, Optional): Seconds to finish an operation, including all
+            pages and retries of a pagination, None to disable
+        endpoint_timeouts (dict, Optional): Overrides of timeout, connect_timeout
+            and deadline by endpoint path, like {"/employees": {"deadline": 60}}
+        circuit_breaker (bool | dict, Optional): Fail fast while the api is
+            degraded, True for default settings or a dict of CircuitBreaker
+            arguments
+        circuit_breaker_per_endpoint (bool, Optional): Use a breaker per endpoint
+            path instead of one for the whole base url
+        page_size (int, Optional): Default number of records per page
+        pagination (str, Optional): Default pagination mode, "offset" or "keyset"
+        pool_connections (int, Optional): Number of connection pools to cache
+        pool_maxsize (int, Optional): Maximum connections kept per pool
+        tracing (bool, Optional): Create opentelemetry spans of api operations,
+            requires opentelemetry-api
+        compression (bool | tuple, Optional): Accept compressed responses, True
+            for the best supported encodings (zstd, br, gzip, deflate), False to
+            disable or a tuple of encodings in preference order
+        cache_size (int, Optional): Records kept per endpoint by retrieve_many
+        cache_ttl (float, Optional): Seconds a cached record is served
+    """
+
+    def __init__(
+        self,
+        token: str = None,
+        base_url: str = None,
+        api_version: str = API_VERSION,
+        timeout: int = TIMEOUT,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        deadline: float = DEADLINE,
+        endpoint_timeouts: dict = None,
+        circuit_breaker: Union[bool, dict] = False,
+        circuit_breaker_per_endpoint: bool = False,
+        page_size: int = PAGE_SIZE,
+        pagination: str = PAGINATION_MODE,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        tracing: bool = False,
+        compression: Union[bool, tuple] = True,
+        cache_size: int = RECORD_CACHE_SIZE,
+        cache_ttl: float = RECORD_CACHE_TTL,
+    ) -> None:
+        self.token = token if token is not None else settings.API_TOKEN
+        self.base_url = (
+            base_url if base_url is not None else settings.API_BASE_URL
+        ).rstrip("/")
+        self.api_version = api_version
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.deadline = deadline
+        self.endpoint_timeouts = endpoint_timeouts if endpoint_timeouts else {}
+        for path, overrides in self.endpoint_timeouts.items():
+            unknown = set(overrides) - set(ENDPOINT_TIMEOUT_FIELDS)
+            if unknown:
+                raise ValueError(
+                    f"Endpoint timeouts of {path} must be in "
+                    f"{ENDPOINT_TIMEOUT_FIELDS}, got {sorted(unknown)}."
+                )
+        self.circuit_breaker = circuit_breaker
+        self.circuit_breaker_per_endpoint = circuit_breaker_per_endpoint
+        self.page_size = page_size
+        self.pagination = pagination
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.tracing = tracing
+        self.compression = compression
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(base_url={self.base_url!r}, "
+            f"api_version={self.api_version!r}, timeout={self.timeout!r})"
+        )
@@ -0,0 +1,108 @@
+"""This module provide a consistency guard of offset paginations.
+
+Offset pages of a list ordered by id shift while the list changes: a record
+added before the offset (created or now matching the filters) moves the rows
+forward, so the next page repeats a row, and a record removed before the offset
+(deleted or no longer matching the filters) moves them back, so a row between
+the pages is skipped.
+
+The guard keeps the seen ids sorted in an int array to drop the repeated rows.
+Skipped rows lie between the last id of a page and the first id of the next
+one, where no row was seen, so only these gaps are fetched again: the ones
+where the count changed between the pages or a row repeated, or all of them
+when fewer rows than the final count were seen.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Callable, Iterable
+
+
+class SeenIds:
+    """Set of integer ids kept as a sorted array, 8 bytes per id. Ids added in
+    ascending order, like the pages of a list ordered by id, are appended.
+    """
+
+    def __init__(self, ids: Iterable = ()) -> None:
+        self._ids = array("q", sorted(set(ids)))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, _id) -> bool:
+        index = bisect_left(self._ids, _id)
+        return index < len(self._ids) and self._ids[index] == _id
+
+    def add(self, _id: int) -> bool:
+        """Add id, returns False if it was already seen"""
+        if not self._ids or _id > self._ids[-1]:
+            self._ids.append(_id)
+            return True
+        if _id in self:
+            return False
+        insort(self._ids, _id)
+        return True
+
+
+class PaginationGuard:
+    """Drop repeated rows of an offset pagination and find the skipped ones
+
+    Args:
+        records (Iterable, Optional): Records of the first page
+        count (int, Optional): Count of the first page response
+    """
+
+    def __init__(self, records: Iterable = (), count: int = None) -> None:
+        self.seen = SeenIds()
+        self.gaps: list = []  # (last id of a page, first id of next, suspect)
+        self.duplicates = 0  # Repeated rows dropped
+        self.recovered = 0  # Skipped rows found by find_missing
+        self._last_id = None
+        self._count = count
+        self.filter(list(records), count)
+
+    def filter(self, page: list, count: int = None) -> list:
+        """Get records of page not seen before, recording the gap before it
+
+        Args:
+            page (list, Mandatory): Records of page, sorted by id
+            count (int, Optional): Count of the page response
+        """
+        if not page:
+            return page
+
+        records = [record for record in page if self.seen.add(record["id"])]
+        duplicates = len(page) - len(records)
+        self.duplicates += duplicates
+        if self._last_id is not None and records:
+            suspect = bool(duplicates) or count != self._count
+            self.gaps.append((self._last_id, records[0]["id"], suspect))
+        if records and (self._last_id is None or records[-1]["id"] > self._last_id):
+            self._last_id = records[-1]["id"]
+        self._count = count
+        return records
+
+    def unresolved(self, count: int) -> int:
+        """Get number of rows of count not seen"""
+        return max(count - len(self.seen), 0)
+
+    def find_missing(self, count: int, fetch_range: Callable) -> list:
+        """Fetch rows skipped by the pagination, sorted by id
+
+        Args:
+            count (int, Mandatory): Number of rows of the list on the last page
+            fetch_range (Callable, Mandatory): fetch_range(lower, upper) iterates
+                over rows with lower < id < upper
+        """
+        check_all = self.unresolved(count) > 0
+        missing = []
+        for lower, upper, suspect in self.gaps:
+            if upper - lower <= 1 or not (suspect or check_all):
+                continue  # No id fits in gap, or no sign of a shift
+
+            for record in fetch_range(lower, upper):
+                if self.seen.add(record["id"]):
+                    missing.append(record)
+
+        self.recovered += len(missing)
+        return sorted(missing, key=lambda record: record["id"])
@@ -19,3 +19,17 @@ class ServerErrorException(PeopleControlExceptions):
 
     def __init__(self, message: str) -> None:
         super().__init__(f"ERROR: {message}")
+
+
+class CircuitOpenException(PeopleControlExceptions):
+    """Api calls halted by an open circuit breaker"""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f"ERROR: {message}")
+
+
+class DeadlineExceededException(PeopleControlExceptions):
+    """Operation didn't finish before its deadline"""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f"ERROR: {message}")
@@ -0,0 +1,296 @@
+"""This module provide hooks and metrics to instrument api calls"""
+
+import logging
+import threading
+from bisect import bisect_left
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = (
+    "before_request",  # method, url, endpoint
+    # method, url, endpoint, status_code, elapsed, bytes_in, bytes_in_compressed,
+    # bytes_out, content_encoding, error
+    "after_response",
+    "on_retry",  # url, endpoint, attempt, error, delay
+    # url, endpoint, page, records, elapsed and, only on streamed pages, whose
+    # after_response has no bytes, bytes_in and bytes_in_compressed
+    "on_page",
+    # endpoint, pages, records, elapsed, completed (False when the iteration
+    # stopped early or failed)
+    "after_pagination",
+)
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+PAGES_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class Hooks:
+    """Registry of callbacks called on api request events (see HOOK_EVENTS).
+    Callbacks receive the event data as keyword arguments and their errors are
+    logged without interrupting the request.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: dict = {event: [] for event in HOOK_EVENTS}
+
+    def register(self, event: str, callback: Callable) -> Callable:
+        """Register callback to event, returns the callback."""
+        if event not in self._callbacks:
+            raise ValueError(f"Event must be one of {HOOK_EVENTS}.")
+
+        self._callbacks[event] = [*self._callbacks[event], callback]
+        return callback
+
+    def unregister(self, event: str, callback: Callable):
+        """Remove callback from event."""
+        self._callbacks[event] = [
+            registered
+            for registered in self._callbacks[event]
+            if registered != callback
+        ]
+
+    def has(self, event: str) -> bool:
+        """Check if event has callbacks registered."""
+        return bool(self._callbacks[event])
+
+    def emit(self, event: str, **data):
+        """Call callbacks registered to event with data."""
+        for callback in self._callbacks[event]:
+            try:
+                callback(**data)
+
+            except Exception:
+                logger.exception("Error on %s hook %r", event, callback)
+
+
+default_hooks = Hooks()  # Hooks of endpoints created without a client
+
+
+class Histogram:
+    """Cumulative histogram in prometheus style"""
+
+    def __init__(self, buckets: tuple) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """Get (upper bound, cumulative count) pairs, last bound is +Inf"""
+        result, total = [], 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsCollector:
+    """Collect per endpoint and method metrics of api calls: latency
+    histograms, bytes in/out (decoded and as received, compressed), status
+    codes, retries and pages per pagination.
+
+    Args:
+        hooks (Hooks, Optional): Hooks to register the collector on
+        prefix (str, Optional): Prefix of exported metric names
+    """
+
+    def __init__(self, hooks: Hooks = None, prefix: str = "mindsight_cp") -> None:
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.reset()
+        if hooks is not None:
+            self.register(hooks)
+
+    def reset(self):
+        """Clear collected metrics."""
+        with self._lock:
+            self.latency: dict = {}  # (endpoint, method) -> Histogram
+            self.bytes_in: dict = {}  # endpoint -> int
+            self.bytes_in_compressed: dict = {}  # endpoint -> int
+            self.bytes_out: dict = {}  # endpoint -> int
+            self.status_codes: dict = {}  # (endpoint, method, status) -> int
+            self.errors: dict = {}  # (endpoint, method, error type) -> int
+            self.retries: dict = {}  # endpoint -> int
+            self.pages: dict = {}  # endpoint -> Histogram
+
+    def register(self, hooks: Hooks):
+        """Register collector callbacks on hooks."""
+        hooks.register("after_response", self.on_response)
+        hooks.register("on_retry", self.on_retry)
+        hooks.register("on_page", self.on_page)
+        hooks.register("after_pagination", self.on_pagination)
+
+    def unregister(self, hooks: Hooks):
+        """Remove collector callbacks from hooks."""
+        hooks.unregister("after_response", self.on_response)
+        hooks.unregister("on_retry", self.on_retry)
+        hooks.unregister("on_page", self.on_page)
+        hooks.unregister("after_pagination", self.on_pagination)
+
+    @staticmethod
+    def _increment(counter: dict, key, value: int = 1):
+        counter[key] = counter.get(key, 0) + value
+
+    def on_response(
+        self,
+        method: str,
+        endpoint: str,
+        elapsed: float,
+        status_code: int = None,
+        bytes_in: int = 0,
+        bytes_in_compressed: int = 0,
+        bytes_out: int = 0,
+        error: Exception = None,
+        **kwargs,
+    ):
+        """after_response hook"""
+        with self._lock:
+            if (endpoint, method) not in self.latency:
+                self.latency[(endpoint, method)] = Histogram(LATENCY_BUCKETS)
+            self.latency[(endpoint, method)].observe(elapsed)
+            self._increment(self.bytes_in, endpoint, bytes_in or 0)
+            self._increment(
+                self.bytes_in_compressed, endpoint, bytes_in_compressed or 0
+            )
+            self._increment(self.bytes_out, endpoint, bytes_out or 0)
+            if status_code is not None:
+                self._increment(self.status_codes, (endpoint, method, status_code))
+            if error is not None:
+                self._increment(self.errors, (endpoint, method, type(error).__name__))
+
+    def on_retry(self, endpoint: str, **kwargs):
+        """on_retry hook"""
+        with self._lock:
+            self._increment(self.retries, endpoint)
+
+    def on_page(
+        self,
+        endpoint: str,
+        bytes_in: int = None,
+        bytes_in_compressed: int = None,
+        **kwargs,
+    ):
+        """on_page hook, counts bytes of streamed pages"""
+        if bytes_in is None:
+            return
+
+        with self._lock:
+            self._increment(self.bytes_in, endpoint, bytes_in)
+            self._increment(
+                self.bytes_in_compressed, endpoint, bytes_in_compressed or 0
+            )
+
+    def on_pagination(self, endpoint: str, pages: int, **kwargs):
+        """after_pagination hook"""
+        with self._lock:
+            if endpoint not in self.pages:
+                self.pages[endpoint] = Histogram(PAGES_BUCKETS)
+            self.pages[endpoint].observe(pages)
+
+    @staticmethod
+    def _labels(**labels) -> str:
+        content = ",".join(
+            f'{key}="{str(value)}"'
+            for key, value in labels.items()
+            if value is not None
+        )
+        return f"{{{content}}}"
+
+    def _histogram_lines(self, name: str, histogram: Histogram, **labels) -> list:
+        lines = []
+        for bound, count in histogram.cumulative():
+            bound = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(f"{name}_bucket{self._labels(**labels, le=bound)} {count}")
+        lines.append(f"{name}_sum{self._labels(**labels)} {histogram.sum:.6f}")
+        lines.append(f"{name}_count{self._labels(**labels)} {histogram.count}")
+        return lines
+
+    def to_prometheus(self) -> str:
+        """Export metrics in prometheus text exposition format."""
+        prefix = self.prefix
+        with self._lock:
+            lines = [
+                f"# HELP {prefix}_request_duration_seconds Api request latency.",
+                f"# TYPE {prefix}_request_duration_seconds histogram",
+            ]
+            for (endpoint, method), histogram in sorted(self.latency.items()):
+                lines.extend(
+                    self._histogram_lines(
+                        f"{prefix}_request_duration_seconds",
+                        histogram,
+                        endpoint=endpoint,
+                        method=method,
+                    )
+                )
+
+            counters = (
+                (
+                    "response_bytes_total",
+                    "Bytes received, decompressed.",
+                    self.bytes_in,
+                    ("endpoint",),
+                ),
+                (
+                    "response_compressed_bytes_total",
+                    "Bytes received as transferred, before decompression.",
+                    self.bytes_in_compressed,
+                    ("endpoint",),
+                ),
+                ("request_bytes_total", "Bytes sent.", self.bytes_out, ("endpoint",)),
+                (
+                    "responses_total",
+                    "Responses by status code.",
+                    self.status_codes,
+                    ("endpoint", "method", "status"),
+                ),
+                (
+                    "request_errors_total",
+                    "Requests without response.",
+                    self.errors,
+                    ("endpoint", "method", "error"),
+                ),
+                ("retries_total", "Retried requests.", self.retries, ("endpoint",)),
+            )
+            for name, description, counter, label_names in counters:
+                lines.append(f"# HELP {prefix}_{name} {description}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for key, value in sorted(counter.items()):
+                    key = key if isinstance(key, tuple) else (key,)
+                    labels = self._labels(**dict(zip(label_names, key)))
+                    lines.append(f"{prefix}_{name}{labels} {value}")
+
+            lines.append(f"# HELP {prefix}_pagination_pages Pages per pagination.")
+            lines.append(f"# TYPE {prefix}_pagination_pages histogram")
+            for endpoint, histogram in sorted(self.pages.items()):
+                lines.extend(
+                    self._histogram_lines(
+                        f"{prefix}_pagination_pages", histogram, endpoint=endpoint
+                    )
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> list:
+        """Get metrics summary by endpoint and method, slowest first."""
+        with self._lock:
+            rows = [
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "requests": histogram.count,
+                    "total_seconds": histogram.sum,
+                    "mean_seconds": histogram.sum / histogram.count,
+                    "bytes_in": self.bytes_in.get(endpoint, 0),
+                    "bytes_in_compressed": self.bytes_in_compressed.get(endpoint, 0),
+                    "retries": self.retries.get(endpoint, 0),
+                }
+                for (endpoint, method), histogram in self.latency.items()
+                if histogram.count
+            ]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
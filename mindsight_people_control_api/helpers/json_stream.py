@@ -0,0 +1,150 @@
+"""This module provide an incremental parser of list responses.
+
+A list page is a json object like {"count": 1, "next": null, "previous": null,
+"results": [...]}. The parser decodes the body chunk by chunk and yields each
+item of the results array as soon as it is complete, so records are used
+before the whole page is downloaded and only the undecoded tail of the body is
+kept in memory. The other fields are available in fields after the iteration.
+"""
+
+import codecs
+import json
+import re
+from typing import Iterable, Iterator
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ResultsStream:
+    """Iterate over items of an array field of a json object read in chunks
+
+    Args:
+        chunks (Iterable, Mandatory): Body chunks, bytes or str, like
+            response.iter_content(chunk_size)
+        field (str, Optional): Array field to stream
+
+    Example:
+        stream = ResultsStream(response.iter_content(65536))
+        for record in stream:
+            ...
+        stream.fields["next"]
+    """
+
+    def __init__(self, chunks: Iterable, field: str = "results") -> None:
+        self.field = field
+        self.fields: dict = {}  # Other fields of object, complete after iteration
+        self.bytes_read = 0
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._finished = False  # All chunks read
+        self._iterator = self._parse()
+
+    def __iter__(self) -> Iterator:
+        return self._iterator
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def _fill(self) -> bool:
+        """Read next chunk into buffer, returns False at the end of body"""
+        if self._finished:
+            return False
+
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            if isinstance(chunk, bytes):
+                self.bytes_read += len(chunk)
+                chunk = self._text_decoder.decode(chunk)
+            else:
+                self.bytes_read += len(chunk.encode())
+            self._buffer += chunk
+            return True
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._finished = True
+        return False
+
+    def _peek(self) -> str:
+        """Get next non whitespace char, without consuming it"""
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                raise json.JSONDecodeError(
+                    "Unexpected end of body", self._buffer, self._position
+                )
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self._buffer, self._position
+            )
+        self._position += 1
+        return char
+
+    def _decode(self):
+        """Decode next json value. A value ending at the end of buffer may be
+        incomplete (numbers, literals), so it is decoded again with more data.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                if end < len(self._buffer) or self._finished:
+                    self._position = end
+                    return value
+
+            except json.JSONDecodeError:
+                if self._finished:
+                    raise
+            self._fill()
+
+    def _items(self) -> Iterator:
+        """Yield items of array until its closing bracket"""
+        decode = self._decoder.raw_decode
+        while True:
+            # Fast path for compact json: item directly followed by a comma
+            buffer, position = self._buffer, self._position
+            if position < len(buffer) and buffer[position] in " \t\n\r":
+                position = WHITESPACE.match(buffer, position).end()
+            try:
+                value, end = decode(buffer, position)
+            except json.JSONDecodeError:
+                end = len(buffer)
+            if end < len(buffer) and buffer[end] == ",":
+                self._position = end + 1
+                yield value
+                continue
+
+            yield self._decode()
+            if self._expect(",]") == "]":
+                return
+
+    def _parse(self) -> Iterator:
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            key = self._decode()
+            self._expect(":")
+            if key == self.field and self._peek() == "[":
+                self._position += 1
+                if self._peek() == "]":
+                    self._position += 1
+                else:
+                    yield from self._items()
+            else:
+                self.fields[key] = self._decode()
+
+            if self._expect(",}") == "}":
+                return
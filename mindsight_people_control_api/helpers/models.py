@@ -1,11 +1,68 @@
 """This module provide helpers classes to represent objects"""
 
-from time import sleep
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Tuple, Union
+from urllib.parse import urlencode
 
 import requests
 
 from mindsight_people_control_api.helpers.base_requests import BaseRequests
-from mindsight_people_control_api.settings import PAGE_SIZE, TIMEOUT
+from mindsight_people_control_api.helpers.checkpoints import CheckpointStore
+from mindsight_people_control_api.helpers.compression import wire_bytes
+from mindsight_people_control_api.helpers.config import (
+    ENDPOINT_TIMEOUT_FIELDS,
+    ClientConfig,
+)
+from mindsight_people_control_api.helpers.consistency import PaginationGuard
+from mindsight_people_control_api.helpers.exceptions import (
+    CircuitOpenException,
+    DeadlineExceededException,
+    PeopleControlExceptions,
+)
+from mindsight_people_control_api.helpers.instrumentation import Hooks, default_hooks
+from mindsight_people_control_api.helpers.json_stream import ResultsStream
+from mindsight_people_control_api.helpers.page_size import PageSizeTuner
+from mindsight_people_control_api.helpers.record_cache import RecordCache
+from mindsight_people_control_api.helpers.references import ReferenceCache
+from mindsight_people_control_api.helpers.tracing import (
+    NoopTracer,
+    Span,
+    current_span,
+    noop_tracer,
+)
+from mindsight_people_control_api.settings import (
+    KEYSET_CURSOR_PARAMETER,
+    STREAM_CHUNK_SIZE,
+    TIMEOUT,
+)
+from mindsight_people_control_api.utils.aux_functions import prefetch_iterator
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_MODES = ("offset", "keyset")
+PAGINATION_STATE_FIELDS = ("count", "next", "previous", "cursor", "pages")
+
+
+class RetrieveResult(NamedTuple):
+    """Result of an id in ApiEndpoint.retrieve_many, record or error"""
+
+    id: Any
+    result: dict = None
+    error: Exception = None
+
+
+class BulkResult(NamedTuple):
+    """Result of an item of a bulk write, by its key: record or error"""
+
+    key: Any
+    result: dict = None
+    error: Exception = None
 
 
 class Timeout(object):
@@ -27,25 +84,98 @@ class Timeout(object):
 
 
 class ApiEndpoint:
-    """This class represents a base api endpoint classes"""
+    """This class represents a base api endpoint classes
+
+    Args:
+        base_path (str, Mandatory): Endpoint path
+        client (Client, Optional): Client owning configuration, connection pool
+            and caches. Without it the endpoint uses the module settings.
+    """
 
-    def __init__(self, base_path: str) -> None:
-        self._base_requests: BaseRequests = BaseRequests()
+    def __init__(self, base_path: str, client=None) -> None:
+        self._client = client
+        config = client.config if client else ClientConfig()
+        self._base_requests: BaseRequests = BaseRequests(
+            config=config,
+            session=client.session if client else None,
+            hooks=client.hooks if client else None,
+            tracer=client.tracer if client else None,
+            transport=client.transport if client else None,
+        )
         self._base_requests.base_path = base_path
-        self._page_size: int = PAGE_SIZE
+        for name, value in config.endpoint_timeouts.get(base_path, {}).items():
+            if name not in ENDPOINT_TIMEOUT_FIELDS:
+                raise ValueError(
+                    f"Endpoint timeouts must be in {ENDPOINT_TIMEOUT_FIELDS}."
+                )
+            setattr(self, name, value)
+        cache = RecordCache(max_size=config.cache_size, ttl=config.cache_ttl)
+        self._cache: RecordCache = (
+            client.caches.setdefault(base_path, cache) if client else cache
+        )
+        self._base_requests.on_write = self._evict
+        self._page_size: int = config.page_size
+        self._page_size_tuner: PageSizeTuner = None
+        self._pagination: str = config.pagination
+        self.cursor_parameter: str = KEYSET_CURSOR_PARAMETER
+        self._local = threading.local()
+        self._references: ReferenceCache = None
+
+    @property
+    def references(self) -> ReferenceCache:
+        """Get code -> id reference cache, shared by the endpoints of a client."""
+        if self._client:
+            return self._client.references
+        if self._references is None:
+            self._references = ReferenceCache()
+        return self._references
+
+    def _add_reference(self, entity: str, record: dict):
+        """Add record written by this endpoint to its reference cache, when
+        there is one, without creating it
+        """
+        references = self._client.references if self._client else self._references
+        if references is not None:
+            references.add(entity, record)
+
+    def _reference_id(self, entity: str, _id: int = None, code: str = None) -> int:
+        """Get the informed id, or the id resolved from code when it is missing"""
+        if _id is None and code is not None:
+            return self.references.resolve(entity, code)
+        return _id
 
     @property
     def page_size(self) -> int:
         """Get number of records per page."""
+        if self._page_size_tuner:
+            return self._page_size_tuner.page_size
         return self._page_size
 
     @page_size.setter
-    def page_size(self, value: int):
+    def page_size(self, value: Union[int, str]):
+        """Set number of records per page, or "auto" to tune it automatically."""
+        if value == "auto":
+            self.auto_page_size()
+            return
 
         if value <= 0:
             raise ValueError("Page size can be > 0.")
 
         self._page_size = value
+        self._page_size_tuner = None
+
+    def auto_page_size(self, **kwargs) -> PageSizeTuner:
+        """Tune page size from observed latency and payload size of list requests.
+        In keyset pagination the page size also changes between pages of the
+        same list, in offset pagination only between list requests.
+
+        Args:
+            kwargs: PageSizeTuner arguments (target_latency, min_size, max_size,
+                max_page_bytes, smoothing)
+        """
+        kwargs.setdefault("initial", self._page_size)
+        self._page_size_tuner = PageSizeTuner(**kwargs)
+        return self._page_size_tuner
 
     @property
     def timeout(self) -> int:
@@ -59,11 +189,206 @@ class ApiEndpoint:
             raise ValueError("Timeout can be > 0.")
 
         self._base_requests.timeout = value
-        Timeout.timeout = value
+
+    @property
+    def connect_timeout(self) -> float:
+        """Get connect timeout seconds."""
+        return self._base_requests.connect_timeout
+
+    @connect_timeout.setter
+    def connect_timeout(self, value: float):
+        """Set connect timeout of requests."""
+        if value <= 0:
+            raise ValueError("Connect timeout can be > 0.")
+
+        self._base_requests.connect_timeout = value
+
+    @property
+    def deadline(self) -> float:
+        """Get seconds to finish an operation of this endpoint."""
+        return self._base_requests.deadline
+
+    @deadline.setter
+    def deadline(self, value: float):
+        """Set seconds to finish an operation, including all pages and retries
+        of a pagination counted from the list call, None to disable.
+        """
+        if value is not None and value <= 0:
+            raise ValueError("Deadline can be > 0.")
+
+        self._base_requests.deadline = value
+
+    @property
+    def pagination(self) -> str:
+        """Get pagination mode used by list methods."""
+        return self._pagination
+
+    @pagination.setter
+    def pagination(self, value: str):
+        """Set pagination mode: "offset" follows server next links and "keyset"
+        requests each page filtering by the last seen id (see cursor_parameter).
+        """
+        if value not in PAGINATION_MODES:
+            raise ValueError(f"Pagination mode must be one of {PAGINATION_MODES}.")
+
+        self._pagination = value
+
+    def _generate_url(self, base_path: str, path: str) -> str:
+        """Generate a URL of the endpoint api instance, like related hyperlinks"""
+        return self._base_requests.generate_url(path=path, base_path=base_path)
+
+    def _paginate(self, path: str, parameters: dict) -> "ApiPaginationResponse":
+        """Request first page of a list endpoint and wrap it in a pagination response"""
+        count_only = getattr(self._local, "count_only", False)
+        base_path = self._base_requests.base_path
+        span = self._base_requests.tracer.start_span(
+            f"{base_path} {'count' if count_only else 'list'}",
+            attributes={
+                "mindsight.endpoint": base_path,
+                "mindsight.pagination": self._pagination,
+            },
+            parent=current_span(),
+        )
+        if count_only:
+            with span:
+                parameters["page_size"] = 1
+                response_data = self._base_requests.get(
+                    path=path, parameters=parameters, trace_parent=span
+                )
+                return ApiPaginationResponse(
+                    count=response_data["count"], base_requests=self._base_requests
+                )
+
+        # The list span is ended by the pagination, once iterated
+        try:
+            start = perf_counter()
+            deadline = self._base_requests.deadline_at()
+            response_data = self._base_requests.get(
+                path=path, parameters=parameters, deadline=deadline, trace_parent=span
+            )
+            if self._page_size_tuner:
+                self._page_size_tuner.observe(
+                    elapsed=perf_counter() - start,
+                    records=len(response_data.get("results") or []),
+                )
+            span.set_attribute("mindsight.count", response_data.get("count"))
+
+        except Exception as error:
+            if self._page_size_tuner:
+                self._page_size_tuner.observe_failure()
+            span.record_exception(error)
+            span.end()
+            raise
+
+        return ApiPaginationResponse(
+            **response_data,
+            base_requests=self._base_requests,
+            url=self._base_requests.generate_url(path=path),
+            parameters=parameters,
+            pagination=self._pagination,
+            cursor_parameter=self.cursor_parameter,
+            page_size_tuner=self._page_size_tuner,
+            deadline=deadline,
+            span=span,
+        )
+
+    def _count(self, list_method: Callable, **filters) -> int:
+        """Call list method requesting only one record per page and return count"""
+        self._local.count_only = True
+        try:
+            return list_method(**filters).count
+
+        finally:
+            self._local.count_only = False
+
+    def _retrieve(self, _id, trace_parent: Span = None) -> dict:
+        """Request record of id and keep it in endpoint cache"""
+        record = self._base_requests.get(path=f"/{_id}", trace_parent=trace_parent)
+        self._cache.set(("retrieve", str(_id)), record)
+        return record
+
+    def _evict(self, path: str):
+        """Forget cached record written through path, or all records when the
+        path doesn't start with an id.
+        """
+        segment = path.strip("/").split("/")[0]
+        if segment.isdigit():
+            self._cache.evict(("retrieve", segment))
+        elif segment:
+            self._cache.clear()
+
+    def retrieve_many(
+        self, ids: Iterable, max_workers: int = 8, use_cache: bool = False
+    ) -> Iterator[RetrieveResult]:
+        """Retrieve records of many ids concurrently, yielding a RetrieveResult
+        per id in input order. Repeated ids are requested once and failed ids
+        yield their error instead of interrupting the others.
+
+        Args:
+            ids (Iterable, Mandatory): Ids of records
+            max_workers (int, Optional): Maximum concurrent requests, keep it up
+                to the client pool_maxsize
+            use_cache (bool, Optional): Serve records retrieved before by this
+                endpoint, up to the client cache_ttl. Records written through
+                the endpoint are requested again.
+        """
+        ids = list(ids)
+        cached = {}
+        if use_cache:
+            for _id in dict.fromkeys(ids):
+                record = self._cache.get(("retrieve", str(_id)))
+                if record is not None:
+                    cached[_id] = record
+        pending = [_id for _id in dict.fromkeys(ids) if _id not in cached]
+        base_path = self._base_requests.base_path
+        # Generator: the span is passed to the requests, not set in the context
+        with self._base_requests.tracer.start_span(
+            f"{base_path} retrieve_many",
+            attributes={
+                "mindsight.endpoint": base_path,
+                "mindsight.count": len(pending),
+            },
+            parent=current_span(),
+        ) as span:
+            window = max_workers * 2  # Requests ahead of the consumed id
+            futures: dict = {}
+            outcomes: dict = {}
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                submitted = consumed = 0
+                for _id in ids:
+                    while submitted < len(pending) and submitted - consumed < window:
+                        futures[pending[submitted]] = executor.submit(
+                            self._retrieve, pending[submitted], span
+                        )
+                        submitted += 1
+
+                    if _id in futures:
+                        future = futures.pop(_id)
+                        consumed += 1
+                        try:
+                            outcomes[_id] = RetrieveResult(_id, result=future.result())
+
+                        except Exception as error:
+                            outcomes[_id] = RetrieveResult(_id, error=error)
+
+                    if _id in outcomes:
+                        yield outcomes[_id]
+                    else:
+                        yield RetrieveResult(_id, result=cached[_id])
+
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
 
 
 class ApiPaginationResponse:
-    """Class to work with paginated responses"""
+    """Class to work with paginated responses
+
+    In "offset" pagination the next pages are requested following the server
+    next links. In "keyset" pagination the next page is requested with the
+    original url and parameters filtering ids greater than the last seen id
+    (cursor), so every page costs the same no matter how deep it is.
+    """
 
     results: list = []
 
@@ -73,6 +398,14 @@ class ApiPaginationResponse:
         previous: str = None,
         results: list = None,
         headers: dict = None,
+        base_requests: BaseRequests = None,
+        url: str = None,
+        parameters: dict = None,
+        pagination: str = "offset",
+        cursor_parameter: str = KEYSET_CURSOR_PARAMETER,
+        page_size_tuner: PageSizeTuner = None,
+        deadline: float = None,
+        span: Span = None,
         **kwargs,
     ) -> None:
         self.count = count
@@ -80,39 +413,612 @@ class ApiPaginationResponse:
         self.previous = previous
         self.results = results if results else []
         self.__headers = headers
-        self.timeout = (
-            Timeout.timeout if isinstance(Timeout.timeout, int) else Timeout._timeout
-        )
+        self._base_requests = base_requests
+        if base_requests:
+            self.timeout = base_requests.timeout
+        else:
+            self.timeout = (
+                Timeout.timeout
+                if isinstance(Timeout.timeout, int)
+                else Timeout._timeout
+            )
+        self.url = url
+        self.parameters = parameters if parameters else {}
+        self.pagination = pagination
+        self.cursor_parameter = cursor_parameter
+        self.page_size_tuner = page_size_tuner
+        self.deadline = deadline  # Monotonic time limit of pagination
+        self.span = span  # Span of the list call, parent of iteration spans
+        # Ends once, after an iteration or when the pagination is collected
+        self._end_span = None
+        if span is not None and self._tracer.enabled:
+            self._end_span = weakref.finalize(self, span.end)
+        self.guard: PaginationGuard = None  # Guard of last consistent pagination
+        self.cursor = self.results[-1].get("id") if self.results else None
+        self.pages = 1 if self.results else 0
+
+    def end_span(self):
+        """End the list span, parent of the iteration spans. Iterations end it
+        when they finish, otherwise it ends when the pagination is collected.
+        """
+        if self._end_span is not None:
+            self._end_span()
+
+    @contextmanager
+    def _iteration_span(self, operation: str, attributes: dict) -> Iterator[Span]:
+        """Start span of an iteration, child of the list span, which is ended
+        after it
+        """
+        try:
+            with self._tracer.start_span(
+                f"{self._endpoint} {operation}",
+                attributes={
+                    "mindsight.endpoint": self._endpoint,
+                    "mindsight.pagination": self.pagination,
+                    **attributes,
+                },
+                parent=self.span,
+            ) as span:
+                yield span
+
+        finally:
+            self.end_span()
+
+    def _keyset_url(self, cursor: int) -> str:
+        """Build url of the page placed after the cursor id"""
+        parameters = {
+            key: value
+            for key, value in self.parameters.items()
+            if value is not None and key not in ("page", self.cursor_parameter)
+        }
+        parameters["ordering"] = "id"
+        parameters[self.cursor_parameter] = cursor
+        if self.page_size_tuner:
+            parameters["page_size"] = self.page_size_tuner.page_size
+        return f"{self.url}?{urlencode(parameters)}"
+
+    def _state(self) -> dict:
+        """Get current pagination state"""
+        return {field: getattr(self, field) for field in PAGINATION_STATE_FIELDS}
+
+    def _next_url(self, state: dict = None) -> str:
+        """Get url of next page according pagination mode"""
+        state = state if state is not None else self._state()
+        if not state["next"]:
+            return None
+
+        if self.pagination == "keyset" and self.url and state["cursor"] is not None:
+            return self._keyset_url(state["cursor"])
+
+        return state["next"]
 
-    def get_all(self, retries: int = 1):
-        """Get all pages of data"""
-        if self.next:
+    @property
+    def _hooks(self) -> Hooks:
+        return self._base_requests.hooks if self._base_requests else default_hooks
+
+    @property
+    def _tracer(self) -> NoopTracer:
+        return self._base_requests.tracer if self._base_requests else noop_tracer
+
+    @property
+    def _endpoint(self) -> str:
+        return self._base_requests.base_path if self._base_requests else None
+
+    def _request_page(
+        self,
+        url: str,
+        retries: int,
+        page: int = None,
+        span: Span = None,
+        stream: bool = False,
+    ) -> Union[dict, requests.Response]:
+        """Request a page of data, retrying on errors. Streamed pages return the
+        response once its headers are received, to read the body with
+        ResultsStream.
+        """
+        attempt = 0
+        while True:
+            response = None
             try:
-                response = requests.get(
-                    url=self.next,
-                    headers=self.__headers,
-                    timeout=self.timeout,
-                )
+                start = perf_counter()
+                if self._base_requests:
+                    response = self._base_requests.get_url(
+                        url=url,
+                        trace_parent=span,
+                        trace_attributes={
+                            "mindsight.page": page,
+                            "mindsight.retry_attempt": attempt,
+                        },
+                        deadline=self.deadline,
+                        stream=stream,
+                    )
+                else:
+                    response = requests.get(
+                        url=url,
+                        headers=self.__headers,
+                        timeout=self.timeout,
+                        stream=stream,
+                    )
                 response.raise_for_status()
+                if stream:
+                    return response
 
-            except Exception as error:
-                if retries > 0:
-                    print(f"Error on try get {self.next}: {error}")
-                    print("Retry in 30s...")
-                    sleep(30)
-                    self.get_all(retries=retries - 1)
+                response_data = response.json()
+                if self.page_size_tuner:
+                    self.page_size_tuner.observe(
+                        elapsed=perf_counter() - start,
+                        records=len(response_data["results"]),
+                        n_bytes=len(response.content),
+                    )
+                return response_data
 
-                else:
+            except (CircuitOpenException, DeadlineExceededException):
+                raise  # Retrying can't succeed before the breaker or deadline
+
+            except Exception as error:
+                if stream and response is not None:
+                    response.close()  # Release the connection of the unread body
+                if self.page_size_tuner:
+                    self.page_size_tuner.observe_failure()
+                if retries <= 0:
                     raise error
 
-            response_data = response.json()
+                if self.deadline is not None and monotonic() + 30 >= self.deadline:
+                    raise DeadlineExceededException(
+                        f"Deadline of {self._endpoint} pagination exceeded: {error}"
+                    ) from error
+
+                retries -= 1
+                attempt += 1
+                self._hooks.emit(
+                    "on_retry",
+                    url=url,
+                    endpoint=self._endpoint,
+                    attempt=attempt,
+                    error=error,
+                    delay=30,
+                )
+                logger.warning("Error on try get %s: %s. Retry in 30s...", url, error)
+                sleep(30)
+
+    def _range_url(self, lower: int, upper: int) -> str:
+        """Build url of the list rows with lower < id < upper"""
+        parameters = {
+            key: value
+            for key, value in self.parameters.items()
+            if value is not None
+            and key not in ("page", self.cursor_parameter, "id__gt", "id__lt")
+        }
+        parameters.update(ordering="id", id__gt=lower, id__lt=upper)
+        return f"{self.url}?{urlencode(parameters)}"
+
+    def _range_records(
+        self, lower: int, upper: int, retries: int, span: Span = None
+    ) -> Iterator[dict]:
+        url = self._range_url(lower, upper)
+        while url:
+            response_data = self._request_page(url=url, retries=retries, span=span)
+            yield from response_data["results"]
+            url = response_data["next"]
+
+    def _fetch_pages(
+        self, retries: int = 1, span: Span = None, guard: PaginationGuard = None
+    ) -> Iterator[Tuple[list, dict]]:
+        """Request next pages and yield each page results with the pagination
+        state after it, without changing the current state. With a guard the
+        repeated rows are dropped and the skipped ones are yielded at the end.
+        """
+        state = self._state()
+        url = self._next_url(state)
+        pagination_start = perf_counter()
+        records = 0
+        completed = False
+        try:
+            while url:
+                start = perf_counter()
+                response_data = self._request_page(
+                    url=url, retries=retries, page=state["pages"] + 1, span=span
+                )
+                page = response_data["results"]
+                records += len(page)
+                self._hooks.emit(
+                    "on_page",
+                    url=url,
+                    endpoint=self._endpoint,
+                    page=state["pages"] + 1,
+                    records=len(page),
+                    elapsed=perf_counter() - start,
+                )
+                if page:
+                    self._check_cursor(state, page[0], url)
+                state = self._page_state(
+                    state, response_data, page[-1] if page else None
+                )
+
+                if guard:
+                    page = guard.filter(page, response_data["count"])
+                yield page, state
+                url = self._next_url(state)
+
+            if guard:
+                missing = guard.find_missing(
+                    state["count"],
+                    fetch_range=partial(
+                        self._range_records, retries=retries, span=span
+                    ),
+                )
+                if missing:
+                    records += len(missing)
+                    yield missing, state
+            completed = True
+
+        finally:
+            # Also emitted when the caller stops iterating or a page fails
+            self._hooks.emit(
+                "after_pagination",
+                endpoint=self._endpoint,
+                pages=state["pages"],
+                records=records,
+                elapsed=perf_counter() - pagination_start,
+                completed=completed,
+            )
+
+    def _check_cursor(self, state: dict, first_record: dict, url: str):
+        """Check that first record of a keyset page is after the cursor"""
+        if (
+            self.pagination == "keyset"
+            and state["cursor"] is not None
+            and first_record.get("id") <= state["cursor"]
+        ):
+            raise PeopleControlExceptions(
+                f"Keyset cursor filter {self.cursor_parameter} was ignored on {url}"
+            )
+
+    def _page_state(
+        self, state: dict, response_data: dict, last_record: dict = None
+    ) -> dict:
+        """Get pagination state after a page, from its fields and last record"""
+        state = {
+            **state,
+            "next": response_data["next"] if last_record else None,
+            "previous": response_data["previous"],
+            "pages": state["pages"] + 1,
+        }
+        if self.pagination != "keyset":
+            # Keyset pages count only the rows after the cursor
+            state["count"] = response_data["count"]
+        if last_record:
+            state["cursor"] = last_record.get("id")
+        return state
+
+    def _stream_results(
+        self,
+        retries: int = 1,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        checkpoint_store: CheckpointStore = None,
+        checkpoint_key: str = None,
+    ) -> Iterator[dict]:
+        """Request next pages with streamed bodies and yield their records as
+        they are decoded, updating pagination state after each page.
+
+        Only the page request is retried: an error while reading the body, after
+        some records were yielded, is raised.
+        """
+        with self._iteration_span("iter_results", {"mindsight.stream": True}) as span:
+            url = self._next_url()
+            pagination_start = perf_counter()
+            records = 0
+            completed = False
+            try:
+                while url:
+                    for record in self._stream_page(url, retries, chunk_size, span):
+                        records += 1
+                        yield record
+                    if checkpoint_store is not None:
+                        self._save_checkpoint(checkpoint_store, checkpoint_key)
+                    url = self._next_url()
+                completed = True
+
+            finally:
+                self._hooks.emit(
+                    "after_pagination",
+                    endpoint=self._endpoint,
+                    pages=self.pages,
+                    records=records,
+                    elapsed=perf_counter() - pagination_start,
+                    completed=completed,
+                )
+            span.set_attributes(
+                {"mindsight.pages": self.pages, "mindsight.count": self.count}
+            )
+
+    def _stream_page(
+        self, url: str, retries: int, chunk_size: int, span: Span = None
+    ) -> Iterator[dict]:
+        """Yield records of a streamed page, then update pagination state"""
+        start = perf_counter()
+        state = self._state()
+        response = self._request_page(
+            url=url, retries=retries, page=state["pages"] + 1, span=span, stream=True
+        )
+        records, last_record = 0, None
+        try:
+            stream = ResultsStream(response.iter_content(chunk_size=chunk_size))
+            for record in stream:
+                if last_record is None:
+                    self._check_cursor(state, record, url)
+                last_record = record
+                records += 1
+                yield record
+            bytes_in_compressed = wire_bytes(response)
+
+        finally:
+            response.close()
+
+        self._hooks.emit(
+            "on_page",
+            url=url,
+            endpoint=self._endpoint,
+            page=state["pages"] + 1,
+            records=records,
+            elapsed=perf_counter() - start,
+            bytes_in=stream.bytes_read,
+            bytes_in_compressed=(
+                stream.bytes_read
+                if bytes_in_compressed is None
+                else bytes_in_compressed
+            ),
+        )
+        if self.page_size_tuner:
+            self.page_size_tuner.observe(
+                elapsed=perf_counter() - start,
+                records=records,
+                n_bytes=stream.bytes_read,
+            )
+        self.results = []
+        for field, value in self._page_state(state, stream.fields, last_record).items():
+            setattr(self, field, value)
+
+    def _next_pages(
+        self,
+        retries: int = 1,
+        prefetch: int = 0,
+        operation: str = "get_all",
+        consistent: bool = False,
+    ) -> Iterator[list]:
+        """Yield next pages results updating pagination state as they are consumed
+
+        Args:
+            retries (int, Optional): Retries of each page request
+            prefetch (int, Optional): Number of pages requested ahead in background
+            operation (str, Optional): Name of operation in tracing span
+            consistent (bool, Optional): Guard offset pagination against rows
+                repeated or skipped while the list changes
+        """
+        guard = None
+        if consistent and self.pagination == "offset" and self.url:
+            guard = self.guard = PaginationGuard(self.results, self.count)
+
+        with self._iteration_span(operation, {"mindsight.prefetch": prefetch}) as span:
+            pages = self._fetch_pages(retries=retries, span=span, guard=guard)
+            if prefetch > 0:
+                pages = prefetch_iterator(pages, depth=prefetch)
+
+            try:
+                for page, state in pages:
+                    for field, value in state.items():
+                        setattr(self, field, value)
+                    yield page
+
+            finally:
+                pages.close()  # Emits after_pagination of a stopped iteration
+
+            span.set_attributes(
+                {"mindsight.pages": self.pages, "mindsight.count": self.count}
+            )
+
+    @staticmethod
+    def _check_consistent(consistent: bool, checkpoint_store: CheckpointStore):
+        if consistent and checkpoint_store is not None:
+            raise ValueError("Consistent pagination can't be used with checkpoints.")
+
+    def seek(self, cursor: int):
+        """Position keyset pagination after the given id, discarding loaded results.
+        Use it to resume a pagination from a checkpointed id.
+
+        Args:
+            cursor (int, Mandatory): Last id already processed
+        """
+        if self.pagination != "keyset" or not self.url:
+            raise ValueError("Seek is only available on keyset pagination.")
+
+        self.results = []
+        self.cursor = cursor
+        self.next = self._keyset_url(cursor)
+        return self
+
+    def _checkpoint_key(self, checkpoint_key: str = None) -> str:
+        """Get checkpoint key, by default the list url with its filters. The
+        page size is left out, it may change between runs (like "auto") while
+        the saved position doesn't depend on it.
+        """
+        if checkpoint_key:
+            return checkpoint_key
+
+        parameters = sorted(
+            (key, str(value))
+            for key, value in self.parameters.items()
+            if value is not None
+            and key not in ("page", "page_size", self.cursor_parameter)
+        )
+        return f"{self.url}?{urlencode(parameters)}"
+
+    def _save_checkpoint(self, checkpoint_store: CheckpointStore, key: str):
+        """Save position of pagination after the current page"""
+        checkpoint_store.save(
+            key,
+            {
+                "next": self._next_url(),
+                "cursor": self.cursor,
+                "count": self.count,
+                "pages": self.pages,
+            },
+        )
+
+    def _restore_checkpoint(self, checkpoint_store: CheckpointStore, key: str) -> bool:
+        """Restore pagination position saved in checkpoint store.
+        Loaded results are discarded because they were processed before.
+        """
+        checkpoint = checkpoint_store.load(key)
+        if not checkpoint:
+            return False
+
+        self.results = []
+        self.next = checkpoint["next"]
+        self.cursor = checkpoint["cursor"]
+        self.count = checkpoint["count"]
+        self.pages = checkpoint["pages"]
+        return True
+
+    def iter_pages(
+        self,
+        retries: int = 1,
+        checkpoint_store: CheckpointStore = None,
+        checkpoint_key: str = None,
+        prefetch: int = 0,
+        consistent: bool = False,
+    ) -> Iterator[list]:
+        """Iterate over pages results, starting with the loaded one.
+        Only the current page is kept in results attribute. Rows skipped by a
+        consistent pagination are yielded as a last page.
+
+        Args:
+            retries (int, Optional): Retries of each page request
+            prefetch (int, Optional): Number of pages requested ahead in background
+                while the current page is processed, 0 to disable
+            checkpoint_store (CheckpointStore, Optional): Store to save the position
+                after each processed page. If a checkpoint exists the iteration
+                resumes from it and the checkpoint is deleted when finished.
+            checkpoint_key (str, Optional): Key of checkpoint, default is the list
+                url with its filters
+            consistent (bool, Optional): On offset pagination, drop rows repeated
+                and fetch rows skipped because the list changed while paginated,
+                see the guard attribute. Can't be used with checkpoints.
+        """
+        self._check_consistent(consistent, checkpoint_store)
+        if checkpoint_store is not None:
+            checkpoint_key = self._checkpoint_key(checkpoint_key)
+            self._restore_checkpoint(checkpoint_store, checkpoint_key)
+
+        if self.results:
+            yield self.results
+            if checkpoint_store is not None:
+                self._save_checkpoint(checkpoint_store, checkpoint_key)
+
+        for page in self._next_pages(
+            retries=retries,
+            prefetch=prefetch,
+            operation="iter_pages",
+            consistent=consistent,
+        ):
+            self.results = page
+            yield page
+            if checkpoint_store is not None:
+                self._save_checkpoint(checkpoint_store, checkpoint_key)
+
+        if checkpoint_store is not None:
+            checkpoint_store.delete(checkpoint_key)
+
+    def iter_results(
+        self,
+        retries: int = 1,
+        prefetch: int = 0,
+        stream: bool = False,
+        checkpoint_store: CheckpointStore = None,
+        checkpoint_key: str = None,
+        consistent: bool = False,
+    ) -> Iterator:
+        """Iterate over records of all pages, see iter_pages arguments
+
+        Args:
+            stream (bool, Optional): Decode records of next pages while their body
+                is downloaded, yielding each one as soon as it is complete. Lowers
+                the time to first record and memory of large pages, can't be used
+                with prefetch.
+        """
+        if not stream:
+            for page in self.iter_pages(
+                retries=retries,
+                prefetch=prefetch,
+                checkpoint_store=checkpoint_store,
+                checkpoint_key=checkpoint_key,
+                consistent=consistent,
+            ):
+                yield from page
+            return
+
+        if prefetch > 0 or consistent:
+            raise ValueError("Prefetch and consistent can't be used with stream.")
+
+        if checkpoint_store is not None:
+            checkpoint_key = self._checkpoint_key(checkpoint_key)
+            self._restore_checkpoint(checkpoint_store, checkpoint_key)
+
+        if self.results:
+            yield from self.results
+            if checkpoint_store is not None:
+                self._save_checkpoint(checkpoint_store, checkpoint_key)
+
+        yield from self._stream_results(
+            retries=retries,
+            checkpoint_store=checkpoint_store,
+            checkpoint_key=checkpoint_key,
+        )
+        if checkpoint_store is not None:
+            checkpoint_store.delete(checkpoint_key)
+
+    def get_all(
+        self,
+        retries: int = 1,
+        checkpoint_store: CheckpointStore = None,
+        checkpoint_key: str = None,
+        consistent: bool = False,
+        partial_ok: bool = False,
+    ):
+        """Get all pages of data
+
+        Args:
+            retries (int, Optional): Retries of each page request
+            checkpoint_store (CheckpointStore, Optional): Store to save the position
+                after each page. When resumed, results only have the missing pages.
+            checkpoint_key (str, Optional): Key of checkpoint, default is the list
+                url with its filters
+            consistent (bool, Optional): On offset pagination, drop rows repeated
+                and fetch rows skipped because the list changed while paginated,
+                see the guard attribute. Can't be used with checkpoints.
+            partial_ok (bool, Optional): Allow resuming from a checkpoint, when
+                results don't have the pages fetched before it. Without it a
+                saved checkpoint raises ValueError, prefer iter_pages to resume.
+        """
+        self._check_consistent(consistent, checkpoint_store)
+        if checkpoint_store is not None:
+            checkpoint_key = self._checkpoint_key(checkpoint_key)
+            if not partial_ok and checkpoint_store.load(checkpoint_key):
+                raise ValueError(
+                    "Resumed get_all results would miss the pages fetched before "
+                    "the checkpoint, use partial_ok=True or iter_pages."
+                )
+            self._restore_checkpoint(checkpoint_store, checkpoint_key)
+
+        for page in self._next_pages(retries=retries, consistent=consistent):
+            self.results.extend(page)
+            if checkpoint_store is not None:
+                self._save_checkpoint(checkpoint_store, checkpoint_key)
 
-            self.results.extend(response_data["results"])
-            self.count = response_data["count"]
-            self.next = response_data["next"]
-            self.previous = response_data["previous"]
+        if checkpoint_store is not None:
+            checkpoint_store.delete(checkpoint_key)
 
-            if self.next:
-                self.get_all()
+        if self.guard and self.guard.recovered:
+            self.results.sort(key=lambda record: record["id"])
 
         return self
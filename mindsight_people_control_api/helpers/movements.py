@@ -0,0 +1,253 @@
+"""This module provide a write filter of employee movements.
+
+Current areas, managers and positions of all employees are bulk loaded from the
+employee areas, managers and positions lists, so each intended change is
+compared locally: changes to the current value are dropped (with
+compare_start_date, only when the start date is also the current one), and
+several changes of the same employee and kind in a batch are merged into the
+latest one. Records are requested without holding the cache lock.
+"""
+
+import threading
+from datetime import date
+from typing import Iterable, List, NamedTuple
+
+from mindsight_people_control_api.helpers.models import BulkResult
+from mindsight_people_control_api.helpers.scheduler import WriteScheduler
+from mindsight_people_control_api.helpers.tracing import operation_span
+from mindsight_people_control_api.utils.aux_functions import related_id
+
+# kind -> (client endpoint property, list method, record field, reference entity)
+MOVEMENT_SOURCES = {
+    "area": ("employee_areas", "get_list_employee_areas", "area", "areas"),
+    "manager": (
+        "employee_managers",
+        "get_list_employee_managers",
+        "manager",
+        "employees",
+    ),
+    "position": (
+        "employee_positions",
+        "get_list_employee_positions",
+        "position",
+        "positions",
+    ),
+}
+
+
+class Movement(NamedTuple):
+    """Change of the current area, manager or position of an employee. The
+    target is given by id or, without target_id, by code (employee code or
+    email of managers).
+    """
+
+    employee_id: int
+    kind: str  # "area", "manager" or "position"
+    target_id: int = None
+    start_date: date = None
+    review_access: bool = False
+    target_code: str = None
+
+
+class CurrentAssignments:
+    """Cache of employee id -> current area, manager or position id
+
+    Args:
+        client (Client, Optional): Client used to load records, default is a
+            client configured by the module settings
+    """
+
+    def __init__(self, client=None) -> None:
+        if client is None:
+            from mindsight_people_control_api.client import Client
+
+            client = Client()
+        self.client = client
+        self._current: dict = {}  # kind -> employee id -> (target id, start date)
+        self._loading: dict = {}  # kind -> lock of its loads
+        self._lock = threading.RLock()
+
+    def _kind_lock(self, kind: str) -> threading.RLock:
+        with self._lock:
+            return self._loading.setdefault(kind, threading.RLock())
+
+    def load(self, kind: str) -> int:
+        """Bulk load current records of kind, replacing the loaded ones. Records
+        without end_date are current; the latest start_date wins.
+        Returns the number of current records.
+
+        Args:
+            kind (str, Mandatory): One of MOVEMENT_SOURCES keys
+        """
+        if kind not in MOVEMENT_SOURCES:
+            raise ValueError(f"Kind must be one of {tuple(MOVEMENT_SOURCES)}.")
+
+        endpoint_name, list_method, field, _ = MOVEMENT_SOURCES[kind]
+        endpoint = getattr(self.client, endpoint_name)
+        with self._kind_lock(kind):
+            current = {}
+            for record in getattr(endpoint, list_method)().iter_results():
+                if record.get("end_date") is not None:
+                    continue
+                employee_id = related_id(record.get("employee"))
+                start_date = record.get("start_date") or ""
+                if employee_id not in current or start_date >= current[employee_id][1]:
+                    current[employee_id] = (related_id(record.get(field)), start_date)
+
+            with self._lock:
+                self._current[kind] = current
+            return len(current)
+
+    def get(self, kind: str, employee_id: int) -> int:
+        """Get current target id of employee, loading kind on first use"""
+        return self.get_assignment(kind, employee_id)[0]
+
+    def get_assignment(self, kind: str, employee_id: int) -> tuple:
+        """Get current (target id, start date in iso format) of employee,
+        loading kind on first use
+        """
+        with self._kind_lock(kind):
+            with self._lock:
+                loaded = kind in self._current
+            if not loaded:
+                self.load(kind)
+
+        with self._lock:
+            return self._current[kind].get(employee_id, (None, ""))
+
+    def set(self, kind: str, employee_id: int, target_id: int, start_date: date):
+        """Record change written by this client, if kind is loaded"""
+        with self._lock:
+            if kind in self._current:
+                self._current[kind][employee_id] = (
+                    target_id,
+                    start_date.isoformat() if start_date else "",
+                )
+
+    def clear(self):
+        """Forget loaded records."""
+        with self._lock:
+            self._current.clear()
+
+
+class MovementFilter:
+    """Send employee movements skipping the ones that change nothing
+
+    Args:
+        client (Client, Optional): Client used to write, default is a client
+            configured by the module settings
+        current (CurrentAssignments, Optional): Cache of current assignments,
+            shared between filters of the same client
+        compare_start_date (bool, Optional): Also send movements to the current
+            target with another start date, default is False
+
+    Example:
+        movements = MovementFilter(client)
+        results = movements.apply(
+            [Movement(10, "area", target_code="SALES", start_date=date.today())]
+        )
+    """
+
+    def __init__(
+        self,
+        client=None,
+        current: CurrentAssignments = None,
+        compare_start_date: bool = False,
+    ) -> None:
+        if client is None:
+            from mindsight_people_control_api.client import Client
+
+            client = Client()
+        self.client = client
+        self.current = current if current else CurrentAssignments(client=client)
+        self.compare_start_date = compare_start_date
+        self.merged = 0  # Movements replaced by a later one of the same batch
+        self.unchanged = 0  # Movements to the current value
+
+    def plan(self, movements: Iterable) -> List[Movement]:
+        """Get minimal movements of batch: the latest one (by start_date, then
+        order) of each employee and kind, when it changes the current value (or
+        its start date, with compare_start_date). Codes are resolved before any
+        request.
+
+        Args:
+            movements (Iterable, Mandatory): Movement objects
+        """
+        employees = self.client.employees
+        latest: dict = {}
+        for movement in movements:
+            if movement.kind not in MOVEMENT_SOURCES:
+                raise ValueError(f"Kind must be one of {tuple(MOVEMENT_SOURCES)}.")
+            entity = MOVEMENT_SOURCES[movement.kind][3]
+            target_id = employees._reference_id(
+                entity, movement.target_id, movement.target_code
+            )
+            if target_id is None or movement.start_date is None:
+                raise ValueError("Inform target_id or target_code, and start_date.")
+            movement = movement._replace(target_id=target_id, target_code=None)
+
+            key = (movement.employee_id, movement.kind)
+            if key in latest:
+                self.merged += 1
+                if movement.start_date < latest[key].start_date:
+                    continue
+            latest[key] = movement
+
+        planned = []
+        for movement in latest.values():
+            target_id, start_date = self.current.get_assignment(
+                movement.kind, movement.employee_id
+            )
+            if target_id == movement.target_id and (
+                not self.compare_start_date
+                or start_date == movement.start_date.isoformat()
+            ):
+                self.unchanged += 1
+            else:
+                planned.append(movement)
+        return planned
+
+    def _send(self, movement: Movement) -> dict:
+        method = getattr(self.client.employees, f"post_change_current_{movement.kind}")
+        result = method(
+            movement.employee_id,
+            movement.target_id,
+            start_date=movement.start_date,
+            review_access=movement.review_access,
+        )
+        self.current.set(
+            movement.kind,
+            movement.employee_id,
+            movement.target_id,
+            movement.start_date,
+        )
+        return result
+
+    def apply(self, movements: Iterable, max_workers: int = 8) -> List[BulkResult]:
+        """Send the planned movements of batch, concurrently for different
+        employees and in order for the same one. Returns a BulkResult by
+        (employee_id, kind) of each sent movement.
+
+        Args:
+            movements (Iterable, Mandatory): Movement objects
+            max_workers (int, Optional): Maximum concurrent requests, keep it up
+                to the client pool_maxsize
+        """
+        with operation_span(self.client.tracer, "movements apply"):
+            with WriteScheduler(max_workers, stop_on_error=False) as scheduler:
+                futures = [
+                    (
+                        (movement.employee_id, movement.kind),
+                        scheduler.submit(movement.employee_id, self._send, movement),
+                    )
+                    for movement in self.plan(movements)
+                ]
+
+        results = []
+        for key, future in futures:
+            try:
+                results.append(BulkResult(key, result=future.result()))
+
+            except Exception as error:
+                results.append(BulkResult(key, error=error))
+        return results
@@ -0,0 +1,100 @@
+"""This module provide automatic tuning of list requests page size"""
+
+import threading
+
+from mindsight_people_control_api.settings import (
+    AUTO_PAGE_SIZE_MAX,
+    AUTO_PAGE_SIZE_MIN,
+    AUTO_PAGE_SIZE_TARGET_LATENCY,
+    PAGE_SIZE,
+)
+
+
+class PageSizeTuner:
+    """Adjust page size toward a target latency using the observed seconds and
+    bytes per record of an endpoint.
+
+    Args:
+        initial (int, Optional): First page size used
+        target_latency (float, Optional): Desired seconds per page request
+        min_size (int, Optional): Lower bound of page size
+        max_size (int, Optional): Upper bound of page size
+        max_page_bytes (int, Optional): Upper bound of page payload size
+        smoothing (float, Optional): Weight of new observations (0-1]
+    """
+
+    max_step: float = 2.0  # Page size changes at most by this factor per request
+
+    def __init__(
+        self,
+        initial: int = PAGE_SIZE,
+        target_latency: float = AUTO_PAGE_SIZE_TARGET_LATENCY,
+        min_size: int = AUTO_PAGE_SIZE_MIN,
+        max_size: int = AUTO_PAGE_SIZE_MAX,
+        max_page_bytes: int = None,
+        smoothing: float = 0.5,
+    ) -> None:
+        if min_size <= 0 or min_size > max_size:
+            raise ValueError("Page size bounds must be 0 < min_size <= max_size.")
+        if target_latency <= 0:
+            raise ValueError("Target latency can be > 0.")
+        if not 0 < smoothing <= 1:
+            raise ValueError("Smoothing must be in (0, 1].")
+
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_page_bytes = max_page_bytes
+        self.smoothing = smoothing
+        self.seconds_per_record: float = None
+        self.bytes_per_record: float = None
+        self._page_size = self._clamp(initial)
+        self._lock = threading.Lock()
+
+    @property
+    def page_size(self) -> int:
+        """Get page size to use on next request."""
+        return self._page_size
+
+    def _clamp(self, value: float) -> int:
+        return int(max(self.min_size, min(self.max_size, value)))
+
+    def _average(self, current: float, value: float) -> float:
+        if current is None:
+            return value
+        return current + self.smoothing * (value - current)
+
+    def observe(self, elapsed: float, records: int, n_bytes: int = None):
+        """Register a page response and adjust page size.
+
+        Args:
+            elapsed (float, Mandatory): Seconds spent requesting the page
+            records (int, Mandatory): Number of records in page
+            n_bytes (int, Optional): Payload size of page
+        """
+        if records <= 0 or elapsed <= 0:
+            return
+
+        with self._lock:
+            self.seconds_per_record = self._average(
+                self.seconds_per_record, elapsed / records
+            )
+            if n_bytes:
+                self.bytes_per_record = self._average(
+                    self.bytes_per_record, n_bytes / records
+                )
+
+            wanted = self.target_latency / self.seconds_per_record
+            if self.max_page_bytes and self.bytes_per_record:
+                wanted = min(wanted, self.max_page_bytes / self.bytes_per_record)
+
+            current = self._page_size
+            wanted = max(current / self.max_step, min(current * self.max_step, wanted))
+            self._page_size = self._clamp(wanted)
+
+    def observe_failure(self):
+        """Register a failed page request, like a timeout, and shrink page size
+        by the max step.
+        """
+        with self._lock:
+            self._page_size = self._clamp(self._page_size / self.max_step)
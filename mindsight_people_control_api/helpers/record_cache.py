@@ -0,0 +1,72 @@
+"""This module provide the cache of records retrieved by endpoints.
+
+Entries expire after a time to live and the least recently used ones are
+dropped over the maximum size. Endpoints evict the records they write, so
+only changes made by other clients or endpoints are served stale, up to the
+time to live.
+"""
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Hashable
+
+
+class RecordCache:
+    """Thread safe LRU cache with time to live
+
+    Args:
+        max_size (int, Optional): Maximum number of entries
+        ttl (float, Optional): Seconds an entry is served, None to keep it until
+            evicted
+        clock (Callable, Optional): Monotonic clock in seconds
+    """
+
+    def __init__(
+        self, max_size: int = 1000, ttl: float = 300.0, clock: Callable = monotonic
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("Cache max_size can be > 0.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict = OrderedDict()  # key -> (stored at, value)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value of key, default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self.ttl is not None and self.clock() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store value of key, dropping the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: Hashable):
+        """Forget key"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Forget all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,226 @@
+"""This module provide a cache resolving entity codes to api ids.
+
+Code maps are bulk loaded from list endpoints on first use and refreshed
+incrementally, so write methods can receive codes without a search request
+before each write. A refresh requests the records modified since the second
+before the watermark (the latest modified datetime loaded), so rows of the
+watermark second aren't missed, and skips the (id, modified) pairs already
+loaded since then. Records are requested without holding the cache lock, so
+resolving loaded codes never waits for the network.
+"""
+
+import threading
+from datetime import timedelta
+
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.utils.aux_functions import (
+    parse_datetime,
+    utc_datetime,
+)
+
+# entity -> (client endpoint property, list method, reference fields)
+REFERENCE_SOURCES = {
+    "areas": ("areas", "get_list_areas", ("code",)),
+    "positions": ("positions", "get_list_positions", ("code",)),
+    "corporations": ("corporations", "get_list_corporations", ("code",)),
+    "branch_corporations": (
+        "branch_corporations",
+        "get_list_branch_corporations",
+        ("code",),
+    ),
+    "employees": ("employees", "get_list_employees", ("employee_code", "email")),
+}
+
+
+class ReferenceNotFoundException(PeopleControlExceptions):
+    """Code not found in the api records"""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f"ERROR: {message}")
+
+
+class ReferenceCache:
+    """Cache of code -> id maps of areas, positions, corporations, branch
+    corporations and employees (by employee_code or email).
+
+    Args:
+        client (Client, Optional): Client used to load records, default is a
+            client configured by the module settings
+    """
+
+    def __init__(self, client=None) -> None:
+        if client is None:
+            from mindsight_people_control_api.client import Client
+
+            client = Client()
+        self.client = client
+        self._maps: dict = {}  # entity -> field -> normalized value -> id
+        self._keys: dict = {}  # entity -> id -> [(field, normalized value)]
+        self._watermarks: dict = {}  # entity -> last modified datetime
+        self._boundaries: dict = {}  # entity -> {(id, modified)} of its second
+        self._loading: dict = {}  # entity -> lock of its loads and refreshes
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _normalize(value) -> str:
+        return str(value).strip().casefold()
+
+    def _entity_lock(self, entity: str) -> threading.RLock:
+        with self._lock:
+            return self._loading.setdefault(entity, threading.RLock())
+
+    def _add(self, entity: str, record: dict):
+        fields = REFERENCE_SOURCES[entity][2]
+        maps, keys = self._maps[entity], self._keys[entity]
+        # Drop previous codes of record, so renamed codes don't resolve
+        for field, value in keys.pop(record["id"], ()):
+            if maps[field].get(value) == record["id"]:
+                del maps[field][value]
+
+        keys[record["id"]] = []
+        for field in fields:
+            if record.get(field):
+                value = self._normalize(record[field])
+                maps.setdefault(field, {})[value] = record["id"]
+                keys[record["id"]].append((field, value))
+
+        if record.get("modified"):
+            modified = parse_datetime(record["modified"])
+            watermark = self._watermarks.get(entity)
+            if watermark is None or modified > watermark:
+                self._watermarks[entity] = modified
+
+    def _apply(self, entity: str, records: list) -> int:
+        """Add records to the code map of entity, skipping the ones already
+        loaded in the watermark second. Call it holding the lock.
+        """
+        boundary = self._boundaries.get(entity, set())
+        applied = []
+        for record in records:
+            if (record["id"], record.get("modified")) in boundary:
+                continue
+            self._add(entity, record)
+            applied.append((record["id"], record.get("modified")))
+
+        # Rows since the second before the watermark come again on the next
+        # refresh
+        watermark = self._watermarks.get(entity)
+        if watermark is not None:
+            since = watermark.replace(microsecond=0) - timedelta(seconds=1)
+            self._boundaries[entity] = {
+                (_id, modified)
+                for _id, modified in boundary | set(applied)
+                if modified and parse_datetime(modified) >= since
+            }
+        return len(applied)
+
+    def _endpoint(self, entity: str):
+        endpoint_name, list_method, _ = REFERENCE_SOURCES[entity]
+        endpoint = getattr(self.client, endpoint_name)
+        return endpoint, getattr(endpoint, list_method)
+
+    def _request_records(self, entity: str, **filters) -> list:
+        _, list_method = self._endpoint(entity)
+        return list(list_method(**filters).iter_results())
+
+    def load(self, entity: str) -> int:
+        """Bulk load code map of entity, replacing the loaded one.
+        Returns the number of loaded records.
+
+        Args:
+            entity (str, Mandatory): One of REFERENCE_SOURCES keys
+        """
+        if entity not in REFERENCE_SOURCES:
+            raise ValueError(f"Entity must be one of {tuple(REFERENCE_SOURCES)}.")
+
+        with self._entity_lock(entity):
+            records = self._request_records(entity)
+            with self._lock:
+                self._maps[entity], self._keys[entity] = {}, {}
+                self._watermarks.pop(entity, None)
+                self._boundaries.pop(entity, None)
+                self._apply(entity, records)
+            return len(records)
+
+    def refresh(self, entity: str = None) -> int:
+        """Load records modified since the last load or refresh of entity, or of
+        all loaded entities. Entities whose record count differs from the api
+        count, because of deleted records, are loaded again.
+        Returns the number of loaded records.
+
+        Args:
+            entity (str, Optional): One of REFERENCE_SOURCES keys
+        """
+        with self._lock:
+            entities = [entity] if entity else list(self._maps)
+
+        loaded = 0
+        for name in entities:
+            with self._entity_lock(name):
+                with self._lock:
+                    watermark = self._watermarks.get(name)
+                    if name not in self._maps:
+                        watermark = None
+                if watermark is None:
+                    loaded += self.load(name)
+                    continue
+
+                since = utc_datetime(watermark).replace(microsecond=0)
+                since -= timedelta(seconds=1)
+                records = self._request_records(name, modified__gt=since)
+                with self._lock:
+                    loaded += self._apply(name, records)
+                    stored = len(self._keys[name])
+
+                endpoint, list_method = self._endpoint(name)
+                if endpoint._count(list_method) != stored:
+                    loaded += self.load(name)
+        return loaded
+
+    def resolve(self, entity: str, code, field: str = None) -> int:
+        """Get id of entity record by code. Unknown codes trigger an incremental
+        refresh before raising ReferenceNotFoundException.
+
+        Args:
+            entity (str, Mandatory): One of REFERENCE_SOURCES keys
+            code (str, Mandatory): Code of record, or email of employees
+            field (str, Optional): Field of code, default is any reference field
+        """
+        value = self._normalize(code)
+        refreshed = False
+        with self._entity_lock(entity):
+            with self._lock:
+                loaded = entity in self._maps
+            if not loaded:
+                self.load(entity)
+                refreshed = True
+
+        while True:
+            with self._lock:
+                maps = self._maps[entity]
+                for name in [field] if field else REFERENCE_SOURCES[entity][2]:
+                    if value in maps.get(name, {}):
+                        return maps[name][value]
+
+            if refreshed:
+                raise ReferenceNotFoundException(
+                    f"{entity} reference {code!r} not found"
+                )
+            self.refresh(entity)
+            refreshed = True
+
+    def add(self, entity: str, record: dict):
+        """Add record created or edited by this client to the loaded code map
+        of entity, so it resolves without a refresh.
+        """
+        with self._lock:
+            if entity in self._maps:
+                self._add(entity, record)
+
+    def clear(self):
+        """Forget loaded maps."""
+        with self._lock:
+            self._maps.clear()
+            self._keys.clear()
+            self._watermarks.clear()
+            self._boundaries.clear()
@@ -0,0 +1,156 @@
+"""This module provide a scheduler of writes ordered by key.
+
+Writes of different entities are independent, but writes of the same entity
+(like activate, change area and change manager of an employee) must run in
+order. Each key has a queue run by one worker at a time, so keys run in
+parallel up to the worker count while each key keeps its order. A worker runs
+a single write before giving its turn to the other keys.
+"""
+
+import threading
+from collections import deque
+from contextvars import copy_context
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable
+
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+
+
+class WriteScheduler:
+    """Run writes of the same key in submission order, and of different keys
+    in parallel
+
+    Args:
+        max_workers (int, Optional): Maximum concurrent writes, keep it up to
+            the client pool_maxsize
+        stop_on_error (bool, Optional): Fail the writes of a key after a failed
+            write of it, instead of running them, until the key is reset
+
+    Example:
+        with WriteScheduler(max_workers=8) as scheduler:
+            activated = scheduler.submit(10, employees.post_activate_employee, 10, day)
+            moved = scheduler.submit(10, employees.post_change_current_area, 10, 3, day)
+        moved.result()
+    """
+
+    def __init__(self, max_workers: int = 8, stop_on_error: bool = True) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0.")
+
+        self.stop_on_error = stop_on_error
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # key -> deque of (future, function, args, kwargs, context of submit)
+        self._queues: dict = {}
+        self._failed: set = set()  # Keys with a failed write, when stop_on_error
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+        self._cancelled = False  # Shut down without waiting
+
+    def __enter__(self) -> "WriteScheduler":
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def submit(self, key: Hashable, function: Callable, *args, **kwargs) -> Future:
+        """Schedule function(*args, **kwargs) after the writes of key submitted
+        before it, in a copy of the current context (like its tracing span).
+        Returns a future of its result.
+
+        Args:
+            key (Hashable, Mandatory): Entity key of write, like employee id
+            function (Callable, Mandatory): Write function
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Can't submit writes after shutdown.")
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._executor.submit(self._run_next, key)
+            queue.append((future, function, args, kwargs, copy_context()))
+        return future
+
+    def failed(self) -> set:
+        """Get keys with a failed write, whose writes fail without running"""
+        with self._lock:
+            return set(self._failed)
+
+    def reset(self, key: Hashable = None):
+        """Run the writes of failed key again, or of all failed keys.
+
+        Args:
+            key (Hashable, Optional): Entity key of write, default all keys
+        """
+        with self._lock:
+            if key is None:
+                self._failed.clear()
+            else:
+                self._failed.discard(key)
+
+    def pending(self) -> int:
+        """Get number of writes not finished"""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def _run_next(self, key: Hashable):
+        with self._lock:
+            future, function, args, kwargs, context = self._queues[key][0]
+            failed = key in self._failed
+
+        try:
+            if future.set_running_or_notify_cancel():
+                if failed:
+                    future.set_exception(
+                        PeopleControlExceptions(f"Previous write of {key!r} failed")
+                    )
+                else:
+                    try:
+                        future.set_result(context.run(function, *args, **kwargs))
+
+                    except BaseException as error:
+                        future.set_exception(error)
+                        if self.stop_on_error:
+                            with self._lock:
+                                self._failed.add(key)
+                        if not isinstance(error, Exception):
+                            raise
+
+        finally:
+            # Give the turn to the next write of key even on interruptions,
+            # otherwise the key's queue is stranded and shutdown never returns
+            self._finish(key)
+
+    def _finish(self, key: Hashable):
+        with self._lock:
+            queue = self._queues[key]
+            queue.popleft()
+            if self._cancelled:  # Executor may be shut down, don't resubmit
+                for future, *_ in queue:
+                    future.cancel()
+                queue.clear()
+            while queue and queue[0][0].cancelled():
+                queue.popleft()
+            if queue:
+                self._executor.submit(self._run_next, key)
+            else:
+                del self._queues[key]
+                if not self._queues:
+                    self._idle.notify_all()
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting writes. By default waits the scheduled ones, otherwise
+        cancels the ones not started.
+        """
+        with self._idle:
+            self._closed = True
+            if not wait:
+                self._cancelled = True
+                for queue in self._queues.values():
+                    for future, *_ in queue:
+                        future.cancel()
+            while wait and self._queues:
+                self._idle.wait()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,210 @@
+"""This module provide a local search index of records, like employees, users,
+areas and positions, to run fuzzy lookups in memory instead of calling list
+endpoints with the search parameter.
+
+Text is normalized (accents removed, case folded) and split in tokens. An
+inverted index maps each token to the ids of its records and a prefix trie
+maps each prefix to the indexed tokens starting with it, so a prefix lookup is
+the union of a few token postings.
+"""
+
+import heapq
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Iterable
+
+SEARCH_FIELDS = (
+    "first_name",
+    "last_name",
+    "name",
+    "email",
+    "username",
+    "employee_code",
+    "code",
+)
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+|\d+")  # Words and numbers
+
+
+@lru_cache(maxsize=65536)  # Names repeat a lot
+def _normalize(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def normalize(text) -> str:
+    """Normalize text to compare: without accents and case folded"""
+    return _normalize(str(text))
+
+
+def tokenize(text) -> list:
+    """Split normalized text in tokens of letters and of digits"""
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+class _TrieNode:
+    __slots__ = ("children", "tokens")
+
+    def __init__(self) -> None:
+        self.children: dict = {}
+        self.tokens: set = set()  # Tokens of this subtree
+
+
+class SearchIndex:
+    """In memory search index of records by id
+
+    Args:
+        records (Iterable, Optional): Records to index, like the results of a
+            pagination iter_results
+        fields (tuple, Optional): Indexed fields, missing fields are ignored
+
+    Example:
+        index = SearchIndex(client.employees.get_list_employees().iter_results())
+        index.search("joao sil")  # Matches "João Silva"
+        index.lookup("email", "JOAO@EXAMPLE.COM")
+    """
+
+    def __init__(self, records: Iterable = None, fields: tuple = SEARCH_FIELDS) -> None:
+        self.fields = tuple(fields)
+        self.records: dict = {}
+        self._root = _TrieNode()
+        self._tokens: dict = {}  # token -> ids (inverted index)
+        self._values: dict = {}  # field -> normalized value -> ids
+        self._lock = threading.RLock()
+        if records is not None:
+            self.add_many(records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, _id) -> bool:
+        return _id in self.records
+
+    def _keys(self, record: dict) -> tuple:
+        """Get (field, normalized value) pairs and tokens of record"""
+        values, tokens = [], set()
+        for field in self.fields:
+            value = record.get(field)
+            if value is None or value == "":
+                continue
+            value = normalize(value)
+            values.append((field, value))
+            tokens.update(TOKEN_PATTERN.findall(value))
+        return values, tokens
+
+    def _trie_add(self, token: str):
+        node = self._root
+        for char in token:
+            node = node.children.setdefault(char, _TrieNode())
+            node.tokens.add(token)
+
+    def _trie_remove(self, token: str):
+        node = self._root
+        for char in token:
+            node = node.children[char]
+            node.tokens.discard(token)
+
+    def add(self, record: dict):
+        """Add record to index, replacing the indexed record of same id"""
+        with self._lock:
+            _id = record["id"]
+            if _id in self.records:
+                self.remove(_id)
+
+            values, tokens = self._keys(record)
+            self.records[_id] = record
+            for field, value in values:
+                self._values.setdefault(field, {}).setdefault(value, set()).add(_id)
+            for token in tokens:
+                ids = self._tokens.get(token)
+                if ids is None:
+                    ids = self._tokens[token] = set()
+                    self._trie_add(token)
+                ids.add(_id)
+
+    def add_many(self, records: Iterable):
+        """Add records to index"""
+        for record in records:
+            self.add(record)
+
+    def remove(self, _id):
+        """Remove record of id from index"""
+        with self._lock:
+            record = self.records.pop(_id, None)
+            if record is None:
+                return
+
+            values, tokens = self._keys(record)
+            for field, value in values:
+                ids = self._values[field][value]
+                ids.discard(_id)
+                if not ids:
+                    del self._values[field][value]
+            for token in tokens:
+                ids = self._tokens[token]
+                ids.discard(_id)
+                if not ids:
+                    del self._tokens[token]
+                    self._trie_remove(token)
+
+    def _prefix_ids(self, prefix: str) -> set:
+        """Get ids of records with a token starting with prefix"""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        if len(node.tokens) == 1:
+            return self._tokens[next(iter(node.tokens))]
+        return set().union(*(self._tokens[token] for token in node.tokens))
+
+    def lookup(self, field: str, value) -> list:
+        """Get records with field equal to value, ignoring case and accents
+
+        Args:
+            field (str, Mandatory): Indexed field, like email or employee_code
+            value (Any, Mandatory): Value to find
+        """
+        with self._lock:
+            ids = self._values.get(field, {}).get(normalize(value), ())
+            return [self.records[_id] for _id in sorted(ids)]
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Search records with all query terms as prefix of their tokens.
+        Records where all terms are whole tokens come first, then by id.
+
+        Args:
+            query (str, Mandatory): Search text, like "joao sil" or "joao.silva@"
+            limit (int, Optional): Maximum number of records, None for all
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            matches = None
+            for ids in sorted((self._prefix_ids(term) for term in terms), key=len):
+                matches = ids if matches is None else matches & ids
+                if not matches:
+                    return []
+
+            exact = matches
+            for ids in sorted(
+                (self._tokens.get(term, set()) for term in terms), key=len
+            ):
+                exact = exact & ids
+                if not exact:
+                    break
+
+            if limit is None:
+                ordered = sorted(exact) + sorted(matches - exact)
+            else:
+                ordered = heapq.nsmallest(limit, exact)
+                if len(ordered) < limit:
+                    ordered += heapq.nsmallest(limit - len(ordered), matches - exact)
+            return [self.records[_id] for _id in ordered]
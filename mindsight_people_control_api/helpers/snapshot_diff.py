@@ -0,0 +1,128 @@
+"""This module provide a streaming diff of record snapshots.
+
+List endpoints return records sorted by id (ordering=id), so two snapshots of
+an entity, like two paginations or two saved exports, are merged in a single
+pass: linear time and memory bounded to one record of each side.
+"""
+
+import hashlib
+import json
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from mindsight_people_control_api.utils.aux_functions import open_text
+
+IGNORED_FIELDS = ("modified",)
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class RecordChange(NamedTuple):
+    """Difference of a record between snapshots. fields maps each changed field
+    to its (before, after) values.
+    """
+
+    kind: str
+    id: Any
+    before: dict = None
+    after: dict = None
+    fields: dict = None
+
+
+def fingerprint(record: dict, ignore_fields: tuple = IGNORED_FIELDS) -> str:
+    """Get hash of record content, without ignored fields, to compare records
+    kept elsewhere, like in a database of last synced versions.
+    """
+    content = {key: value for key, value in record.items() if key not in ignore_fields}
+    canonical = json.dumps(content, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def field_deltas(before: dict, after: dict, ignore_fields: tuple = IGNORED_FIELDS):
+    """Get {field: (before value, after value)} of fields that differ"""
+    return {
+        field: (before.get(field), after.get(field))
+        for field in before.keys() | after.keys()
+        if field not in ignore_fields and before.get(field) != after.get(field)
+    }
+
+
+def _sorted_records(records: Iterable, key: str, side: str) -> Iterator[dict]:
+    previous = None
+    for record in records:
+        if previous is not None and record[key] <= previous:
+            raise ValueError(
+                f"{side} snapshot must be sorted by unique {key}, "
+                f"{record[key]!r} came after {previous!r}"
+            )
+        previous = record[key]
+        yield record
+
+
+def diff_snapshots(
+    before: Iterable,
+    after: Iterable,
+    key: str = "id",
+    ignore_fields: tuple = IGNORED_FIELDS,
+) -> Iterator[RecordChange]:
+    """Yield added, removed and changed records between two snapshots sorted by
+    key, like iter_results of two paginations or read_snapshot of two exports.
+
+    Args:
+        before (Iterable, Mandatory): Old records sorted by key
+        after (Iterable, Mandatory): New records sorted by key
+        key (str, Optional): Unique record key field
+        ignore_fields (tuple, Optional): Fields not compared, like modified
+    """
+    missing = object()
+    before = _sorted_records(before, key, "Before")
+    after = _sorted_records(after, key, "After")
+    old, new = next(before, missing), next(after, missing)
+    while old is not missing or new is not missing:
+        if new is missing or (old is not missing and old[key] < new[key]):
+            yield RecordChange(REMOVED, old[key], before=old)
+            old = next(before, missing)
+
+        elif old is missing or new[key] < old[key]:
+            yield RecordChange(ADDED, new[key], after=new)
+            new = next(after, missing)
+
+        else:
+            if old != new:
+                fields = field_deltas(old, new, ignore_fields)
+                if fields:
+                    yield RecordChange(
+                        CHANGED, new[key], before=old, after=new, fields=fields
+                    )
+            old, new = next(before, missing), next(after, missing)
+
+
+def summarize(changes: Iterable) -> dict:
+    """Count changes by kind and changed fields"""
+    summary = {ADDED: 0, REMOVED: 0, CHANGED: 0, "fields": {}}
+    for change in changes:
+        summary[change.kind] += 1
+        for field in change.fields or ():
+            summary["fields"][field] = summary["fields"].get(field, 0) + 1
+    return summary
+
+
+def write_snapshot(records: Iterable, path: str) -> int:
+    """Save records as json lines (gzip compressed for ".gz" paths), keeping
+    their order. Returns the number of records.
+    """
+    count = 0
+    with open_text(path, "w") as file:
+        for record in records:
+            file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def read_snapshot(path: str) -> Iterator[dict]:
+    """Iterate over records of a snapshot saved by write_snapshot"""
+    with open_text(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
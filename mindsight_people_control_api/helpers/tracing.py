@@ -0,0 +1,165 @@
+"""This module provide optional tracing of api operations.
+
+Tracing is disabled by default with NoopTracer, which needs no dependency.
+OpenTelemetryTracer uses the opentelemetry-api package when it is installed.
+
+Paginations pass their spans as parents explicitly, because they run across
+generator yields. Bulk writes open an operation_span instead, parent of the
+requests sent in its context, also from worker threads running a copy of it
+(contextvars.copy_context().run).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+
+class Span:
+    """No-op span, base of tracer spans. Use as context manager or call end."""
+
+    def set_attribute(self, key: str, value: Any):
+        """Set attribute (tag) of span."""
+
+    def set_attributes(self, attributes: dict):
+        """Set many attributes of span."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, error: Exception):
+        """Mark span as failed with error."""
+
+    def inject_headers(self, headers: dict):
+        """Add trace context headers to propagate the span to the server."""
+
+    def end(self):
+        """Finish span."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_value is not None and not isinstance(exc_value, GeneratorExit):
+            self.record_exception(exc_value)
+        self.end()
+
+
+class NoopTracer:
+    """Tracer that does nothing, used when tracing is disabled"""
+
+    enabled: bool = False
+    _span = Span()
+
+    def start_span(
+        self, name: str, attributes: dict = None, parent: Span = None
+    ) -> Span:
+        """Start a span, child of parent span or of the current context span.
+
+        Args:
+            name (str, Mandatory): Span name
+            attributes (dict, Optional): Span attributes
+            parent (Span, Optional): Parent span
+        """
+        return self._span
+
+
+class OpenTelemetrySpan(Span):
+    """Span adapter of opentelemetry spans"""
+
+    def __init__(self, span) -> None:
+        self.span = span
+
+    def set_attribute(self, key: str, value: Any):
+        if value is not None:
+            self.span.set_attribute(key, value)
+
+    def record_exception(self, error: Exception):
+        from opentelemetry.trace import Status, StatusCode
+
+        self.span.record_exception(error)
+        self.span.set_status(Status(StatusCode.ERROR, str(error)))
+
+    def inject_headers(self, headers: dict):
+        from opentelemetry import propagate, trace
+
+        propagate.inject(headers, context=trace.set_span_in_context(self.span))
+
+    def end(self):
+        self.span.end()
+
+
+class OpenTelemetryTracer(NoopTracer):
+    """Tracer creating opentelemetry spans. Spans aren't set as current context
+    because paginations run across generator yields, parents are passed
+    explicitly instead.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, Optional): Tracer to use, default is
+            the tracer of this package from the global tracer provider
+    """
+
+    enabled: bool = True
+
+    def __init__(self, tracer=None) -> None:
+        try:
+            from opentelemetry import trace
+
+        except ImportError as error:
+            raise ImportError(
+                "Install opentelemetry-api to enable tracing: "
+                "pip install opentelemetry-api"
+            ) from error
+
+        self._trace = trace
+        self.tracer = (
+            tracer if tracer else trace.get_tracer("mindsight_people_control_api")
+        )
+
+    def start_span(
+        self, name: str, attributes: dict = None, parent: Span = None
+    ) -> Span:
+        context = None
+        if isinstance(parent, OpenTelemetrySpan):
+            context = self._trace.set_span_in_context(parent.span)
+
+        span = self.tracer.start_span(
+            name,
+            context=context,
+            attributes={
+                key: value
+                for key, value in (attributes or {}).items()
+                if value is not None
+            },
+        )
+        return OpenTelemetrySpan(span)
+
+
+noop_tracer = NoopTracer()
+
+
+_current_span: ContextVar = ContextVar("mindsight_current_span", default=None)
+
+
+def current_span() -> Span:
+    """Get span of the running bulk operation, or None"""
+    return _current_span.get()
+
+
+@contextmanager
+def operation_span(
+    tracer: NoopTracer, name: str, attributes: dict = None
+) -> Iterator[Span]:
+    """Start span of a bulk operation, parent of the requests sent in its
+    context. Don't use it in generators, their context is the consumer one.
+
+    Args:
+        tracer (NoopTracer, Mandatory): Tracer of the client
+        name (str, Mandatory): Span name
+        attributes (dict, Optional): Span attributes
+    """
+    with tracer.start_span(name, attributes=attributes, parent=current_span()) as span:
+        token = _current_span.set(span)
+        try:
+            yield span
+
+        finally:
+            _current_span.reset(token)
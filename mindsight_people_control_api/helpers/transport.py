@@ -0,0 +1,239 @@
+"""This module provide the transports used to send api requests.
+
+HttpTransport sends requests over the network. RecordingTransport saves the
+request/response pairs of another transport in a Cassette, which
+ReplayTransport serves back from memory, without network, to test and profile
+the client side deterministically.
+"""
+
+import base64
+import http
+import io
+import json
+import threading
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.utils.aux_functions import open_text
+
+
+class CassetteMissException(PeopleControlExceptions):
+    """Request not recorded in replayed cassette"""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(f"ERROR: {message}")
+
+
+class Transport(ABC):
+    """Base of transports, sends a request and returns its response."""
+
+    @abstractmethod
+    def send(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        """Send request.
+
+        Args:
+            session (requests.Session, Mandatory): Session of the client
+            method (str, Mandatory): Http method
+            url (str, Mandatory): Request url
+            kwargs: requests.Session.request arguments (headers, params, data,
+                json, timeout)
+        """
+
+
+class HttpTransport(Transport):
+    """Transport sending requests over the network with the client session"""
+
+    def send(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        return session.request(method=method, url=url, **kwargs)
+
+
+http_transport = HttpTransport()
+
+
+def _body_text(body) -> str:
+    if body is None:
+        return ""
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="replace")
+    return str(body)
+
+
+class Cassette:
+    """Recorded request/response pairs, saved as json lines (gzip compressed
+    when the path ends with ".gz"). Authorization and other request headers are
+    never recorded.
+
+    Args:
+        path (str, Optional): File to load interactions from and save to
+    """
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path
+        self.interactions: dict = {}  # request key -> list of responses
+        self._positions: dict = {}
+        self._lock = threading.Lock()
+        if path:
+            try:
+                self.load(path)
+
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def key(method: str, url: str, body=None) -> str:
+        """Get key matching a request."""
+        return f"{method.upper()} {url}\n{_body_text(body)}"
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.interactions.values())
+
+    def append(self, key: str, status: int, headers: dict, content: bytes):
+        """Record response of request key."""
+        with self._lock:
+            self.interactions.setdefault(key, []).append(
+                {"status": status, "headers": headers, "content": content}
+            )
+
+    def next_response(self, key: str) -> dict:
+        """Get the next recorded response of request key. Repeated requests get
+        the responses in recorded order, the last one is repeated after them.
+        """
+        with self._lock:
+            responses = self.interactions.get(key)
+            if not responses:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def rewind(self):
+        """Replay responses from the beginning."""
+        with self._lock:
+            self._positions.clear()
+
+    def load(self, path: str):
+        """Load interactions of file."""
+        with open_text(path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if "content_b64" in item:
+                    content = base64.b64decode(item["content_b64"])
+                else:
+                    content = item["content"].encode("utf-8")
+                self.append(item["key"], item["status"], item["headers"], content)
+
+    def save(self, path: str = None):
+        """Save interactions to file, default on cassette path."""
+        path = path if path else self.path
+        with self._lock, open_text(path, "w") as file:
+            for key, responses in self.interactions.items():
+                for response in responses:
+                    item = {
+                        "key": key,
+                        "status": response["status"],
+                        "headers": response["headers"],
+                    }
+                    try:
+                        item["content"] = response["content"].decode("utf-8")
+
+                    except UnicodeDecodeError:
+                        item["content_b64"] = base64.b64encode(
+                            response["content"]
+                        ).decode("ascii")
+                    file.write(json.dumps(item, separators=(",", ":")) + "\n")
+
+
+class RecordingTransport(Transport):
+    """Transport recording the requests sent by another transport. Bodies of
+    streamed responses are read whole to be recorded, so they are buffered in
+    memory like responses not streamed.
+
+    Args:
+        cassette (Cassette, Mandatory): Cassette to record on, save it at the end
+        transport (Transport, Optional): Transport to record, default http
+    """
+
+    recorded_headers = ("Content-Type",)
+
+    def __init__(self, cassette: Cassette, transport: Transport = None) -> None:
+        self.cassette = cassette
+        self.transport = transport if transport else http_transport
+
+    def send(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        response = self.transport.send(session, method, url, **kwargs)
+        self.cassette.append(
+            Cassette.key(method, response.request.url, response.request.body),
+            response.status_code,
+            {
+                name: response.headers[name]
+                for name in self.recorded_headers
+                if name in response.headers
+            },
+            response.content,
+        )
+        return response
+
+
+class ReplayTransport(Transport):
+    """Transport answering requests with the responses of a cassette
+
+    Args:
+        cassette (Cassette, Mandatory): Recorded cassette
+        fallback (Transport, Optional): Transport of requests not recorded,
+            default is to raise CassetteMissException
+    """
+
+    def __init__(self, cassette: Cassette, fallback: Transport = None) -> None:
+        self.cassette = cassette
+        self.fallback = fallback
+
+    def send(
+        self, session: requests.Session, method: str, url: str, **kwargs
+    ) -> requests.Response:
+        prepared = session.prepare_request(
+            requests.Request(
+                method=method.upper(),
+                url=url,
+                headers=kwargs.get("headers"),
+                params=kwargs.get("params"),
+                data=kwargs.get("data"),
+                json=kwargs.get("json"),
+            )
+        )
+        key = Cassette.key(method, prepared.url, prepared.body)
+        recorded = self.cassette.next_response(key)
+        if recorded is None:
+            if self.fallback:
+                return self.fallback.send(session, method, url, **kwargs)
+            raise CassetteMissException(f"Request not recorded: {key.strip()}")
+
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response._content = recorded["content"]
+        # Body is already read, streamed pages iterate over the content
+        response._content_consumed = True
+        response.raw = io.BytesIO(recorded["content"])
+        response.raw.seek(0, io.SEEK_END)  # Read bytes, see wire_bytes
+        response.encoding = "utf-8"
+        response.url = prepared.url
+        response.request = prepared
+        response.elapsed = timedelta(0)
+        try:
+            response.reason = http.HTTPStatus(response.status_code).phrase
+
+        except ValueError:
+            response.reason = ""
+        return response
@@ -0,0 +1,298 @@
+"""This module provide bulk upserts of corporations and branch corporations.
+
+Existing records are bulk loaded from the list endpoints and compared by code
+with the desired ones locally, so only the inserts, updates and deletes are
+sent, concurrently, and unchanged records cost no request. Corporations are
+written before the branches that reference them and deleted after them.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Iterable, List, NamedTuple
+
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.helpers.models import BulkResult
+from mindsight_people_control_api.helpers.tracing import operation_span
+from mindsight_people_control_api.utils.aux_functions import related_id
+
+
+class UpsertPlan(NamedTuple):
+    """Writes needed to turn existing records into desired ones"""
+
+    inserts: list  # Desired records
+    updates: list  # (existing record, desired record)
+    deletes: list  # Existing records
+    unchanged: int
+
+
+class UpsertResult(NamedTuple):
+    """BulkResult of each write of an upsert by record code. Skipped records
+    weren't written because a reference of them couldn't be resolved, or, for
+    deletes, because remaining records still reference them.
+    """
+
+    inserted: list
+    updated: list
+    deleted: list
+    unchanged: int
+    skipped: tuple = ()
+
+
+def plan_upsert(
+    existing: Iterable,
+    desired: Iterable,
+    fields: tuple,
+    key: str = "code",
+    delete_missing: bool = False,
+) -> UpsertPlan:
+    """Compare existing and desired records by key
+
+    Args:
+        existing (Iterable, Mandatory): Records of the api
+        desired (Iterable, Mandatory): Records to have
+        fields (tuple, Mandatory): Compared fields, missing desired fields are
+            kept as they are
+        key (str, Optional): Field identifying records
+        delete_missing (bool, Optional): Delete existing records not desired
+    """
+    current = {record[key]: record for record in existing}
+    inserts, updates, seen = [], [], set()
+    unchanged = 0
+    for record in desired:
+        if record[key] in seen:
+            raise ValueError(f"Record {key} {record[key]} is repeated.")
+        seen.add(record[key])
+
+        old = current.get(record[key])
+        if old is None:
+            inserts.append(record)
+        elif any(
+            old.get(field) != record[field] for field in fields if field in record
+        ):
+            updates.append((old, record))
+        else:
+            unchanged += 1
+
+    deletes = (
+        [record for code, record in current.items() if code not in seen]
+        if delete_missing
+        else []
+    )
+    return UpsertPlan(inserts, updates, deletes, unchanged)
+
+
+def _run(tasks: list, max_workers: int) -> List[BulkResult]:
+    """Run (key, function, kwargs) tasks concurrently, in copies of the current
+    context, returning their BulkResult in order.
+    """
+    if not tasks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [
+            (key, executor.submit(copy_context().run, function, **kwargs))
+            for key, function, kwargs in tasks
+        ]
+        results = []
+        for key, future in futures:
+            try:
+                results.append(BulkResult(key, result=future.result()))
+
+            except Exception as error:
+                results.append(BulkResult(key, error=error))
+        return results
+
+
+def _write(plan: UpsertPlan, create: Callable, update: Callable, max_workers: int):
+    """Send inserts and updates of plan concurrently"""
+    results = _run(
+        [(record["code"], create, record) for record in plan.inserts]
+        + [
+            (record["code"], update, {"_id": old["id"], **record})
+            for old, record in plan.updates
+        ],
+        max_workers,
+    )
+    return results[: len(plan.inserts)], results[len(plan.inserts) :]
+
+
+def _delete(records: list, delete: Callable, max_workers: int) -> list:
+    return _run(
+        [(record["code"], delete, {"_id": record["id"]}) for record in records],
+        max_workers,
+    )
+
+
+def upsert_corporations(
+    client=None,
+    corporations: Iterable = (),
+    branch_corporations: Iterable = None,
+    delete_missing: bool = False,
+    max_workers: int = 8,
+) -> dict:
+    """Insert, update and, optionally, delete corporations and branch
+    corporations by code, skipping unchanged ones. Returns an UpsertResult by
+    entity, "corporations" and "branch_corporations".
+
+    Args:
+        client (Client, Optional): Client used to write, default is a client
+            configured by the module settings
+        corporations (Iterable, Optional): Dicts with code and name
+        branch_corporations (Iterable, Optional): Dicts with code, name and
+            corporation_id or corporation_code, None to keep branches as they are
+        delete_missing (bool, Optional): Delete records not informed.
+            Corporations still referenced by a remaining branch are skipped
+        max_workers (int, Optional): Maximum concurrent requests, keep it up to
+            the client pool_maxsize
+
+    Example:
+        upsert_corporations(
+            client,
+            corporations=[{"code": "C1", "name": "Corporation"}],
+            branch_corporations=[
+                {"code": "B1", "name": "Branch", "corporation_code": "C1"}
+            ],
+        )
+    """
+    if client is None:
+        from mindsight_people_control_api.client import Client
+
+        client = Client()
+
+    with operation_span(client.tracer, "upsert_corporations"):
+        return _upsert_corporations(
+            client, corporations, branch_corporations, delete_missing, max_workers
+        )
+
+
+def _upsert_corporations(
+    client,
+    corporations: Iterable,
+    branch_corporations: Iterable,
+    delete_missing: bool,
+    max_workers: int,
+) -> dict:
+    corporations_client = client.corporations
+    branches_client = client.branch_corporations
+
+    existing = list(corporations_client.get_list_corporations().iter_results())
+    plan = plan_upsert(
+        existing,
+        [{"code": item["code"], "name": item["name"]} for item in corporations],
+        fields=("name",),
+        delete_missing=delete_missing,
+    )
+    inserted, updated = _write(
+        plan,
+        corporations_client.post_create_corporation,
+        corporations_client.patch_update_corporation,
+        max_workers,
+    )
+    corporation_ids = {record["code"]: record["id"] for record in existing}
+    corporation_ids.update(
+        {item.key: item.result["id"] for item in inserted if item.error is None}
+    )
+
+    existing_branches = None
+    if branch_corporations is not None or plan.deletes:
+        existing_branches = [
+            {**record, "corporation_id": related_id(record.get("corporation"))}
+            for record in branches_client.get_list_branch_corporations().iter_results()
+        ]
+    # branch code -> corporation id, after the branch writes
+    references = {
+        record["code"]: record["corporation_id"] for record in existing_branches or []
+    }
+
+    branches = None
+    if branch_corporations is not None:
+        desired, skipped = [], []
+        for branch in branch_corporations:
+            corporation_id = branch.get("corporation_id")
+            code = branch.get("corporation_code")
+            try:
+                if corporation_id is None and code is not None:
+                    corporation_id = corporation_ids.get(
+                        code
+                    ) or branches_client._reference_id("corporations", None, code)
+
+            except PeopleControlExceptions as error:
+                skipped.append(BulkResult(branch["code"], error=error))
+                continue
+
+            if corporation_id is None:
+                skipped.append(
+                    BulkResult(
+                        branch["code"],
+                        error=ValueError("Inform corporation_id or corporation_code."),
+                    )
+                )
+                continue
+
+            desired.append(
+                {
+                    "code": branch["code"],
+                    "name": branch["name"],
+                    "corporation_id": related_id(corporation_id),
+                }
+            )
+
+        branch_plan = plan_upsert(
+            existing_branches,
+            desired,
+            fields=("name", "corporation_id"),
+            delete_missing=delete_missing,
+        )
+        kept = {item.key for item in skipped}  # Not deleted as missing
+        branch_plan = branch_plan._replace(
+            deletes=[item for item in branch_plan.deletes if item["code"] not in kept]
+        )
+        branches_inserted, branches_updated = _write(
+            branch_plan,
+            branches_client.post_create_branch_corporation,
+            branches_client.patch_update_branch_corporation,
+            max_workers,
+        )
+        branches_deleted = _delete(
+            branch_plan.deletes, branches_client.delete_branch_corporation, max_workers
+        )
+        branches = UpsertResult(
+            branches_inserted,
+            branches_updated,
+            branches_deleted,
+            branch_plan.unchanged,
+            skipped,
+        )
+
+        # Failed writes keep the previous references
+        written = {record["code"]: record["corporation_id"] for record in desired}
+        for item in branches_inserted + branches_updated:
+            if item.error is None:
+                references[item.key] = written[item.key]
+        for item in branches_deleted:
+            if item.error is None:
+                references.pop(item.key, None)
+
+    # Corporations referenced by a remaining branch aren't deleted
+    referenced = set(references.values())
+    corporations_skipped = [
+        BulkResult(
+            record["code"],
+            error=ValueError(
+                f"Corporation {record['code']} is referenced by branch corporations."
+            ),
+        )
+        for record in plan.deletes
+        if record["id"] in referenced
+    ]
+    deleted = _delete(
+        [record for record in plan.deletes if record["id"] not in referenced],
+        corporations_client.delete_corporation,
+        max_workers,
+    )
+    return {
+        "corporations": UpsertResult(
+            inserted, updated, deleted, plan.unchanged, corporations_skipped
+        ),
+        "branch_corporations": branches,
+    }
@@ -1,15 +1,39 @@
-"""This module import all methods scripts"""
-
-from mindsight_people_control_api.scripts.area_records import AreaRecords
-from mindsight_people_control_api.scripts.areas import Areas
-from mindsight_people_control_api.scripts.employee_areas import EmployeeAreas
-from mindsight_people_control_api.scripts.employee_managers import EmployeeManagers
-from mindsight_people_control_api.scripts.employee_positions import EmployeePositions
-from mindsight_people_control_api.scripts.employee_records import EmployeeRecord
-from mindsight_people_control_api.scripts.employees import Employees
-from mindsight_people_control_api.scripts.parent_areas import ParentAreas
-from mindsight_people_control_api.scripts.positions import Positions
-from mindsight_people_control_api.scripts.position_records import PositionRecords
-from mindsight_people_control_api.scripts.users import Users
-from mindsight_people_control_api.scripts.corporations import Corporations
-from mindsight_people_control_api.scripts.branch_corporations import BranchCorporations
+"""This module import all methods scripts
+
+Endpoint classes are imported on first access, so using one endpoint doesn't
+load the modules of all others.
+"""
+
+import importlib
+
+_ENDPOINT_MODULES = {
+    "AreaRecords": "area_records",
+    "Areas": "areas",
+    "EmployeeAreas": "employee_areas",
+    "EmployeeManagers": "employee_managers",
+    "EmployeePositions": "employee_positions",
+    "EmployeeRecord": "employee_records",
+    "Employees": "employees",
+    "ParentAreas": "parent_areas",
+    "Positions": "positions",
+    "PositionRecords": "position_records",
+    "Users": "users",
+    "Corporations": "corporations",
+    "BranchCorporations": "branch_corporations",
+}
+
+__all__ = list(_ENDPOINT_MODULES)
+
+
+def __getattr__(name: str):
+    if name not in _ENDPOINT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{_ENDPOINT_MODULES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,8 +16,8 @@ class AreaRecords(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Registros-de-area
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_AREAS_RECORDS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_AREAS_RECORDS, client=client)
 
     def get_list_area_records(
         self,
@@ -66,9 +66,42 @@ class AreaRecords(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_area_records(
+        self,
+        area: str = None,
+        code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        search: str = None,
+    ) -> int:
+        """Count area records requesting a minimal page, without loading results
+
+        Args:
+            area (str, Optional): Area name
+            code (str, Optional): Code of area
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            search: search
+        """
+        return self._count(
+            self.get_list_area_records,
+            area=area,
+            code=code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            search=search,
         )
 
     def get_retrieve_area_record(
@@ -1,11 +1,17 @@
 """This module provide methods to work with areas entity"""
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from datetime import date, datetime
+from typing import Iterable, List
 
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
 from mindsight_people_control_api.helpers.models import (
     ApiEndpoint,
     ApiPaginationResponse,
+    BulkResult,
 )
+from mindsight_people_control_api.helpers.tracing import operation_span
 from mindsight_people_control_api.settings import (
     API_ENDPOINT_AREAS,
     DATE_FORMAT,
@@ -18,8 +24,8 @@ class Areas(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Areas
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_AREAS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_AREAS, client=client)
 
     def get_list_areas(
         self,
@@ -71,9 +77,46 @@ class Areas(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_areas(
+        self,
+        name: str = None,
+        code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: str = None,
+        search: str = None,
+    ) -> int:
+        """Count areas requesting a minimal page, without loading results
+
+        Args:
+            name (str, Optional): area_name
+            code (str, Optional): Code of area
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get areas by status
+            search: search
+            }
+        """
+        return self._count(
+            self.get_list_areas,
+            name=name,
+            code=code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_area(
@@ -138,6 +181,7 @@ class Areas(ApiEndpoint):
         name: str,
         start_date: date,
         parent_area: int = None,
+        parent_area_code: str = None,
     ):
         """Create new area
         Reference:
@@ -148,8 +192,10 @@ class Areas(ApiEndpoint):
             name (str, Mandatory): Name of area
             start_date (date, Mandatory): Area start date
             parent_area (int, Optional): Parent area id
+            parent_area_code (str, Optional): Parent area code, used without parent_area
         """
         path = "/create_complete"
+        parent_area = self._reference_id("areas", parent_area, parent_area_code)
         data = {
             "code": code,
             "name": name,
@@ -159,6 +205,126 @@ class Areas(ApiEndpoint):
 
         return self._base_requests.post(path=path, data=data)
 
+    @staticmethod
+    def _area_tree(areas: dict) -> tuple:
+        """Get roots, children by parent code and topological order of areas
+        by code, raising ValueError on cycles.
+        """
+        children: dict = {}
+        roots = []
+        for code, area in areas.items():
+            parent_code = area.get("parent_area_code")
+            if area.get("parent_area") is None and parent_code in areas:
+                children.setdefault(parent_code, []).append(code)
+            else:
+                roots.append(code)
+
+        order = list(roots)
+        for code in order:  # Breadth first, parents before children
+            order.extend(children.get(code, ()))
+
+        if len(order) < len(areas):
+            # Areas not reached from roots have ancestors in a cycle
+            reached = set(order)
+            code = next(code for code in areas if code not in reached)
+            path = []
+            while code not in path:
+                path.append(code)
+                code = areas[code]["parent_area_code"]
+            cycle = path[path.index(code) :] + [code]
+            raise ValueError(f"Areas parents have a cycle: {' -> '.join(cycle)}.")
+
+        return roots, children, order
+
+    def post_create_areas(
+        self, areas: Iterable, max_workers: int = 8
+    ) -> List[BulkResult]:
+        """Create a tree of areas concurrently, each one once its parent is
+        created. Parents are resolved and cycles detected before any request.
+        Returns a BulkResult by code, parents first. Areas whose parent failed
+        aren't created and get an error.
+
+        Args:
+            areas (Iterable, Mandatory): Dicts of post_create_area arguments:
+                code, name, start_date and parent_area or parent_area_code,
+                which can be the code of another area of the tree
+            max_workers (int, Optional): Maximum concurrent requests, keep it up
+                to the client pool_maxsize
+        """
+        tree: dict = {}
+        for area in areas:
+            if area["code"] in tree:
+                raise ValueError(f"Area code {area['code']} is repeated.")
+            tree[area["code"]] = area
+
+        roots, children, order = self._area_tree(tree)
+        results: dict = {}
+        # Workers run a copy of the context, to trace under the operation span
+        with operation_span(
+            self._base_requests.tracer,
+            f"{self._base_requests.base_path} post_create_areas",
+            {"mindsight.count": len(tree)},
+        ):
+            parents = {
+                code: self._reference_id(
+                    "areas",
+                    tree[code].get("parent_area"),
+                    tree[code].get("parent_area_code"),
+                )
+                for code in roots
+            }
+
+            def create(code: str, parent_area: int) -> dict:
+                area = tree[code]
+                return self.post_create_area(
+                    code=code,
+                    name=area["name"],
+                    start_date=area["start_date"],
+                    parent_area=parent_area,
+                )
+
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                pending = {
+                    executor.submit(
+                        copy_context().run, create, code, parents[code]
+                    ): code
+                    for code in roots
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        code = pending.pop(future)
+                        try:
+                            record = future.result()
+
+                        except Exception as error:
+                            results[code] = BulkResult(code, error=error)
+                            descendants = list(children.get(code, ()))
+                            for child in descendants:
+                                descendants.extend(children.get(child, ()))
+                                results[child] = BulkResult(
+                                    child,
+                                    error=PeopleControlExceptions(
+                                        f"Parent area {code} wasn't created"
+                                    ),
+                                )
+                            continue
+
+                        results[code] = BulkResult(code, result=record)
+                        self._add_reference("areas", record)
+                        for child in children.get(code, ()):
+                            pending[
+                                executor.submit(
+                                    copy_context().run, create, child, record["id"]
+                                )
+                            ] = child
+
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return [results[code] for code in order]
+
     def patch_edit_area(
         self,
         _id: int,
@@ -190,9 +356,10 @@ class Areas(ApiEndpoint):
     def patch_edit_parent_area(
         self,
         _id: int,
-        parent_id: int,
-        start_date: date,
+        parent_id: int = None,
+        start_date: date = None,
         end_date: date = None,
+        parent_code: str = None,
     ) -> dict:
         """Edit parent area
         Reference:
@@ -200,14 +367,18 @@ class Areas(ApiEndpoint):
 
         Args:
             _id (int, Mandatory): Area id
-            parent_id (int, Mandatory): id of parent area
+            parent_id (int, Optional): id of parent area
             start_date (date, Mandatory): Parent area assignment start date
             end_date (date, Optional): Parent area assignment end date
+            parent_code (str, Optional): Code of parent area, used without parent_id
         """
         path = f"/{_id}/edit_parent"
+        parent_id = self._reference_id("areas", parent_id, parent_code)
+        if parent_id is None or start_date is None:
+            raise ValueError("Inform parent_id or parent_code, and start_date.")
         data = {
             "parent_id": parent_id,
             "start_date": start_date.strftime(DATE_FORMAT) if start_date else None,
-            "end_date": end_date.strftime(DATE_FORMAT) if start_date else None,
+            "end_date": end_date.strftime(DATE_FORMAT) if end_date else None,
         }
         return self._base_requests.patch(path=path, data=data)
@@ -1,7 +1,6 @@
 """This module provide methods to work with areas entity"""
 
 from datetime import datetime
-from mindsight_people_control_api.utils.aux_functions import generate_url
 from mindsight_people_control_api.helpers.models import (
     ApiEndpoint,
     ApiPaginationResponse,
@@ -17,8 +16,8 @@ class BranchCorporations(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Filiais
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_BRANCH_CORPORATIONS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_BRANCH_CORPORATIONS, client=client)
 
     def get_list_branch_corporations(
         self,
@@ -69,9 +68,45 @@ class BranchCorporations(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_branch_corporations(
+        self,
+        name__iexact: str = None,
+        code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        search: str = None,
+        expand: str = None,
+    ) -> int:
+        """Count branch corporations requesting a minimal page, without loading results
+
+        Args:
+            name__iexact (str, Optional): name__iexact
+            code (str, Optional): Code of corporation
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            search (str, Optional): A search term.
+            expand: (str, Optional): Possible to expand these fields in the response: uuid, branchs_corporation
+        """
+        return self._count(
+            self.get_list_branch_corporations,
+            name__iexact=name__iexact,
+            code=code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            search=search,
+            expand=expand,
         )
 
     def get_retrieve_branch_corporation(
@@ -134,7 +169,8 @@ class BranchCorporations(ApiEndpoint):
         self,
         code: str,
         name: str,
-        corporation_id: str,
+        corporation_id: str = None,
+        corporation_code: str = None,
     ):
         """Create new area
         Reference:
@@ -143,8 +179,13 @@ class BranchCorporations(ApiEndpoint):
         Args:
             code (str, Mandatory): Code of corporation
             name (str, Mandatory): Name of corporation
+            corporation_id (str, Optional): Corporation id
+            corporation_code (str, Optional): Corporation code, used without corporation_id
         """
         path = ""
+        corporation_id = self._reference_id(
+            "corporations", corporation_id, corporation_code
+        )
         data = {
             "code": code,
             "name": name,
@@ -16,8 +16,8 @@ class Corporations(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Empresas
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_CORPORATIONS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_CORPORATIONS, client=client)
 
     def get_list_corporations(
         self,
@@ -68,9 +68,45 @@ class Corporations(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_corporations(
+        self,
+        name__iexact: str = None,
+        code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        search: str = None,
+        expand: str = None,
+    ) -> int:
+        """Count corporations requesting a minimal page, without loading results
+
+        Args:
+            name__iexact (str, Optional): name__iexact
+            code (str, Optional): Code of corporation
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            search (str, Optional): A search term.
+            expand: (str, Optional): Possible to expand these fields in the response: uuid, branchs_corporation
+        """
+        return self._count(
+            self.get_list_corporations,
+            name__iexact=name__iexact,
+            code=code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            search=search,
+            expand=expand,
         )
 
     def get_retrieve_corporation(
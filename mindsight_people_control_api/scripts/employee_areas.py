@@ -12,7 +12,6 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_EMPLOYEES,
     DATETIME_FORMAT,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url
 
 
 class EmployeeAreas(ApiEndpoint):
@@ -20,8 +19,8 @@ class EmployeeAreas(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Areas-do-funcionario
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_EMPLOYEE_AREAS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_EMPLOYEE_AREAS, client=client)
 
     def get_list_employee_areas(
         self,
@@ -56,12 +55,12 @@ class EmployeeAreas(ApiEndpoint):
         path = ""
         parameters = {
             "area": (
-                generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
+                self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
                 if area_id
                 else None
             ),
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
@@ -81,9 +80,45 @@ class EmployeeAreas(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_employee_areas(
+        self,
+        area_id: int = None,
+        employee_id: int = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: str = None,
+        search: str = None,
+    ) -> int:
+        """Count employee areas requesting a minimal page, without loading results
+
+        Args:
+            area_id (int, Optional): Area id
+            employee_id (int, Optional): Employee id
+            created__gt (str, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (str, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (str, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (str, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get areas by status
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_employee_areas,
+            area_id=area_id,
+            employee_id=employee_id,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_employee_area_record(
@@ -121,12 +156,12 @@ class EmployeeAreas(ApiEndpoint):
 
         parameters = {
             "area": (
-                generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
+                self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
                 if area_id
                 else None
             ),
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
@@ -11,7 +11,6 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_EMPLOYEES,
     DATETIME_FORMAT,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url
 
 
 class EmployeeManagers(ApiEndpoint):
@@ -19,8 +18,8 @@ class EmployeeManagers(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Gestores-do-funcionario
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_EMPLOYEE_MANAGERS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_EMPLOYEE_MANAGERS, client=client)
 
     def get_list_employee_managers(
         self,
@@ -72,9 +71,45 @@ class EmployeeManagers(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_employee_managers(
+        self,
+        manager_id: int = None,
+        employee_id: int = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: bool = None,
+        search: str = None,
+    ) -> int:
+        """Count employee managers requesting a minimal page, without loading results
+
+        Args:
+            manager_id (int, Optional): Manager id
+            employee_id (int, Optional): Employee id
+            created__gt (str, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (str, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (str, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (str, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (bool, Optional): is_active: Flag to get managers by status
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_employee_managers,
+            manager_id=manager_id,
+            employee_id=employee_id,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_employee_managers_record(
@@ -112,12 +147,12 @@ class EmployeeManagers(ApiEndpoint):
 
         parameters = {
             "manager": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{manager_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{manager_id}")
                 if manager_id
                 else None
             ),
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
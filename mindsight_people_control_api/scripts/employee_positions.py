@@ -12,7 +12,6 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_POSITIONS,
     DATETIME_FORMAT,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url
 
 
 class EmployeePositions(ApiEndpoint):
@@ -20,8 +19,8 @@ class EmployeePositions(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Cargos-do-funcionario
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_EMPLOYEE_POSITIONS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_EMPLOYEE_POSITIONS, client=client)
 
     def get_list_employee_positions(
         self,
@@ -56,12 +55,12 @@ class EmployeePositions(ApiEndpoint):
         path = ""
         parameters = {
             "position": (
-                generate_url(base_path=API_ENDPOINT_POSITIONS, path=f"/{position_id}")
+                self._generate_url(base_path=API_ENDPOINT_POSITIONS, path=f"/{position_id}")
                 if position_id
                 else None
             ),
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
@@ -81,9 +80,45 @@ class EmployeePositions(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_employee_positions(
+        self,
+        position_id: int = None,
+        employee_id: int = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: str = None,
+        search: str = None,
+    ) -> int:
+        """Count employee positions requesting a minimal page, without loading results
+
+        Args:
+            position_id (int, Optional): Position id
+            employee_id (int, Optional): Employee id
+            created__gt (str, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (str, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (str, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (str, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get positions by status
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_employee_positions,
+            position_id=position_id,
+            employee_id=employee_id,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_employee_position_record(
@@ -121,12 +156,12 @@ class EmployeePositions(ApiEndpoint):
 
         parameters = {
             "position": (
-                generate_url(base_path=API_ENDPOINT_POSITIONS, path=f"/{position_id}")
+                self._generate_url(base_path=API_ENDPOINT_POSITIONS, path=f"/{position_id}")
                 if position_id
                 else None
             ),
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
@@ -9,7 +9,6 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_EMPLOYEES,
     DATETIME_FORMAT,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url
 
 
 class EmployeeRecord(ApiEndpoint):
@@ -17,8 +16,8 @@ class EmployeeRecord(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Registros-do-funcionario
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_EMPLOYEE_RECORDS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_EMPLOYEE_RECORDS, client=client)
 
     def get_list_employees_records(
         self,
@@ -50,7 +49,7 @@ class EmployeeRecord(ApiEndpoint):
         path = ""
         parameters = {
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
@@ -69,9 +68,40 @@ class EmployeeRecord(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_employees_records(
+        self,
+        employee_id: int = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        search: str = None,
+    ) -> int:
+        """Count employees records requesting a minimal page, without loading results
+
+        Args:
+            employee_id (int, Optional): Employee id
+            created__gt (str, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (str, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (str, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (str, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get areas by status
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_employees_records,
+            employee_id=employee_id,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            search=search,
         )
 
     def get_retrieve_employee_record(
@@ -107,7 +137,7 @@ class EmployeeRecord(ApiEndpoint):
 
         parameters = {
             "employee": (
-                generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
+                self._generate_url(base_path=API_ENDPOINT_EMPLOYEES, path=f"/{employee_id}")
                 if employee_id
                 else None
             ),
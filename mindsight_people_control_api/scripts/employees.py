@@ -15,7 +15,7 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_CORPORATIONS,
     API_ENDPOINT_BRANCH_CORPORATIONS,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url, remove_none_fields
+from mindsight_people_control_api.utils.aux_functions import remove_none_fields
 
 
 class Employees(ApiEndpoint):
@@ -23,8 +23,8 @@ class Employees(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Funcionarios
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_EMPLOYEES)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_EMPLOYEES, client=client)
 
     def get_list_employees(
         self,
@@ -74,9 +74,51 @@ class Employees(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_employees(
+        self,
+        first_name: str = None,
+        last_name: str = None,
+        email: str = None,
+        employee_code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: str = None,
+        search: str = None,
+    ) -> int:
+        """Count employees requesting a minimal page, without loading results
+
+        Args:
+            first_name (str, Optional): Employee first name
+            last_name (str, Optional): Employee last name
+            email (str, Optional): Employee email
+            employee_code (str, Optional): Employee code
+            created__gt (str, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (str, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (str, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (str, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get areas by status
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_employees,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            employee_code=employee_code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_employee(
@@ -153,6 +195,11 @@ class Employees(ApiEndpoint):
         systems_permissions: list = None,
         corporation: int = None,
         branch_corporation: int = None,
+        area_code: str = None,
+        position_code: str = None,
+        manager_code: str = None,
+        corporation_code: str = None,
+        branch_corporation_code: str = None,
     ):
         """Create new employee
         Reference:
@@ -169,8 +216,22 @@ class Employees(ApiEndpoint):
             area (int, Optional): Employee area id
             position (int, Optional): Employee position id
             manager (int, Optional): Employee manager id
+            area_code (str, Optional): Employee area code, used without area
+            position_code (str, Optional): Employee position code, used without position
+            manager_code (str, Optional): Manager employee code or email, used
+                without manager
+            corporation_code (str, Optional): Corporation code, used without corporation
+            branch_corporation_code (str, Optional): Branch corporation code, used
+                without branch_corporation
         """
         path = "/create_complete"
+        area = self._reference_id("areas", area, area_code)
+        position = self._reference_id("positions", position, position_code)
+        manager = self._reference_id("employees", manager, manager_code)
+        corporation = self._reference_id("corporations", corporation, corporation_code)
+        branch_corporation = self._reference_id(
+            "branch_corporations", branch_corporation, branch_corporation_code
+        )
         data = {
             "first_name": first_name,
             "last_name": last_name,
@@ -178,15 +239,15 @@ class Employees(ApiEndpoint):
             "email": email,
             "employee_code": employee_code,
             "start_date": start_date.strftime(DATE_FORMAT),
-            "area": generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area}")
+            "area": self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area}")
             if area
             else area,
-            "position": generate_url(
+            "position": self._generate_url(
                 base_path=API_ENDPOINT_POSITIONS, path=f"/{position}"
             )
             if position
             else position,
-            "manager": generate_url(
+            "manager": self._generate_url(
                 base_path=API_ENDPOINT_EMPLOYEES, path=f"/{manager}"
             )
             if manager
@@ -198,12 +259,12 @@ class Employees(ApiEndpoint):
             "work_type": work_type,
             "work_city": work_city,
             "systems_permissions": systems_permissions,
-            "corporation": generate_url(
+            "corporation": self._generate_url(
                 base_path=API_ENDPOINT_CORPORATIONS, path=f"/{corporation}"
             )
             if corporation
             else corporation,
-            "branch_corporation": generate_url(
+            "branch_corporation": self._generate_url(
                 base_path=API_ENDPOINT_BRANCH_CORPORATIONS,
                 path=f"/{branch_corporation}",
             )
@@ -220,6 +281,9 @@ class Employees(ApiEndpoint):
         area: int = None,
         position: int = None,
         manager: int = None,
+        area_code: str = None,
+        position_code: str = None,
+        manager_code: str = None,
     ):
         """Activate employee
         Reference:
@@ -231,16 +295,23 @@ class Employees(ApiEndpoint):
             area (int, Optional): Employee area id
             position (int, Optional): Employee position id
             manager (int, Optional): Employee manager id
+            area_code (str, Optional): Employee area code, used without area
+            position_code (str, Optional): Employee position code, used without position
+            manager_code (str, Optional): Manager employee code or email, used
+                without manager
         """
         path = f"{_id}/activate"
+        area = self._reference_id("areas", area, area_code)
+        position = self._reference_id("positions", position, position_code)
+        manager = self._reference_id("employees", manager, manager_code)
 
         data = {
             "start_date": start_date.strftime(DATE_FORMAT),
-            "area": generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area}"),
-            "position": generate_url(
+            "area": self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area}"),
+            "position": self._generate_url(
                 base_path=API_ENDPOINT_POSITIONS, path=f"/{position}"
             ),
-            "manager": generate_url(
+            "manager": self._generate_url(
                 base_path=API_ENDPOINT_EMPLOYEES, path=f"/{manager}"
             ),
         }
@@ -286,7 +357,12 @@ class Employees(ApiEndpoint):
         return self._base_requests.get(path=path)
 
     def post_change_current_area(
-        self, _id: int, area_id: int, start_date: date, review_access: bool = False
+        self,
+        _id: int,
+        area_id: int = None,
+        start_date: date = None,
+        review_access: bool = False,
+        area_code: str = None,
     ) -> dict:
         """Change employee current area
         Reference:
@@ -294,13 +370,18 @@ class Employees(ApiEndpoint):
 
         Args:
             _id (int, Mandatory): Employee id
-            area_id (int, Mandatory): New employee area id
+            area_id (int, Optional): New employee area id
+            start_date (date, Mandatory): Start date of change
             review_access (bool, Optional): Mark if this change will have review access
+            area_code (str, Optional): New area code, used without area_id
         """
         path = f"/{_id}/current_area"
+        area_id = self._reference_id("areas", area_id, area_code)
+        if area_id is None or start_date is None:
+            raise ValueError("Inform area_id or area_code, and start_date.")
 
         payload = {
-            "area": generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}"),
+            "area": self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}"),
             "start_date": start_date.strftime(DATE_FORMAT),
             "review_access": review_access,
         }
@@ -317,7 +398,12 @@ class Employees(ApiEndpoint):
         return self._base_requests.get(path=path)
 
     def post_change_current_manager(
-        self, _id: int, manager_id: int, start_date: date, review_access: bool = False
+        self,
+        _id: int,
+        manager_id: int = None,
+        start_date: date = None,
+        review_access: bool = False,
+        manager_code: str = None,
     ) -> dict:
         """Change employee current manager
         Reference:
@@ -325,13 +411,18 @@ class Employees(ApiEndpoint):
 
         Args:
             _id (int, Mandatory): Employee id
-            manager_id (int, Mandatory): New employee manager id
+            manager_id (int, Optional): New employee manager id
+            start_date (date, Mandatory): Start date of change
             review_access (bool, Optional): Mark if this change will have review access
+            manager_code (str, Optional): New manager employee code or email, used without manager_id
         """
         path = f"/{_id}/current_manager"
+        manager_id = self._reference_id("employees", manager_id, manager_code)
+        if manager_id is None or start_date is None:
+            raise ValueError("Inform manager_id or manager_code, and start_date.")
 
         payload = {
-            "manager": generate_url(
+            "manager": self._generate_url(
                 base_path=API_ENDPOINT_EMPLOYEES, path=f"/{manager_id}"
             ),
             "start_date": start_date.strftime(DATE_FORMAT),
@@ -350,7 +441,12 @@ class Employees(ApiEndpoint):
         return self._base_requests.get(path=path)
 
     def post_change_current_position(
-        self, _id: int, position_id: int, start_date: date, review_access: bool = False
+        self,
+        _id: int,
+        position_id: int = None,
+        start_date: date = None,
+        review_access: bool = False,
+        position_code: str = None,
     ) -> dict:
         """Change employee current position
         Reference:
@@ -358,13 +454,18 @@ class Employees(ApiEndpoint):
 
         Args:
             _id (int, Mandatory): Employee id
-            position_id (int, Mandatory): New employee position id
+            position_id (int, Optional): New employee position id
+            start_date (date, Mandatory): Start date of change
             review_access (bool, Optional): Mark if this change will have review access
+            position_code (str, Optional): New position code, used without position_id
         """
         path = f"/{_id}/current_position"
+        position_id = self._reference_id("positions", position_id, position_code)
+        if position_id is None or start_date is None:
+            raise ValueError("Inform position_id or position_code, and start_date.")
 
         payload = {
-            "position": generate_url(
+            "position": self._generate_url(
                 base_path=API_ENDPOINT_POSITIONS, path=f"/{position_id}"
             ),
             "start_date": start_date.strftime(DATE_FORMAT),
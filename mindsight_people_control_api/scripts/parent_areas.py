@@ -10,7 +10,6 @@ from mindsight_people_control_api.settings import (
     API_ENDPOINT_PARENT_AREAS,
     DATETIME_FORMAT,
 )
-from mindsight_people_control_api.utils.aux_functions import generate_url
 
 
 class ParentAreas(ApiEndpoint):
@@ -18,8 +17,8 @@ class ParentAreas(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Areas-pai
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_PARENT_AREAS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_PARENT_AREAS, client=client)
 
     def get_list_parent_areas(
         self,
@@ -50,7 +49,7 @@ class ParentAreas(ApiEndpoint):
         path = ""
         parameters = {
             "area": (
-                generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
+                self._generate_url(base_path=API_ENDPOINT_AREAS, path=f"/{area_id}")
                 if area_id
                 else None
             ),
@@ -69,9 +68,39 @@ class ParentAreas(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_parent_areas(
+        self,
+        area_id: int = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        search: str = None,
+    ) -> int:
+        """Count parent areas requesting a minimal page, without loading results
+
+        Args:
+            area_id (int, Optional): Area id
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            search: search
+        """
+        return self._count(
+            self.get_list_parent_areas,
+            area_id=area_id,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            search=search,
         )
 
     def get_retrieve_parent_area(
@@ -105,7 +134,7 @@ class ParentAreas(ApiEndpoint):
 
         parameters = {
             "area": (
-                generate_url(base_path=API_ENDPOINT_AREAS, path=area_id)
+                self._generate_url(base_path=API_ENDPOINT_AREAS, path=area_id)
                 if area_id
                 else None
             ),
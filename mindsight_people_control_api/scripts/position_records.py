@@ -13,8 +13,8 @@ class PositionRecords(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Registros-de-cargo
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_POSITION_RECORDS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_POSITION_RECORDS, client=client)
 
     def get_list_position_records(
         self,
@@ -36,9 +36,23 @@ class PositionRecords(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_position_records(
+        self,
+        position: str = None,
+        search: str = None,
+    ) -> int:
+        """Count position records requesting a minimal page, without loading results
+
+        Args:
+            position (str, Optional): Positon name
+            search: search
+        """
+        return self._count(
+            self.get_list_position_records,
+            position=position,
+            search=search,
         )
 
     def get_retrieve_positon_record(
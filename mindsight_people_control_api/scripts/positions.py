@@ -18,8 +18,8 @@ class Positions(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Cargos
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_POSITIONS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_POSITIONS, client=client)
 
     def get_list_positions(
         self,
@@ -72,9 +72,46 @@ class Positions(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_positions(
+        self,
+        name: str = None,
+        code: str = None,
+        created__gt: datetime = None,
+        created__lt: datetime = None,
+        modified__gt: datetime = None,
+        modified__lt: datetime = None,
+        active: str = None,
+        search: str = None,
+    ) -> int:
+        """Count positions requesting a minimal page, without loading results
+
+        Args:
+            name (str, Optional): Position name
+            code (str, Optional): Code of position
+            created__gt (datetime, Optional): Datetime to apply filter ">=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            created__lt (datetime, Optional): Datetime to apply filter "<=" on created dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__gt (datetime, Optional): Datetime to apply filter ">=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            modified__lt (datetime, Optional): Datetime to apply filter "<=" on modified dates.
+                Format "%Y-%m-%d %H:%M:%S"
+            active (str, Optional): is_active: Flag to get positions by status
+            search: search
+            }
+        """
+        return self._count(
+            self.get_list_positions,
+            name=name,
+            code=code,
+            created__gt=created__gt,
+            created__lt=created__lt,
+            modified__gt=modified__gt,
+            modified__lt=modified__lt,
+            active=active,
+            search=search,
         )
 
     def get_retrieve_position(
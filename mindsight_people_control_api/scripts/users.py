@@ -14,8 +14,8 @@ class Users(ApiEndpoint):
     Reference: https://controle.mindsight.com.br/stone/api/v1/docs/#tag/Users
     """
 
-    def __init__(self) -> None:
-        super().__init__(API_ENDPOINT_USERS)
+    def __init__(self, client=None) -> None:
+        super().__init__(API_ENDPOINT_USERS, client=client)
 
     def get_list_users(
         self,
@@ -34,9 +34,20 @@ class Users(ApiEndpoint):
             "search": search,
             "page_size": self.page_size,
         }
-        return ApiPaginationResponse(
-            **self._base_requests.get(path=path, parameters=parameters),
-            headers=self._base_requests.headers,
+        return self._paginate(path=path, parameters=parameters)
+
+    def count_users(
+        self,
+        search: str = None,
+    ) -> int:
+        """Count users requesting a minimal page, without loading results
+
+        Args:
+            search: A search term.
+        """
+        return self._count(
+            self.get_list_users,
+            search=search,
         )
 
     def get_retrieve_user(
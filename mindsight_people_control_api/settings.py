@@ -1,15 +1,32 @@
 """This module define project configurations variables"""
 
-from decouple import config
-
 # API Constants
-API_TOKEN = config("MINDSIGHT_CP_API_TOKEN")
-API_BASE_URL = config("MINDSIGHT_CP_API_URL")
+# API_TOKEN and API_BASE_URL are read from environment on first access (see __getattr__)
 API_VERSION = "v1"
+ENVIRONMENT_VARIABLES = {
+    "API_TOKEN": "MINDSIGHT_CP_API_TOKEN",
+    "API_BASE_URL": "MINDSIGHT_CP_API_URL",
+}
 
 # Request config
 PAGE_SIZE: int = 1000
-TIMEOUT: int = 600  # Default set to 600 seconds (10 minutes)
+TIMEOUT: int = 600  # Read timeout, default set to 600 seconds (10 minutes)
+CONNECT_TIMEOUT: float = 10  # Seconds to establish a connection
+DEADLINE: float = None  # Seconds of a whole operation (all pages and retries)
+
+# Pagination config
+PAGINATION_MODE: str = "offset"  # "offset" follows next links, "keyset" uses id cursor
+KEYSET_CURSOR_PARAMETER: str = "id__gt"
+STREAM_CHUNK_SIZE: int = 65536  # Bytes read at a time by streamed pages
+
+# Cache of retrieved records (ApiEndpoint.retrieve_many)
+RECORD_CACHE_SIZE: int = 1000  # Records kept per endpoint
+RECORD_CACHE_TTL: float = 300.0  # Seconds a record is served
+
+# Automatic page size config (ApiEndpoint.page_size = "auto")
+AUTO_PAGE_SIZE_TARGET_LATENCY: float = 10.0  # Seconds per page request
+AUTO_PAGE_SIZE_MIN: int = 100
+AUTO_PAGE_SIZE_MAX: int = 5000
 
 # Date formats
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
@@ -29,3 +46,17 @@ API_ENDPOINT_POSITIONS = "/positions"
 API_ENDPOINT_POSITION_RECORDS = "/position_records"
 API_ENDPOINT_CORPORATIONS = "/corporations"
 API_ENDPOINT_BRANCH_CORPORATIONS = "/branch_corporations"
+
+
+def __getattr__(name: str):
+    """Resolve environment settings only when they are used, so importing the
+    package doesn't parse environment or fail without the variables.
+    """
+    if name not in ENVIRONMENT_VARIABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from decouple import config
+
+    value = config(ENVIRONMENT_VARIABLES[name])
+    globals()[name] = value
+    return value
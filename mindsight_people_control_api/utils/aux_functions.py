@@ -1,15 +1,120 @@
 """This module provide aux functions to distinct proposes"""
 
-from mindsight_people_control_api.settings import API_BASE_URL, API_VERSION
+import gzip
+import queue
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
 
+from mindsight_people_control_api import settings
 
-def generate_url(base_path: str, path: str) -> str:
+FRACTION_PATTERN = re.compile(r"\.(\d+)")
+
+
+def generate_url(
+    base_path: str, path: str, base_url: str = None, api_version: str = None
+) -> str:
     """Aux function to generate a URL in Api format"""
-    return f"{API_BASE_URL}/{API_VERSION}{base_path}{path}/"
+    base_url = settings.API_BASE_URL if base_url is None else base_url
+    api_version = settings.API_VERSION if api_version is None else api_version
+    return f"{base_url}/{api_version}{base_path}{path}/"
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse api datetime, like "2024-01-31T12:00:00.123456Z". Fractions of
+    any length are read up to microseconds, fromisoformat of python < 3.11 only
+    accepts 3 or 6 digits.
+    """
+    value = FRACTION_PATTERN.sub(
+        lambda match: "." + match.group(1)[:6].ljust(6, "0"),
+        value.replace("Z", "+00:00"),
+        count=1,
+    )
+    return datetime.fromisoformat(value)
+
+
+def utc_datetime(value: datetime) -> datetime:
+    """Convert aware datetime to UTC, as api filters are formatted with the "Z"
+    suffix. Naive datetimes are taken as UTC.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc)
+
+
+def open_text(path: str, mode: str):
+    """Open utf-8 text file to read ("r") or write ("w"), gzip compressed for
+    ".gz" paths
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def related_id(value):
+    """Get id of a related record given as id or hyperlink, like
+    "https://.../api/v1/corporations/12/"
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, dict):
+        return value.get("id")
+    value = str(value).rstrip("/").rsplit("/", 1)[-1]
+    return int(value) if value.isdigit() else value
+
 
 def remove_none_fields(data: dict):
-        result = {}
-        for key, value in data.items():
-            if value is not None:
-                result[key] = value
-        return result
+    result = {}
+    for key, value in data.items():
+        if value is not None:
+            result[key] = value
+    return result
+
+
+def prefetch_iterator(iterable: Iterable, depth: int) -> Iterator:
+    """Consume iterable in a background thread keeping up to depth items ready,
+    so producing the next items overlaps with processing the current one.
+    Errors of the iterable are raised on the consumer side.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item, error=None) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(done)
+
+        except Exception as error:
+            put(done, error)
+
+        finally:
+            close = getattr(iterable, "close", None)
+            if close:
+                close()  # Run cleanup of a stopped generator in its thread
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+
+    finally:
+        stop.set()
@@ -0,0 +1,122 @@
+from datetime import date
+
+import pytest
+import requests
+
+from benchmarks.fake_server import FakePeopleControlServer
+import mindsight_people_control_api.client
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.scripts.areas import Areas
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.helpers.transport import HttpTransport
+
+DAY = date(2024, 1, 1)
+
+
+class FailingTransport(HttpTransport):
+    """Answer the creation of areas coded FAIL with a 404"""
+
+    def send(self, session, method, url, **kwargs):
+        if (kwargs.get("data") or {}).get("code") == "FAIL":
+            url = url.replace("/areas/", "/areas/missing/")
+        return super().send(session, method, url, **kwargs)
+
+
+def area(code: str, parent_code: str = None) -> dict:
+    return {
+        "code": code,
+        "name": code.title(),
+        "start_date": DAY,
+        "parent_area_code": parent_code,
+    }
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=0, areas=2, positions=0, corporations=0)
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with Client(
+        token="token", base_url=server.base_url, transport=FailingTransport()
+    ) as client:
+        yield client
+
+
+def created(server) -> dict:
+    return {
+        row["code"]: row.get("parent_area")
+        for row in server.state.tables["areas"].values()
+    }
+
+
+class TestPostCreateAreas:
+    def test_cycle_raises_before_any_request(self, server, client):
+        with pytest.raises(ValueError):
+            client.areas.post_create_areas(
+                [area("A", "C"), area("B", "A"), area("C", "B"), area("D", "AREA1")]
+            )
+
+        assert [method for method, _ in server.state.requests if method != "GET"] == []
+
+    def test_parents_are_created_first_and_external_parent_resolved(
+        self, server, client
+    ):
+        results = client.areas.post_create_areas(
+            [area("CHILD", "NEW"), area("NEW", "AREA1"), area("ROOT")]
+        )
+
+        keys = [result.key for result in results]
+        assert keys.index("NEW") < keys.index("CHILD")
+        assert all(result.error is None for result in results)
+        ids = {result.key: result.result["id"] for result in results}
+        tree = created(server)
+        assert str(tree["NEW"]) == "1"
+        assert str(tree["CHILD"]) == str(ids["NEW"])
+        assert not tree["ROOT"]
+
+    def test_descendants_of_failed_area_are_reported_and_not_created(
+        self, server, client
+    ):
+        results = client.areas.post_create_areas(
+            [
+                area("ROOT"),
+                area("FAIL", "ROOT"),
+                area("CHILD", "FAIL"),
+                area("GRANDCHILD", "CHILD"),
+                area("OK", "ROOT"),
+            ]
+        )
+
+        errors = {result.key: result.error for result in results}
+        assert errors["ROOT"] is None and errors["OK"] is None
+        assert isinstance(errors["FAIL"], requests.HTTPError)
+        assert isinstance(errors["CHILD"], PeopleControlExceptions)
+        assert isinstance(errors["GRANDCHILD"], PeopleControlExceptions)
+        assert set(created(server)) == {"AREA1", "AREA2", "ROOT", "OK"}
+
+    def test_created_areas_update_loaded_references(self, server, client):
+        client.references.load("areas")
+        (result,) = client.areas.post_create_areas([area("NEW", "AREA1")])
+        requests_sent = len(server.state.requests)
+
+        # Resolved without a refresh
+        assert client.references.resolve("areas", "NEW") == result.result["id"]
+        assert len(server.state.requests) == requests_sent
+
+    def test_endpoint_without_client_doesnt_create_a_client(self, server, monkeypatch):
+        monkeypatch.setenv("MINDSIGHT_CP_API_URL", server.base_url)
+        monkeypatch.setenv("MINDSIGHT_CP_API_TOKEN", "token")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("A client was created")
+
+        monkeypatch.setattr(mindsight_people_control_api.client, "Client", fail)
+        areas = Areas()
+        results = areas.post_create_areas([area("ROOT"), area("CHILD", "ROOT")])
+
+        assert all(result.error is None for result in results)
+        assert areas._references is None
@@ -0,0 +1,27 @@
+import tracemalloc
+
+import pytest
+
+from benchmarks.run_benchmarks import SCENARIOS, main, parse_arguments, run_scenario
+
+
+class TestBenchmarks:
+    def test_scenarios_run_offline(self):
+        results = main(["--employees", "150", "--writes", "5", "--page-size", "40"])
+
+        assert [result["scenario"] for result in results] == list(SCENARIOS)
+        for result in results:
+            assert result["failure"] is None
+            assert result["records"] == (
+                5 if result["scenario"] == "bulk_writes" else 150
+            )
+            assert result["p50_ms"] <= result["p99_ms"]
+
+    def test_tracing_stops_when_a_scenario_raises(self):
+        def broken(client, options):
+            raise RuntimeError("broken scenario")
+
+        with pytest.raises(RuntimeError):
+            run_scenario("broken", broken, parse_arguments(["--employees", "10"]))
+
+        assert not tracemalloc.is_tracing()
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.change_feed import ChangeFeedPoller
+from mindsight_people_control_api.helpers.checkpoints import MemoryCheckpointStore
+from mindsight_people_control_api.utils.aux_functions import (
+    parse_datetime,
+    utc_datetime,
+)
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=0, areas=3, positions=0, corporations=0)
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with Client(token="token", base_url=server.base_url) as client:
+        yield client
+
+
+def poller(client, store=None) -> tuple:
+    changes = []
+    feed = ChangeFeedPoller(client, entities=("areas",), checkpoint_store=store)
+    feed.subscribe(lambda change: changes.append(change.record["code"]))
+    return feed, changes
+
+
+class TestChangeFeedPoller:
+    def test_boundary_rows_are_delivered_once(self, server, client):
+        feed, changes = poller(client)
+
+        assert feed.poll_once() == 3
+        assert feed.poll_once() == 0  # Boundary rows requested again, skipped
+        assert changes == ["AREA1", "AREA2", "AREA3"]
+        assert feed.watermark("areas") == parse_datetime(
+            server.state.tables["areas"][3]["modified"]
+        )
+
+    def test_rows_modified_in_the_watermark_second_are_delivered(self, server, client):
+        feed, changes = poller(client)
+        feed.poll_once()
+        server.state.tables["areas"][99] = {
+            "id": 99,
+            "code": "LATE",
+            "modified": server.state.tables["areas"][3]["modified"],
+        }
+        server.state.update("areas", 1, {"name": "Renamed"})
+
+        assert feed.poll_once() == 2
+        assert changes[3:] == ["AREA1", "LATE"]
+        assert feed.poll_once() == 0
+
+    def test_restarted_poller_resumes_from_checkpoint(self, server, client):
+        store = MemoryCheckpointStore()
+        poller(client, store)[0].poll_once()
+        server.state.insert("areas", {"code": "NEW"})
+
+        feed, changes = poller(client, store)
+        assert feed.poll_once() == 1 and changes == ["NEW"]
+
+    def test_watermark_with_offset_is_sent_in_utc(self, server, client):
+        # 2024-01-01T00:00:02Z, the modified datetime of AREA2
+        start_from = datetime(
+            2023, 12, 31, 21, 0, 2, tzinfo=timezone(timedelta(hours=-3))
+        )
+        changes = []
+        feed = ChangeFeedPoller(client, entities=("areas",), start_from=start_from)
+        feed.subscribe(lambda change: changes.append(change.record["code"]))
+
+        feed.poll_once()
+
+        _, url = server.state.requests[-1]
+        query = parse_qs(urlparse(url).query)
+        assert query["modified__gt"] == ["2024-01-01T00:00:01Z"]
+        assert changes == ["AREA2", "AREA3"]
+
+
+def test_utc_datetime():
+    local = datetime(2024, 1, 31, 9, tzinfo=timezone(timedelta(hours=-3)))
+    assert utc_datetime(local) == local
+    assert utc_datetime(local).tzinfo == timezone.utc
+    assert utc_datetime(local).hour == 12
+    assert utc_datetime(datetime(2024, 1, 31, 9)) == datetime(2024, 1, 31, 9)
+
+
+@pytest.mark.parametrize(
+    "value, microsecond",
+    [
+        ("2024-01-31T12:00:00Z", 0),
+        ("2024-01-31T12:00:00.1Z", 100000),
+        ("2024-01-31T12:00:00.12Z", 120000),
+        ("2024-01-31T12:00:00.123Z", 123000),
+        ("2024-01-31T12:00:00.1234Z", 123400),
+        ("2024-01-31T12:00:00.12345Z", 123450),
+        ("2024-01-31T12:00:00.123456Z", 123456),
+        ("2024-01-31T12:00:00.1234567Z", 123456),
+    ],
+)
+def test_parse_datetime_fractions(value, microsecond):
+    expected = datetime(2024, 1, 31, 12, microsecond=microsecond, tzinfo=timezone.utc)
+    assert parse_datetime(value) == expected
@@ -0,0 +1,59 @@
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.checkpoints import (
+    CheckpointStore,
+    MemoryCheckpointStore,
+)
+
+
+class TestCheckpoints:
+    def test_store_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            CheckpointStore()
+
+    def test_resumed_get_all_requires_partial_ok(self):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.page_size = 100
+                store = MemoryCheckpointStore()
+                pagination = client.employees.get_list_employees()
+                pages = pagination.iter_pages(checkpoint_store=store)
+                next(pages)
+                next(pages)
+                pages.close()
+
+                with pytest.raises(ValueError):
+                    client.employees.get_list_employees().get_all(
+                        checkpoint_store=store
+                    )
+                resumed = client.employees.get_list_employees().get_all(
+                    checkpoint_store=store, partial_ok=True
+                )
+                assert [record["id"] for record in resumed.results] == list(
+                    range(101, 251)
+                )
+
+    @pytest.mark.parametrize("pagination", ["offset", "keyset"])
+    def test_resume_with_another_page_size(self, pagination):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.pagination = pagination
+                client.employees.page_size = 50
+                store = MemoryCheckpointStore()
+                pages = client.employees.get_list_employees().iter_pages(
+                    checkpoint_store=store
+                )
+                next(pages)
+                next(pages)
+                pages.close()
+
+                client.employees.page_size = 100
+                resumed = client.employees.get_list_employees().iter_results(
+                    checkpoint_store=store
+                )
+                # Resumes after the first page, the second one wasn't processed
+                assert [record["id"] for record in resumed] == list(range(51, 251))
@@ -0,0 +1,143 @@
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers import models
+from mindsight_people_control_api.helpers.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+)
+from mindsight_people_control_api.helpers.exceptions import CircuitOpenException
+from mindsight_people_control_api.helpers.transport import Transport
+
+
+class Interrupted(BaseException):
+    pass
+
+
+class InterruptedTransport(Transport):
+    def send(self, session, method, url, **kwargs):
+        raise Interrupted()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def breaker(**kwargs) -> CircuitBreaker:
+    clock = FakeClock()
+    settings = {"minimum_requests": 4, "open_seconds": 30, "clock": clock}
+    return CircuitBreaker(**{**settings, **kwargs}), clock
+
+
+def call(circuit: CircuitBreaker, failed: bool = False, elapsed: float = 0.1):
+    circuit.record(elapsed=elapsed, failed=failed, probe=circuit.before_call())
+
+
+class TestCircuitBreaker:
+    def test_open_on_failure_rate(self):
+        circuit, _ = breaker(failure_rate=0.5)
+        call(circuit)
+        call(circuit)
+        call(circuit, failed=True)
+        assert circuit.state == CLOSED  # Under minimum_requests
+        call(circuit, failed=True)
+        assert circuit.state == OPEN
+
+    def test_open_on_slow_rate(self):
+        circuit, _ = breaker(slow_call_seconds=1, slow_call_rate=0.75)
+        call(circuit, elapsed=2)
+        call(circuit, elapsed=2)
+        call(circuit, elapsed=0.1)
+        call(circuit, elapsed=2)
+        assert circuit.state == OPEN
+
+    def test_fail_fast_while_open_and_half_open_after_open_seconds(self):
+        circuit, clock = breaker()
+        for _ in range(4):
+            call(circuit, failed=True)
+        with pytest.raises(CircuitOpenException):
+            circuit.before_call()
+
+        clock.now += 30
+        assert circuit.state == HALF_OPEN
+        assert circuit.before_call() is True
+        with pytest.raises(CircuitOpenException):
+            circuit.before_call()  # Probe limit reached
+        circuit.record(elapsed=0.1, failed=False, probe=True)
+        assert circuit.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        circuit, clock = breaker(half_open_probes=2)
+        for _ in range(4):
+            call(circuit, failed=True)
+        clock.now += 30
+        call(circuit)
+        assert circuit.state == HALF_OPEN
+        call(circuit, failed=True)
+        assert circuit.state == OPEN
+
+    def test_calls_allowed_before_opening_dont_count_as_probes(self):
+        circuit, clock = breaker()
+        slow_call = circuit.before_call()  # Allowed while closed
+        for _ in range(4):
+            call(circuit, failed=True)
+        clock.now += 30
+        probe = circuit.before_call()
+        circuit.record(elapsed=0.1, failed=True, probe=slow_call)
+        assert circuit.state == HALF_OPEN
+        with pytest.raises(CircuitOpenException):
+            circuit.before_call()  # Still one probe in flight
+        circuit.record(elapsed=0.1, failed=False, probe=probe)
+        assert circuit.state == CLOSED
+
+    def test_pagination_fails_fast_while_open(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(models, "sleep", sleeps.append)
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=100, areas=5)
+            with Client(
+                token="token", base_url=server.base_url, circuit_breaker=True
+            ) as client:
+                client.employees.page_size = 50
+                pagination = client.employees.get_list_employees()
+                circuit = client.employees._base_requests.circuit_breaker
+                for _ in range(circuit.minimum_requests):
+                    circuit.record(elapsed=0.1, failed=True)
+                assert circuit.state == OPEN
+
+                with pytest.raises(CircuitOpenException):
+                    pagination.get_all(retries=3)
+                assert sleeps == []
+
+    def test_interrupted_probe_gives_back_its_slot(self):
+        with Client(
+            token="token",
+            base_url="http://interrupted.invalid/api",
+            circuit_breaker={"open_seconds": 0, "minimum_requests": 1},
+            transport=InterruptedTransport(),
+        ) as client:
+            circuit = client.employees._base_requests.circuit_breaker
+            circuit.record(elapsed=0.1, failed=True)
+            assert circuit.state == HALF_OPEN
+
+            for _ in range(2):  # Second call fails fast if the slot leaked
+                with pytest.raises(Interrupted):
+                    client.employees.get_retrieve_employee(1)
+            assert circuit.before_call() is True
+
+    def test_registry_keeps_breakers_by_settings(self):
+        registry = CircuitBreakers()
+        default = registry.get("http://api", None)
+        strict = registry.get("http://api", None, failure_rate=0.1)
+
+        assert registry.get("http://api", None) is default
+        assert registry.get("http://api", None, failure_rate=0.1) is strict
+        assert strict is not default and strict.failure_rate == 0.1
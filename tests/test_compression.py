@@ -0,0 +1,93 @@
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.compression import (
+    SUPPORTED_ENCODINGS,
+    accept_encoding,
+)
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=120, areas=5)
+        server.state.compression = True
+        yield server
+
+
+def list_employees(server, stream: bool = False, **config) -> tuple:
+    """List employees returning their ids and the after_response events"""
+    events = []
+    with Client(token="token", base_url=server.base_url, **config) as client:
+        client.hooks.register("after_response", lambda **event: events.append(event))
+        client.employees.page_size = 50
+        pagination = client.employees.get_list_employees()
+        results = list(pagination.iter_results(stream=stream))
+    return [record["id"] for record in results], events
+
+
+class TestAcceptEncoding:
+    def test_all_supported_encodings(self):
+        assert {"gzip", "deflate"} <= set(SUPPORTED_ENCODINGS)
+        assert accept_encoding(True).split(", ")[0] == SUPPORTED_ENCODINGS[0]
+
+    def test_preference_order(self):
+        assert accept_encoding(("deflate", "gzip")) == "deflate, gzip;q=0.9"
+
+    def test_disabled(self):
+        assert accept_encoding(False) == "identity"
+
+    def test_unsupported_encoding(self):
+        with pytest.raises(ValueError):
+            accept_encoding(("gzip", "lzma"))
+
+
+class TestCompressedResponses:
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_decodes_compressed_pages(self, server, encoding, stream):
+        ids, events = list_employees(server, stream=stream, compression=(encoding,))
+
+        assert ids == list(range(1, 121))
+        assert server.state.headers[-1]["Accept-Encoding"] == encoding
+        if not stream:
+            assert {event["content_encoding"] for event in events} == {encoding}
+            assert all(
+                event["bytes_in_compressed"] < event["bytes_in"] for event in events
+            )
+
+    def test_preferred_encoding_is_used(self, server):
+        _, events = list_employees(server, compression=("deflate", "gzip"))
+
+        assert {event["content_encoding"] for event in events} == {"deflate"}
+
+    def test_uncompressed_when_disabled(self, server):
+        ids, events = list_employees(server, compression=False)
+
+        assert ids == list(range(1, 121))
+        assert server.state.headers[-1]["Accept-Encoding"] == "identity"
+        assert {event["content_encoding"] for event in events} == {None}
+        assert all(
+            event["bytes_in_compressed"] == event["bytes_in"] for event in events
+        )
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_server_ignoring_accept_encoding(self, server, stream):
+        server.state.compression = False
+        ids, events = list_employees(server, stream=stream, compression=True)
+
+        assert ids == list(range(1, 121))
+        assert "gzip" in server.state.headers[-1]["Accept-Encoding"]
+        assert {event["content_encoding"] for event in events} == {None}
+
+    def test_small_responses_are_not_compressed(self, server):
+        events = []
+        with Client(token="token", base_url=server.base_url) as client:
+            client.hooks.register(
+                "after_response", lambda **event: events.append(event)
+            )
+            record = client.employees.get_retrieve_employee(_id=1)
+
+        assert record["id"] == 1
+        assert events[0]["content_encoding"] is None
@@ -0,0 +1,24 @@
+import pytest
+
+from mindsight_people_control_api import Client, ClientConfig
+
+
+class TestClientConfig:
+    def test_endpoint_timeouts_overrides(self):
+        config = ClientConfig(
+            token="token",
+            base_url="http://localhost/api",
+            endpoint_timeouts={"/employees": {"deadline": 60, "timeout": 5}},
+        )
+        with Client(config) as client:
+            assert client.employees.deadline == 60
+            assert client.employees.timeout == 5
+            assert client.areas.timeout == config.timeout
+
+    def test_reject_unknown_endpoint_timeouts(self):
+        with pytest.raises(ValueError):
+            ClientConfig(
+                token="token",
+                base_url="http://localhost/api",
+                endpoint_timeouts={"/employees": {"dealine": 60}},
+            )
@@ -0,0 +1,25 @@
+from mindsight_people_control_api.helpers.consistency import PaginationGuard
+
+
+class TestPaginationGuard:
+    def test_drop_repeated_and_fetch_skipped_rows(self):
+        rows = {_id: {"id": _id} for _id in range(1, 11)}
+        guard = PaginationGuard([rows[1], rows[2], rows[3]], count=10)
+        # Row 4 is skipped and row 3 repeated by pages shifted between requests
+        assert guard.filter([rows[3], rows[5], rows[6]], count=10) == [
+            rows[5],
+            rows[6],
+        ]
+        assert guard.filter([rows[7], rows[8], rows[9], rows[10]], count=10) == [
+            rows[7],
+            rows[8],
+            rows[9],
+            rows[10],
+        ]
+
+        def fetch_range(lower, upper):
+            return [rows[_id] for _id in range(lower + 1, upper)]
+
+        assert guard.duplicates == 1
+        assert guard.find_missing(10, fetch_range) == [rows[4]]
+        assert guard.unresolved(10) == 0
@@ -0,0 +1,50 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=120, areas=10)
+        for _id in range(1, 121, 3):
+            server.state.update("employees", _id, {"active": False})
+        yield server
+
+
+class TestCount:
+    @pytest.mark.parametrize(
+        "filters", [{}, {"active": "true"}, {"active": "false"}, {"search": "name11"}]
+    )
+    def test_count_matches_listed_records(self, server, filters):
+        with Client(token="token", base_url=server.base_url) as client:
+            client.employees.page_size = 50
+            listed = list(client.employees.get_list_employees(**filters).iter_results())
+
+            server.state.requests.clear()
+            assert client.employees.count_employees(**filters) == len(listed)
+            assert len(server.state.requests) == 1
+
+            _, url = server.state.requests[0]
+            assert parse_qs(urlparse(url).query)["page_size"] == ["1"]
+
+    def test_count_areas(self, server):
+        with Client(token="token", base_url=server.base_url) as client:
+            listed = list(client.areas.get_list_areas(code="AREA3").iter_results())
+            assert client.areas.count_areas(code="AREA3") == len(listed) == 1
+            assert client.areas.count_areas() == 10
+
+    def test_count_rejects_unknown_filters(self, server):
+        with Client(token="token", base_url=server.base_url) as client:
+            with pytest.raises(TypeError):
+                client.employees.count_employees(activ="true")
+
+    def test_list_after_count_uses_page_size(self, server):
+        with Client(token="token", base_url=server.base_url) as client:
+            client.employees.page_size = 50
+            client.employees.count_employees()
+            pagination = client.employees.get_list_employees()
+            assert len(pagination.results) == 50
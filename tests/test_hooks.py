@@ -0,0 +1,58 @@
+import logging
+import time
+from itertools import islice
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers import models
+
+
+class TestPaginationHooks:
+    @pytest.mark.parametrize(
+        "options", [{}, {"prefetch": 2}, {"stream": True}], ids=str
+    )
+    def test_after_pagination_of_stopped_iteration(self, options):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.page_size = 50
+                events = []
+                client.hooks.register(
+                    "after_pagination", lambda **event: events.append(event)
+                )
+                records = client.employees.get_list_employees().iter_results(**options)
+                assert len(list(islice(records, 120))) == 120
+                records.close()
+                for _ in range(100):  # Prefetch stops in a background thread
+                    if events:
+                        break
+                    time.sleep(0.01)
+
+                assert len(events) == 1
+                assert events[0]["completed"] is False
+
+                list(client.employees.get_list_employees().iter_results(**options))
+                assert events[-1]["completed"] is True
+                assert events[-1]["pages"] == 5
+
+    def test_retries_are_logged(self, monkeypatch, caplog):
+        monkeypatch.setattr(models, "sleep", lambda seconds: None)
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=100, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.page_size = 50
+                pagination = client.employees.get_list_employees()
+                server.state.error_rate = 1.0
+                with caplog.at_level(logging.WARNING, logger=models.__name__):
+                    with pytest.raises(Exception):
+                        pagination.get_all(retries=2)
+
+                retries = [
+                    record
+                    for record in caplog.records
+                    if record.name == models.__name__
+                ]
+                assert len(retries) == 2
+                assert "Retry in 30s" in retries[0].getMessage()
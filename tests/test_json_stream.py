@@ -0,0 +1,65 @@
+import json
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers import models
+from mindsight_people_control_api.helpers.json_stream import ResultsStream
+from mindsight_people_control_api.helpers.transport import HttpTransport
+
+
+class FailingTransport(HttpTransport):
+    """Answer the second request with a 404, keeping the responses"""
+
+    def __init__(self) -> None:
+        self.responses = []
+
+    def send(self, session, method, url, **kwargs):
+        if len(self.responses) == 1:
+            url = url.replace("/employees/", "/employees/missing/")
+        response = super().send(session, method, url, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+class TestResultsStream:
+    def test_stream_results_of_chunked_body(self):
+        data = {
+            "count": 2,
+            "next": None,
+            "previous": None,
+            "results": [{"id": 1, "name": "João"}, {"id": 2, "value": 12345}],
+        }
+        body = json.dumps(data, ensure_ascii=False).encode()
+        for size in (1, 5, len(body)):
+            stream = ResultsStream(
+                body[i : i + size] for i in range(0, len(body), size)
+            )
+            assert list(stream) == data["results"]
+            assert stream.fields == {"count": 2, "next": None, "previous": None}
+            assert stream.bytes_read == len(body)
+
+    def test_streamed_pagination(self):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.page_size = 100
+                expected = client.employees.get_list_employees().get_all().results
+                pagination = client.employees.get_list_employees()
+                assert list(pagination.iter_results(stream=True)) == expected
+                assert pagination.pages == 3
+
+    def test_close_failed_streamed_page_before_retry(self, monkeypatch):
+        monkeypatch.setattr(models, "sleep", lambda seconds: None)
+        transport = FailingTransport()
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(
+                token="token", base_url=server.base_url, transport=transport
+            ) as client:
+                client.employees.page_size = 100
+                pagination = client.employees.get_list_employees()
+                records = list(pagination.iter_results(stream=True, retries=1))
+                assert len(records) == 250
+                failed = transport.responses[1]
+                assert failed.status_code == 404
+                assert failed.raw.closed
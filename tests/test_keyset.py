@@ -0,0 +1,84 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=250, areas=5)
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with Client(token="token", base_url=server.base_url) as client:
+        client.employees.pagination = "keyset"
+        client.employees.page_size = 100
+        yield client
+
+
+def list_queries(server) -> list:
+    return [
+        parse_qs(urlparse(url).query)
+        for method, url in server.state.requests
+        if method == "GET" and urlparse(url).path.rstrip("/").endswith("employees")
+    ]
+
+
+class TestKeysetPagination:
+    def test_pages_follow_last_seen_id(self, server, client):
+        pages = list(client.employees.get_list_employees().iter_pages())
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert [record["id"] for page in pages for record in page] == list(
+            range(1, 251)
+        )
+        cursors = [query.get("id__gt") for query in list_queries(server)]
+        assert cursors == [None, ["100"], ["200"]]
+        assert all("page" not in query for query in list_queries(server))
+
+    def test_last_full_page_ends_pagination(self, server, client):
+        for _id in range(201, 251):
+            del server.state.tables["employees"][_id]
+
+        pages = list(client.employees.get_list_employees().iter_pages())
+
+        assert [len(page) for page in pages] == [100, 100]
+        assert len(list_queries(server)) == 2
+
+    def test_id_gap_across_page_boundary(self, server, client):
+        for _id in range(95, 111):
+            del server.state.tables["employees"][_id]
+
+        results = list(client.employees.get_list_employees().iter_results())
+
+        expected = [_id for _id in range(1, 251) if not 95 <= _id <= 110]
+        assert [record["id"] for record in results] == expected
+
+    def test_deleted_row_between_pages_skips_nothing(self, server, client):
+        pages = client.employees.get_list_employees().iter_pages()
+        first = next(pages)
+        # Deleting a seen row shifts offset pages, but not the id cursor
+        del server.state.tables["employees"][first[10]["id"]]
+        del server.state.tables["employees"][150]
+
+        ids = [record["id"] for record in first]
+        ids += [record["id"] for page in pages for record in page]
+        assert ids == [_id for _id in range(1, 251) if _id != 150]
+
+    def test_seek_to_middle_id(self, server, client):
+        pagination = client.employees.get_list_employees().seek(137)
+
+        assert pagination.results == []
+        results = list(pagination.iter_results())
+        assert [record["id"] for record in results] == list(range(138, 251))
+        assert list_queries(server)[1]["id__gt"] == ["137"]
+
+    def test_seek_requires_keyset_pagination(self, client):
+        client.employees.pagination = "offset"
+        with pytest.raises(ValueError):
+            client.employees.get_list_employees().seek(137)
@@ -0,0 +1,125 @@
+import threading
+from datetime import date
+
+from mindsight_people_control_api.helpers.movements import (
+    CurrentAssignments,
+    Movement,
+    MovementFilter,
+)
+
+
+class StubEmployees:
+    codes = {("areas", "SALES"): 7}
+
+    def _reference_id(self, entity, _id=None, code=None):
+        return _id if _id is not None else self.codes[(entity, code)]
+
+
+class StubClient:
+    employees = StubEmployees()
+
+
+class StubAssignments(CurrentAssignments):
+    def __init__(self, current: dict) -> None:
+        super().__init__(client=StubClient())
+        self._current = current
+
+    def load(self, kind):
+        raise AssertionError("Loaded records are stubbed")
+
+
+def movement_filter(current: dict, **kwargs) -> MovementFilter:
+    return MovementFilter(StubClient(), current=StubAssignments(current), **kwargs)
+
+
+class TestMovementFilterPlan:
+    def test_drops_movement_to_current_target_and_start_date(self):
+        movements = movement_filter({"area": {10: (5, "2024-05-01")}})
+
+        planned = movements.plan([Movement(10, "area", 5, date(2024, 5, 1))])
+
+        assert planned == [] and movements.unchanged == 1
+
+    def test_drops_movement_to_current_target_with_another_start_date(self):
+        movements = movement_filter({"area": {10: (5, "2024-05-01")}})
+
+        planned = movements.plan([Movement(10, "area", 5, date(2024, 6, 1))])
+
+        assert planned == [] and movements.unchanged == 1
+
+    def test_keeps_movement_changing_target(self):
+        movements = movement_filter({"area": {11: (5, "2024-05-01")}})
+        batch = [
+            Movement(11, "area", 6, date(2024, 5, 1)),
+            Movement(12, "area", 5, date(2024, 5, 1)),  # Without current area
+        ]
+
+        assert movements.plan(batch) == batch and movements.unchanged == 0
+
+    def test_keeps_movement_changing_start_date_when_compared(self):
+        movements = movement_filter(
+            {"area": {10: (5, "2024-05-01"), 11: (5, "2024-05-01")}},
+            compare_start_date=True,
+        )
+        batch = [
+            Movement(10, "area", 5, date(2024, 6, 1)),
+            Movement(11, "area", 5, date(2024, 5, 1)),  # Unchanged
+        ]
+
+        assert movements.plan(batch) == batch[:1] and movements.unchanged == 1
+
+    def test_merges_movements_of_employee_and_kind_into_the_latest(self):
+        movements = movement_filter({"area": {}, "position": {}})
+
+        planned = movements.plan(
+            [
+                Movement(10, "area", 1, date(2024, 5, 1)),
+                Movement(10, "area", 2, date(2024, 6, 1)),
+                Movement(10, "area", 3, date(2024, 4, 1)),  # Earlier, dropped
+                Movement(10, "position", 4, date(2024, 4, 1)),
+            ]
+        )
+
+        assert planned == [
+            Movement(10, "area", 2, date(2024, 6, 1)),
+            Movement(10, "position", 4, date(2024, 4, 1)),
+        ]
+        assert movements.merged == 2
+
+    def test_resolves_target_code(self):
+        movements = movement_filter({"area": {10: (7, "2024-05-01")}})
+
+        planned = movements.plan(
+            [
+                Movement(10, "area", start_date=date(2024, 5, 1), target_code="SALES"),
+                Movement(11, "area", start_date=date(2024, 5, 1), target_code="SALES"),
+            ]
+        )
+
+        assert planned == [Movement(11, "area", 7, date(2024, 5, 1))]
+
+
+class TestCurrentAssignments:
+    def test_loads_without_holding_the_cache_lock(self):
+        requested, release = threading.Event(), threading.Event()
+
+        class SlowAssignments(CurrentAssignments):
+            def load(self, kind):
+                with self._kind_lock(kind):
+                    requested.set()
+                    release.wait(5)  # Records being requested
+                    with self._lock:
+                        self._current[kind] = {10: (5, "2024-05-01")}
+
+        assignments = SlowAssignments(client=StubClient())
+        assignments._current["position"] = {10: (3, "2024-01-01")}
+        loading = threading.Thread(target=assignments.get, args=("area", 10))
+        loading.start()
+        assert requested.wait(5)
+
+        # Loaded kinds and writes don't wait for the load of another kind
+        assert assignments.get("position", 10) == 3
+        assignments.set("position", 10, 4, date(2024, 6, 1))
+        release.set()
+        loading.join(5)
+        assert assignments.get("area", 10) == 5
@@ -0,0 +1,127 @@
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.checkpoints import MemoryCheckpointStore
+from mindsight_people_control_api.helpers.page_size import PageSizeTuner
+
+
+class TestPageSizeTuner:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_size": 0},
+            {"min_size": 500, "max_size": 100},
+            {"target_latency": 0},
+            {"smoothing": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            PageSizeTuner(**kwargs)
+
+    def test_initial_size_is_bounded(self):
+        assert PageSizeTuner(initial=10, min_size=50, max_size=500).page_size == 50
+        assert PageSizeTuner(initial=900, min_size=50, max_size=500).page_size == 500
+
+    def test_fast_pages_grow_by_max_step_up_to_max_size(self):
+        tuner = PageSizeTuner(initial=100, target_latency=1, min_size=10, max_size=500)
+        sizes = []
+        for _ in range(4):
+            tuner.observe(elapsed=0.001, records=tuner.page_size)
+            sizes.append(tuner.page_size)
+
+        assert sizes == [200, 400, 500, 500]
+
+    def test_slow_pages_shrink_by_max_step_down_to_min_size(self):
+        tuner = PageSizeTuner(
+            initial=400, target_latency=1, min_size=60, max_size=500, smoothing=1
+        )
+        sizes = []
+        for _ in range(4):
+            tuner.observe(elapsed=100, records=tuner.page_size)
+            sizes.append(tuner.page_size)
+
+        assert sizes == [200, 100, 60, 60]
+
+    def test_converges_to_target_latency(self):
+        tuner = PageSizeTuner(initial=100, target_latency=2, min_size=10, max_size=500)
+        tuner.observe(elapsed=1, records=100)  # 0.01 seconds per record
+
+        assert tuner.page_size == 200
+
+    def test_max_page_bytes(self):
+        tuner = PageSizeTuner(
+            initial=20,
+            target_latency=10,
+            min_size=10,
+            max_size=500,
+            max_page_bytes=15000,
+        )
+        tuner.observe(elapsed=0.02, records=20, n_bytes=20000)
+
+        assert tuner.page_size == 15
+
+    def test_empty_pages_are_ignored(self):
+        tuner = PageSizeTuner(initial=100, min_size=10, max_size=500)
+        tuner.observe(elapsed=5, records=0)
+
+        assert tuner.page_size == 100
+        assert tuner.seconds_per_record is None
+
+    def test_failed_pages_shrink_down_to_min_size(self):
+        tuner = PageSizeTuner(initial=400, min_size=60, max_size=500)
+        sizes = []
+        for _ in range(4):
+            tuner.observe_failure()
+            sizes.append(tuner.page_size)
+
+        assert sizes == [200, 100, 60, 60]
+
+
+class TestAutoPageSize:
+    def test_failed_page_shrinks_next_pages(self):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.pagination = "keyset"
+                tuner = client.employees.auto_page_size(
+                    initial=100, target_latency=60, min_size=10, max_size=100
+                )
+                pages = client.employees.get_list_employees().iter_pages(retries=0)
+                next(pages)
+
+                server.state.error_rate = 1.0
+                with pytest.raises(Exception):
+                    next(pages)
+
+                assert tuner.page_size == 50
+
+    @pytest.mark.parametrize("pagination", ["offset", "keyset"])
+    def test_resume_checkpoint_with_tuned_page_size(self, pagination):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.pagination = pagination
+                client.employees.page_size = 40
+                store = MemoryCheckpointStore()
+                pages = client.employees.get_list_employees().iter_pages(
+                    checkpoint_store=store
+                )
+                seen = [record["id"] for _ in range(3) for record in next(pages)]
+                pages.close()
+
+                # Fast pages grow the page size of the resumed run
+                tuner = client.employees.auto_page_size(
+                    initial=40, target_latency=60, min_size=10, max_size=200
+                )
+                resumed = client.employees.get_list_employees().iter_pages(
+                    checkpoint_store=store
+                )
+                ids = [record["id"] for page in resumed for record in page]
+
+                # Resumed after the last saved page, the third wasn't processed
+                assert seen == list(range(1, 121))
+                assert ids == list(range(81, 251))
+                if pagination == "keyset":
+                    assert tuner.page_size > 40
@@ -0,0 +1,59 @@
+import itertools
+import threading
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.utils.aux_functions import prefetch_iterator
+
+
+class TestPrefetchIterator:
+    def test_keeps_order(self):
+        assert list(prefetch_iterator(iter(range(100)), depth=3)) == list(range(100))
+
+    def test_producer_error_reaches_consumer(self):
+        def produce():
+            yield 1
+            yield 2
+            raise RuntimeError("page failed")
+
+        items = prefetch_iterator(produce(), depth=2)
+        assert next(items) == 1
+        assert next(items) == 2
+        with pytest.raises(RuntimeError, match="page failed"):
+            next(items)
+
+    def test_thread_exits_when_consumer_stops(self):
+        threads, closed = [], threading.Event()
+
+        def produce():
+            threads.append(threading.current_thread())
+            try:
+                for item in itertools.count():
+                    yield item
+            finally:
+                closed.set()
+
+        items = prefetch_iterator(produce(), depth=2)
+        assert next(items) == 0
+        items.close()
+
+        threads[0].join(timeout=5)
+        assert not threads[0].is_alive()
+        # The stopped generator is closed in the producer thread
+        assert closed.is_set()
+        assert threads[0] is not threading.current_thread()
+
+    def test_prefetched_pages(self):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(token="token", base_url=server.base_url) as client:
+                client.employees.page_size = 50
+                pagination = client.employees.get_list_employees()
+                pages = list(pagination.iter_pages(prefetch=2))
+
+        assert [len(page) for page in pages] == [50] * 5
+        assert [record["id"] for page in pages for record in page] == list(
+            range(1, 251)
+        )
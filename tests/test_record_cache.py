@@ -0,0 +1,43 @@
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.record_cache import RecordCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRecordCache:
+    def test_drop_least_recently_used_and_expired(self):
+        clock = FakeClock()
+        cache = RecordCache(max_size=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)  # Drops b, the least recently used
+        assert "b" not in cache
+        assert len(cache) == 2
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert len(cache) == 1
+
+    def test_writes_evict_retrieved_records(self):
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=5, areas=5, corporations=3)
+            with Client(token="token", base_url=server.base_url) as client:
+                corporations = client.corporations
+                before = list(corporations.retrieve_many([1, 2], use_cache=True))
+                corporations.patch_update_corporation(1, name="Renamed", code="CORP1")
+                server.state.requests.clear()
+
+                after = list(corporations.retrieve_many([1, 2], use_cache=True))
+                assert after[0].result["name"] == "Renamed"
+                assert after[1].result == before[1].result
+                assert [path for _, path in server.state.requests] == [
+                    "/api/v1/corporations/1/?ordering=id"
+                ]
@@ -0,0 +1,96 @@
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.references import (
+    ReferenceCache,
+    ReferenceNotFoundException,
+)
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=0, areas=3, positions=0, corporations=0)
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with Client(token="token", base_url=server.base_url) as client:
+        yield client
+
+
+class TestReferenceCache:
+    def test_refresh_loads_rows_modified_in_the_watermark_second(self, server, client):
+        cache = ReferenceCache(client)
+        cache.load("areas")
+        last = server.state.tables["areas"][3]
+        server.state.tables["areas"][99] = {
+            "id": 99,
+            "code": "LATE",
+            "modified": last["modified"],  # Same second of the watermark
+        }
+
+        assert cache.refresh("areas") == 1  # Loaded rows of the second skipped
+        assert cache.resolve("areas", "late") == 99
+
+    def test_refresh_sends_watermark_with_offset_in_utc(self, server, client):
+        for _id, row in server.state.tables["areas"].items():
+            row["modified"] = f"2023-12-31T21:00:0{_id}-03:00"
+        cache = ReferenceCache(client)
+        cache.load("areas")
+
+        cache.refresh("areas")
+
+        (query,) = [
+            parse_qs(urlparse(url).query)
+            for _, url in server.state.requests
+            if "modified__gt" in url
+        ]
+        assert query["modified__gt"] == ["2024-01-01T00:00:02Z"]
+
+    def test_renamed_code_resolves_only_the_new_code(self, server, client):
+        cache = ReferenceCache(client)
+        assert cache.resolve("areas", "AREA1") == 1
+        server.state.update("areas", 1, {"code": "AREA1-NEW"})
+
+        assert cache.resolve("areas", "AREA1-NEW") == 1
+        with pytest.raises(ReferenceNotFoundException):
+            cache.resolve("areas", "AREA1")
+
+    def test_deleted_record_code_is_dropped_on_refresh(self, server, client):
+        cache = ReferenceCache(client)
+        assert cache.resolve("areas", "AREA2") == 2
+        del server.state.tables["areas"][2]
+
+        cache.refresh("areas")
+        with pytest.raises(ReferenceNotFoundException):
+            cache.resolve("areas", "AREA2")
+        assert cache.resolve("areas", "AREA3") == 3
+
+    def test_records_are_requested_without_holding_the_lock(self, client):
+        cache = ReferenceCache(client)
+        get_list_areas = client.areas.get_list_areas
+        held = []
+
+        def try_lock():
+            acquired = cache._lock.acquire(blocking=False)
+            if acquired:
+                cache._lock.release()
+            held.append(not acquired)
+
+        def get_list(**filters):
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+            return get_list_areas(**filters)
+
+        client.areas.get_list_areas = get_list
+        cache.load("areas")
+        cache.refresh("areas")
+
+        assert held and not any(held)
@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from mindsight_people_control_api.helpers.exceptions import PeopleControlExceptions
+from mindsight_people_control_api.helpers.scheduler import WriteScheduler
+
+
+class TestWriteScheduler:
+    def test_keep_order_by_key_and_run_keys_in_parallel(self):
+        calls, running, peak = [], [0], [0]
+        lock = threading.Lock()
+
+        def write(key, step):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+                calls.append((key, step))
+            return step
+
+        with WriteScheduler(max_workers=4) as scheduler:
+            futures = [
+                scheduler.submit(key, write, key, step)
+                for step in range(5)
+                for key in range(8)
+            ]
+
+        assert [future.result() for future in futures] == [
+            step for step in range(5) for _ in range(8)
+        ]
+        for key in range(8):
+            assert [step for _key, step in calls if _key == key] == list(range(5))
+        assert peak[0] == 4
+
+    def test_fail_pending_writes_of_failed_key(self):
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ValueError("Invalid")
+
+        with WriteScheduler(max_workers=2) as scheduler:
+            failed = scheduler.submit(1, fail)
+            queued = scheduler.submit(1, lambda: "skipped")
+            other = scheduler.submit(2, lambda: "done")
+            release.set()
+
+            with pytest.raises(ValueError):
+                failed.result(timeout=5)
+            later = scheduler.submit(1, lambda: "skipped")  # After the queue drained
+
+        with pytest.raises(PeopleControlExceptions):
+            queued.result()
+        with pytest.raises(PeopleControlExceptions):
+            later.result()
+        assert other.result() == "done"
+        assert scheduler.failed() == {1}
+
+    def test_reset_runs_writes_of_failed_key_again(self):
+        def fail():
+            raise ValueError("Invalid")
+
+        with WriteScheduler(max_workers=1) as scheduler:
+            with pytest.raises(ValueError):
+                scheduler.submit(1, fail).result(timeout=5)
+            scheduler.reset(1)
+            after_reset = scheduler.submit(1, lambda: "done")
+
+        assert after_reset.result() == "done" and scheduler.failed() == set()
+
+    def test_interrupted_write_gives_the_turn_to_the_next_one(self):
+        class Interrupted(BaseException):
+            pass
+
+        def interrupt():
+            raise Interrupted()
+
+        scheduler = WriteScheduler(max_workers=1, stop_on_error=False)
+        interrupted = scheduler.submit(1, interrupt)
+        after = scheduler.submit(1, lambda: "done")
+        scheduler.shutdown(wait=True)
+
+        with pytest.raises(Interrupted):
+            interrupted.result()
+        assert after.result() == "done" and scheduler.pending() == 0
+
+    def test_shutdown_without_wait_cancels_pending_writes(self):
+        started, release = threading.Event(), threading.Event()
+
+        def write():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        scheduler = WriteScheduler(max_workers=1)
+        running = scheduler.submit(1, write)
+        pending = [scheduler.submit(1, lambda: "pending") for _ in range(3)]
+        started.wait(5)
+        scheduler.shutdown(wait=False)
+        release.set()
+
+        assert running.result(timeout=5) == "done"
+        assert all(future.cancelled() for future in pending)
+        deadline = time.monotonic() + 5
+        while scheduler.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert scheduler.pending() == 0
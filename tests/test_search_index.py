@@ -0,0 +1,48 @@
+from mindsight_people_control_api.helpers.search_index import SearchIndex, tokenize
+
+RECORDS = [
+    {"id": 1, "first_name": "João", "last_name": "Silva", "email": "joao@x.com"},
+    {"id": 2, "first_name": "Joana", "last_name": "Silvana", "email": "jo@x.com"},
+    {"id": 3, "first_name": "JOÃO", "last_name": "Souza", "employee_code": "E003"},
+    {"id": 4, "first_name": "Maria", "last_name": "Silva", "email": None},
+]
+
+
+def ids(records) -> list:
+    return [record["id"] for record in records]
+
+
+class TestSearchIndex:
+    def test_tokenize_removes_accents_and_case(self):
+        assert tokenize("João da SILVA-E003") == ["joao", "da", "silva", "e", "003"]
+
+    def test_search_terms_as_prefixes_ignoring_accents_and_case(self):
+        index = SearchIndex(RECORDS)
+
+        assert ids(index.search("joao sil")) == [1]
+        assert ids(index.search("JOA")) == [1, 2, 3]
+        assert ids(index.search("sil jo")) == [1, 2]
+        assert index.search("pedro") == [] and index.search("  ") == []
+
+    def test_records_matching_whole_tokens_come_first(self):
+        index = SearchIndex(RECORDS)
+
+        assert ids(index.search("silva")) == [1, 4, 2]
+        assert ids(index.search("silva", limit=2)) == [1, 4]
+        assert ids(index.search("joa", limit=None)) == [1, 2, 3]
+
+    def test_lookup_field_value(self):
+        index = SearchIndex(RECORDS)
+
+        assert ids(index.lookup("email", "JOAO@X.COM")) == [1]
+        assert ids(index.lookup("employee_code", "e003")) == [3]
+        assert index.lookup("email", "none") == []
+
+    def test_replace_and_remove_records(self):
+        index = SearchIndex(RECORDS)
+        index.add({"id": 2, "first_name": "Pedro", "last_name": "Lima"})
+        index.remove(4)
+
+        assert ids(index.search("pe li")) == [2]
+        assert ids(index.search("sil")) == [1]
+        assert 4 not in index and len(index) == 3
@@ -0,0 +1,73 @@
+import pytest
+
+from mindsight_people_control_api.helpers.snapshot_diff import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    RecordChange,
+    diff_snapshots,
+    fingerprint,
+    read_snapshot,
+    summarize,
+    write_snapshot,
+)
+
+BEFORE = [
+    {"id": 1, "name": "A", "modified": "2024-01-01T00:00:00Z"},
+    {"id": 2, "name": "B", "modified": "2024-01-01T00:00:00Z"},
+    {"id": 4, "name": "D", "modified": "2024-01-01T00:00:00Z"},
+    {"id": 5, "name": "E", "modified": "2024-01-01T00:00:00Z"},
+]
+AFTER = [
+    {"id": 1, "name": "A", "modified": "2024-02-01T00:00:00Z"},  # Only modified
+    {"id": 3, "name": "C", "modified": "2024-02-01T00:00:00Z"},
+    {"id": 4, "name": "New D", "code": "D4", "modified": "2024-02-01T00:00:00Z"},
+    {"id": 6, "name": "F", "modified": "2024-02-01T00:00:00Z"},
+]
+
+
+class TestDiffSnapshots:
+    def test_merge_yields_added_removed_and_changed_in_key_order(self):
+        changes = list(diff_snapshots(iter(BEFORE), iter(AFTER)))
+
+        assert changes == [
+            RecordChange(REMOVED, 2, before=BEFORE[1]),
+            RecordChange(ADDED, 3, after=AFTER[1]),
+            RecordChange(
+                CHANGED,
+                4,
+                before=BEFORE[2],
+                after=AFTER[2],
+                fields={"name": ("D", "New D"), "code": (None, "D4")},
+            ),
+            RecordChange(REMOVED, 5, before=BEFORE[3]),
+            RecordChange(ADDED, 6, after=AFTER[3]),
+        ]
+        assert summarize(changes) == {
+            ADDED: 2,
+            REMOVED: 2,
+            CHANGED: 1,
+            "fields": {"name": 1, "code": 1},
+        }
+
+    def test_empty_sides(self):
+        assert [change.kind for change in diff_snapshots([], AFTER)] == [ADDED] * 4
+        assert [change.kind for change in diff_snapshots(BEFORE, [])] == [REMOVED] * 4
+        assert list(diff_snapshots(BEFORE, BEFORE)) == []
+
+    def test_unsorted_snapshot_raises(self):
+        with pytest.raises(ValueError):
+            list(diff_snapshots(BEFORE, [AFTER[1], AFTER[0]]))
+
+    def test_fingerprint_ignores_modified_and_key_order(self):
+        assert fingerprint(BEFORE[0]) == fingerprint(
+            {"modified": None, "name": "A", "id": 1}
+        )
+        assert fingerprint(BEFORE[0]) != fingerprint(BEFORE[1])
+
+    @pytest.mark.parametrize("name", ["snapshot.jsonl", "snapshot.jsonl.gz"])
+    def test_write_and_read_snapshot(self, tmp_path, name):
+        path = str(tmp_path / name)
+
+        assert write_snapshot(AFTER, path) == 4
+        assert list(read_snapshot(path)) == AFTER
@@ -0,0 +1,136 @@
+from datetime import date
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.movements import Movement, MovementFilter
+from mindsight_people_control_api.helpers.tracing import NoopTracer, Span
+from mindsight_people_control_api.helpers.upsert import upsert_corporations
+
+
+class RecordedSpan(Span):
+    def __init__(self, name: str, parent: Span, ended: list) -> None:
+        self.name = name
+        self.parent = parent
+        self.ended = ended
+
+    def end(self):
+        self.ended.append(self)
+
+    def root(self) -> "RecordedSpan":
+        return self.parent.root() if self.parent else self
+
+
+class RecordingTracer(NoopTracer):
+    enabled = True
+
+    def __init__(self) -> None:
+        self.spans = []
+        self.ended = []
+
+    def start_span(self, name, attributes=None, parent=None):
+        span = RecordedSpan(name, parent, self.ended)
+        self.spans.append(span)
+        return span
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=20, areas=5, positions=2, corporations=2)
+        yield server
+
+
+@pytest.fixture
+def tracer():
+    return RecordingTracer()
+
+
+@pytest.fixture
+def client(server, tracer):
+    with Client(token="token", base_url=server.base_url, tracer=tracer) as client:
+        yield client
+
+
+def requests_of(tracer: RecordingTracer) -> list:
+    return [span for span in tracer.spans if span.name.split()[0].isupper()]
+
+
+class TestTracing:
+    def test_pagination_requests_share_the_list_span(self):
+        tracer = RecordingTracer()
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=250, areas=5)
+            with Client(
+                token="token", base_url=server.base_url, tracer=tracer
+            ) as client:
+                client.employees.page_size = 100
+                client.employees.get_list_employees().get_all()
+
+        root, first_page, operation, *pages = tracer.spans
+        assert root.name == "/employees list" and root.parent is None
+        assert first_page.name == "GET /employees"
+        assert first_page.parent is root
+        assert operation.name == "/employees get_all"
+        assert operation.parent is root
+        assert len(pages) == 2
+        assert all(page.parent is operation for page in pages)
+
+    def test_list_span_ends_after_the_iteration(self, client, tracer):
+        client.employees.page_size = 5
+        client.employees.get_list_employees().get_all()
+
+        root, operation = tracer.spans[0], tracer.spans[2]
+        assert tracer.ended.index(operation) < tracer.ended.index(root)
+
+    def test_list_span_ends_after_a_stopped_iteration(self, client, tracer):
+        client.employees.page_size = 5
+        pagination = client.employees.get_list_employees()
+        for _ in pagination.iter_results():
+            break
+
+        assert tracer.spans[0] not in tracer.ended
+        pagination.end_span()  # Also called when collected
+        assert tracer.ended[-1] is tracer.spans[0]
+
+    def test_retrieve_many_requests_are_children_of_its_span(self, client, tracer):
+        results = list(client.employees.retrieve_many([1, 2, 3], max_workers=2))
+
+        assert all(result.error is None for result in results)
+        (operation,) = [span for span in tracer.spans if span.parent is None]
+        assert operation.name == "/employees retrieve_many"
+        assert len(requests_of(tracer)) == 3
+        assert all(span.parent is operation for span in requests_of(tracer))
+
+    def test_bulk_writes_are_children_of_their_operation_span(self, client, tracer):
+        client.areas.post_create_areas(
+            [
+                {"code": "NEW", "name": "New", "start_date": date(2024, 1, 1)},
+                {
+                    "code": "CHILD",
+                    "name": "Child",
+                    "start_date": date(2024, 1, 1),
+                    "parent_area_code": "NEW",
+                },
+            ]
+        )
+        upsert_corporations(
+            client,
+            corporations=[{"code": "CORP9", "name": "Nine"}],
+            branch_corporations=[
+                {"code": "BRANCH9", "name": "Nine", "corporation_code": "CORP9"}
+            ],
+        )
+        MovementFilter(client).apply(
+            [Movement(1, "area", 2, date(2024, 5, 1))], max_workers=2
+        )
+
+        roots = [span.name for span in tracer.spans if span.parent is None]
+        assert roots == [
+            "/areas post_create_areas",
+            "upsert_corporations",
+            "movements apply",
+        ]
+        assert len(requests_of(tracer)) > 6
+        assert all(span.root().name in roots for span in requests_of(tracer))
@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.transport import (
+    Cassette,
+    CassetteMissException,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+
+class TestRecordReplay:
+    def test_replay_recorded_requests_without_server(self, tmp_path):
+        path = str(tmp_path / "cassette.jsonl.gz")
+        cassette = Cassette(path)
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=120, areas=10)
+            base_url = server.base_url
+            with Client(
+                token="token", base_url=base_url, transport=RecordingTransport(cassette)
+            ) as client:
+                client.employees.page_size = 50
+                recorded = client.employees.get_list_employees().get_all().results
+                area = client.areas.post_create_area(
+                    code="NEW", name="New", start_date=date(2024, 1, 1)
+                )
+        cassette.save()
+
+        replay = ReplayTransport(Cassette(path))
+        with Client(token="other", base_url=base_url, transport=replay) as client:
+            client.employees.page_size = 50
+            assert client.employees.get_list_employees().get_all().results == recorded
+            assert (
+                client.areas.post_create_area(
+                    code="NEW", name="New", start_date=date(2024, 1, 1)
+                )
+                == area
+            )
+            with pytest.raises(CassetteMissException):
+                client.areas.get_retrieve_area(1)
+
+    def test_replay_streamed_pages(self, tmp_path):
+        cassette = Cassette(str(tmp_path / "cassette.jsonl"))
+        with FakePeopleControlServer() as server:
+            server.state.populate(employees=120, areas=10)
+            base_url = server.base_url
+            with Client(
+                token="token", base_url=base_url, transport=RecordingTransport(cassette)
+            ) as client:
+                client.employees.page_size = 50
+                recorded = list(
+                    client.employees.get_list_employees().iter_results(stream=True)
+                )
+
+        with Client(
+            token="token", base_url=base_url, transport=ReplayTransport(cassette)
+        ) as client:
+            client.employees.page_size = 50
+            pagination = client.employees.get_list_employees()
+            assert list(pagination.iter_results(stream=True)) == recorded
+        assert len(recorded) == 120
@@ -0,0 +1,149 @@
+import pytest
+
+from benchmarks.fake_server import FakePeopleControlServer
+from mindsight_people_control_api import Client
+from mindsight_people_control_api.helpers.upsert import (
+    UpsertResult,
+    plan_upsert,
+    upsert_corporations,
+)
+
+EXISTING = [
+    {"id": 1, "code": "C1", "name": "One"},
+    {"id": 2, "code": "C2", "name": "Two"},
+    {"id": 3, "code": "C3", "name": "Three"},
+]
+
+
+class TestPlanUpsert:
+    def test_inserts_updates_and_unchanged(self):
+        plan = plan_upsert(
+            EXISTING,
+            [
+                {"code": "C1", "name": "One"},
+                {"code": "C2", "name": "Second"},
+                {"code": "C4", "name": "Four"},
+            ],
+            fields=("name",),
+        )
+
+        assert plan.inserts == [{"code": "C4", "name": "Four"}]
+        assert plan.updates == [(EXISTING[1], {"code": "C2", "name": "Second"})]
+        assert plan.deletes == []
+        assert plan.unchanged == 1
+
+    def test_delete_missing(self):
+        desired = [{"code": "C1", "name": "One"}]
+        assert plan_upsert(EXISTING, desired, ("name",)).deletes == []
+
+        plan = plan_upsert(EXISTING, desired, ("name",), delete_missing=True)
+        assert plan.deletes == EXISTING[1:]
+
+    def test_missing_desired_fields_are_kept(self):
+        plan = plan_upsert(
+            [{"id": 1, "code": "C1", "name": "One", "active": True}],
+            [{"code": "C1", "active": True}],
+            fields=("name", "active"),
+        )
+
+        assert plan.updates == [] and plan.unchanged == 1
+
+    def test_repeated_code_raises(self):
+        with pytest.raises(ValueError):
+            plan_upsert(
+                EXISTING,
+                [{"code": "C1", "name": "One"}, {"code": "C1", "name": "Other"}],
+                fields=("name",),
+            )
+
+
+class TestUpsertResult:
+    def test_skipped_default_isnt_shared(self):
+        first, second = UpsertResult([], [], [], 0), UpsertResult([], [], [], 0)
+
+        assert first.skipped == () and second.skipped == ()
+        with pytest.raises(AttributeError):
+            first.skipped.append("C1")
+
+
+@pytest.fixture
+def server():
+    with FakePeopleControlServer() as server:
+        server.state.populate(employees=0, areas=0, positions=0, corporations=2)
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with Client(token="token", base_url=server.base_url) as client:
+        yield client
+
+
+def writes(server) -> list:
+    return [
+        (method, path.split("/")[3])
+        for method, path in server.state.requests
+        if method != "GET"
+    ]
+
+
+class TestUpsertCorporations:
+    def test_corporations_are_written_before_and_deleted_after_branches(
+        self, server, client
+    ):
+        results = upsert_corporations(
+            client,
+            corporations=[{"code": "CORP9", "name": "Nine"}],
+            branch_corporations=[
+                {"code": "BRANCH9", "name": "Nine", "corporation_code": "CORP9"}
+            ],
+            delete_missing=True,
+        )
+
+        assert writes(server) == [
+            ("POST", "corporations"),
+            ("POST", "branch_corporations"),
+            ("DELETE", "branch_corporations"),
+            ("DELETE", "branch_corporations"),
+            ("DELETE", "corporations"),
+            ("DELETE", "corporations"),
+        ]
+        assert len(results["corporations"].deleted) == 2
+        codes = {row["code"] for row in server.state.tables["corporations"].values()}
+        assert codes == {"CORP9"}
+
+    def test_branch_without_corporation_is_skipped(self, server, client):
+        results = upsert_corporations(
+            client,
+            corporations=[],
+            branch_corporations=[{"code": "BRANCH9", "name": "Nine"}],
+        )
+
+        (skipped,) = results["branch_corporations"].skipped
+        assert skipped.key == "BRANCH9" and isinstance(skipped.error, ValueError)
+        assert writes(server) == []
+
+    def test_referenced_corporations_are_not_deleted(self, server, client):
+        results = upsert_corporations(client, corporations=[], delete_missing=True)
+
+        skipped = results["corporations"].skipped
+        assert [item.key for item in skipped] == ["CORP1", "CORP2"]
+        assert results["corporations"].deleted == []
+        assert writes(server) == []
+
+    def test_corporation_of_a_skipped_branch_is_not_deleted(self, server, client):
+        results = upsert_corporations(
+            client,
+            corporations=[{"code": "CORP2", "name": "Corporation 2"}],
+            branch_corporations=[
+                {"code": "BRANCH1", "name": "Branch 1", "corporation_code": "NONE"},
+                {"code": "BRANCH2", "name": "Branch 2", "corporation_code": "CORP2"},
+            ],
+            delete_missing=True,
+        )
+
+        assert [item.key for item in results["branch_corporations"].skipped] == [
+            "BRANCH1"
+        ]
+        assert [item.key for item in results["corporations"].skipped] == ["CORP1"]
+        assert writes(server) == []